@@ -20,8 +20,13 @@ Performance + Quick Import fixes:
 - Fast Excel import via pandas (no heavy COM roundtrips)
 - Quick Import fallback: if DB has no rows for a saved source, import from its file path
 """
-import os, sys, re, hashlib, tempfile, subprocess, pathlib, glob, json, base64
+import os, sys, re, hashlib, tempfile, subprocess, pathlib, glob, json, base64, copy
+from types import MappingProxyType
 import csv
+import sqlite3, threading, struct, itertools, bisect
+from array import array
+from contextlib import closing, contextmanager
+from collections.abc import Mapping, MutableMapping
 import pathlib
 import stat 
 # move this import to the top of your file, BEFORE _first_run_seed() is called
@@ -34,13 +39,13 @@ warnings.filterwarnings("ignore", category=UserWarning, module=r"openpyxl(\.|$)"
 
 
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, Callable
+from typing import Dict, List, Optional, Tuple, Callable, Iterator
 from PySide6 import QtWidgets, QtGui, QtCore
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QFrame, QLabel, QLineEdit, QPushButton, QCheckBox,
     QTextEdit, QVBoxLayout, QHBoxLayout, QGridLayout, QDialog, QInputDialog, QMessageBox,
     QTableWidget, QTableWidgetItem, QMenu, QAbstractItemView, QHeaderView, QListWidget,
-    QListWidgetItem, QSizePolicy, QToolButton, QScrollArea,  QFileDialog, 
+    QListWidgetItem, QSizePolicy, QToolButton, QScrollArea,  QFileDialog, QProgressBar,
 )
 from PySide6.QtCore import Qt, QEvent, QTimer, QRect, QPoint, QPropertyAnimation, QEasingCurve, QSize
 from PySide6.QtGui import (
@@ -182,15 +187,89 @@ def _safe_widget(owner, name: str):
     w = getattr(owner, name, None)
     return w if alive(w) else None    
 
+_RETIRING_THREADS: set = set()
+
 def _stop_thread(t):
+    """Ask a worker to stop without blocking the UI; it stays referenced until it has finished."""
     try:
         if t and t.isRunning():
             t.requestInterruption()
             t.quit()
-            t.wait(2000)
+            _RETIRING_THREADS.add(t)
+            t.finished.connect(lambda: _RETIRING_THREADS.discard(t))
+            if t.isFinished():
+                _RETIRING_THREADS.discard(t)
     except Exception:
         pass
 
+# ---------- Worker progress / cancellation ----------
+# Long jobs call work_progress(fraction) at chunk boundaries. Inside a ProgressWorker that is
+# reported (throttled) through the worker's `fraction` signal, and it is also the cancel point:
+# once the thread's interruption was requested it raises Cancelled. On other threads (UI,
+# pool processes) nothing listens and nothing is ever cancelled.
+class Cancelled(BaseException):
+    """Worker stopped on request (BaseException, so `except Exception` guards let it through)."""
+
+_WORK = threading.local()
+
+def check_cancelled() -> None:
+    th = QThread.currentThread()
+    if th is not None and th.isInterruptionRequested():
+        raise Cancelled()
+
+def work_progress(fraction: float) -> None:
+    """Report progress (0..1) of the current job; raises Cancelled if it was asked to stop."""
+    report = getattr(_WORK, "report", None)
+    if report is not None:
+        report(fraction)
+    check_cancelled()
+
+@contextmanager
+def no_work_progress():
+    """Inner reads (e.g. probing a file) that must not move the current job's progress bar."""
+    report = getattr(_WORK, "report", None)
+    _WORK.report = None
+    try:
+        yield
+    finally:
+        _WORK.report = report
+
+class ProgressWorker(QThread):
+    """
+    QThread base for cancellable jobs: subclasses implement work(). `fraction` carries progress
+    (0..1, at most ~1% steps / 4 per second); `cancelled` fires instead of the result signals
+    when cancel() / requestInterruption() stopped the job at a chunk boundary.
+    """
+    fraction = Signal(float)
+    cancelled = Signal()
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._last_report = (-1.0, 0.0)
+
+    def cancel(self):
+        self.requestInterruption()
+
+    def report(self, fraction: float) -> None:
+        f = min(1.0, max(0.0, float(fraction)))
+        last, t_last = self._last_report
+        now = time.monotonic()
+        if f - last >= 0.01 or (f != last and (f >= 1.0 or now - t_last >= 0.25)):
+            self._last_report = (f, now)
+            self.fraction.emit(f)
+
+    def work(self):
+        raise NotImplementedError
+
+    def run(self):
+        _WORK.report = self.report
+        try:
+            self.work()
+        except Cancelled:
+            self.cancelled.emit()
+        finally:
+            _WORK.report = None
+
 
 def resource_path(rel: str) -> Path:
     base = Path(getattr(sys, "_MEIPASS", Path(__file__).parent))
@@ -205,9 +284,22 @@ def _db_dir()->pathlib.Path:
     return p
 
 def _db_path()->str: return str(_db_dir() / "labels_db.csv")
+def _db_sqlite_path()->str: return str(_db_dir() / "labels_db.sqlite3")
+def _db_journal_path()->str: return str(_db_dir() / "labels_db.journal.csv")
+def _db_manifest_path()->str: return str(_db_shards_dir() / "manifest.json")
+
+def _db_shards_dir()->pathlib.Path:
+    # no mkdir here: the SQLite backend only checks for the manifest (see _make_shards_dir)
+    return _db_dir() / "labels_db_shards"
+
+def _make_shards_dir() -> None:
+    _db_shards_dir().mkdir(parents=True, exist_ok=True)
+
 def _settings_path()->str: return str(_db_dir() / "app_settings.json")
 def _headers_cfg_path()->str: return str(_db_dir() / "headers_config.json")
 def _excel_sources_path()->str: return str(_db_dir() / "excel_sources.json")
+def _mapping_memo_path()->str: return str(_db_dir() / "mapping_memo.json")
+def _workbook_catalog_path()->str: return str(_db_dir() / "workbook_catalog.json")
 
 TEMPLATES_DIR = str(_db_dir() / "templates")
 os.makedirs(TEMPLATES_DIR, exist_ok=True)
@@ -241,6 +333,10 @@ def _pd():
     import importlib
     return importlib.import_module("pandas")
 
+def _np():
+    import importlib
+    return importlib.import_module("numpy")
+
 def _ensure_reportlab():
     global pdfgen_canvas, A4, mm, black, Color, pdfmetrics
     if "pdfgen_canvas" in globals():
@@ -578,6 +674,9 @@ def _list_template_files():
 
 
 # --- Recent Downloads helpers (Excel) ---
+RECENT_EXCEL_EXTS = {".xlsx", ".xls", ".xlsb", ".xlsm", ".csv", ".tsv"}
+_FOLDER_WATCHER = None   # FolderWatcher once start_folder_watcher() ran (see "Folder watcher")
+
 def _candidate_recent_roots() -> List[Path]:
     """Common save locations: Downloads, Desktop, Documents, OneDrive (personal/business)."""
     dirs: List[Path] = []
@@ -620,38 +719,25 @@ def _candidate_recent_roots() -> List[Path]:
 
 def _recent_excels_anywhere(limit: int = 5, *, max_depth: int = 3, per_root_cap: int = 300) -> List[Path]:
     """
-    Return most-recent Excel files across common roots.
+    Return most-recent Excel files across common roots (see "File discovery").
     Depth-limited for speed; per-root cap to avoid huge walks; de-duped by resolved path.
+    Answered from the folder watcher's index instead when it is running.
     """
-    exts = {".xlsx", ".xls", ".xlsb", ".xlsm"}
+    watcher = _FOLDER_WATCHER
+    if watcher is not None and watcher.ready:
+        return watcher.recent(limit)
     ranked: List[Tuple[float, Path]] = []
 
     for root in _candidate_recent_roots():
-        taken = 0
-        for dirpath, dirnames, filenames in os.walk(root):
-            # depth-limit
+        for f in discover_files(root, RECENT_EXCEL_EXTS, max_depth, per_root_cap):
             try:
-                rel = Path(dirpath).resolve().relative_to(root.resolve())
-                depth = len(rel.parts)
-            except Exception:
-                depth = 0
-            if depth >= max_depth:
-                dirnames[:] = []
-            for fn in filenames:
-                if taken >= per_root_cap:
-                    break
-                if os.path.splitext(fn)[1].lower() in exts:
-                    p = Path(dirpath) / fn
-                    try:
-                        st = p.stat()
-                        if stat.S_ISREG(st.st_mode):
-                            ranked.append((st.st_mtime, p))
-                            taken += 1
-                    except Exception:
-                        continue
-            if taken >= per_root_cap:
-                break
+                ranked.append((os.stat(f).st_mtime, Path(f)))
+            except OSError:
+                continue
+    return _rank_recent(ranked, limit)
 
+def _rank_recent(ranked: List[Tuple[float, Path]], limit: int) -> List[Path]:
+    """Newest first (name breaks ties), de-duped by resolved path."""
     ranked.sort(key=lambda t: (t[0], t[1].name.lower()), reverse=True)
 
     out: List[Path] = []
@@ -1158,7 +1244,16 @@ def row_in_range(target, start_val, end_val) -> bool:
     return False
 
 
-def load_headers_cfg() -> dict:
+# headers_config.json is parsed once per change and shared as a read-only snapshot.
+# The file stamp is re-checked at most every HEADERS_CFG_RECHECK_SECS (external edits);
+# save_headers_cfg (and add_synonym/delete_header/... through it) drops the cache at once.
+HEADERS_CFG_RECHECK_SECS = 1.0
+HEADERS_CFG_STATS = {"disk_reads": 0, "cache_hits": 0}
+_HEADERS_CFG_CACHE = {"stamp": None, "checked": 0.0, "cfg": None, "snap": None, "headers": None, "ver": None}
+_HEADERS_CFG_LOCK = threading.RLock()
+
+def _read_headers_cfg_file() -> dict:
+    HEADERS_CFG_STATS["disk_reads"] += 1
     p = _headers_cfg_path()
     if not os.path.exists(p):
         _write_json(p, DEFAULT_HEADERS_CFG.copy()); return DEFAULT_HEADERS_CFG.copy()
@@ -1168,7 +1263,62 @@ def load_headers_cfg() -> dict:
         v.setdefault("visible", True); v.setdefault("searchable", True); v.setdefault("synonyms", [])
     return out
 
-def save_headers_cfg(cfg: dict) -> None: _write_json(_headers_cfg_path(), cfg)
+def _headers_cfg_cached() -> dict:
+    """Current parsed config (shared; never mutate). Re-reads the file only when it changed."""
+    c = _HEADERS_CFG_CACHE
+    now = time.monotonic()
+    with _HEADERS_CFG_LOCK:
+        if c["cfg"] is not None and now - c["checked"] < HEADERS_CFG_RECHECK_SECS:
+            HEADERS_CFG_STATS["cache_hits"] += 1
+            return c["cfg"]
+        p = _headers_cfg_path()
+        stamp = _file_stamp(p)
+        if c["cfg"] is not None and stamp is not None and stamp == c["stamp"]:
+            c["checked"] = now
+            HEADERS_CFG_STATS["cache_hits"] += 1
+            return c["cfg"]
+        cfg = _read_headers_cfg_file()
+        c.update(stamp=_file_stamp(p), checked=now, cfg=cfg, snap=None, headers=None, ver=None)
+        return cfg
+
+def headers_cfg_snapshot() -> Mapping:
+    """Read-only view of the config: {header: {visible, searchable, synonyms(tuple)}}."""
+    cfg = _headers_cfg_cached()
+    with _HEADERS_CFG_LOCK:
+        snap = _HEADERS_CFG_CACHE["snap"]
+        if snap is None or _HEADERS_CFG_CACHE["cfg"] is not cfg:
+            snap = MappingProxyType({
+                k: MappingProxyType({**v, "synonyms": tuple(v.get("synonyms") or ())})
+                for k, v in cfg.items()
+            })
+            if _HEADERS_CFG_CACHE["cfg"] is cfg:
+                _HEADERS_CFG_CACHE["snap"] = snap
+        return snap
+
+def headers_cfg_version() -> str:
+    """Short content hash of the config; changes whenever automapping could."""
+    cfg = _headers_cfg_cached()
+    with _HEADERS_CFG_LOCK:
+        if _HEADERS_CFG_CACHE["cfg"] is cfg and _HEADERS_CFG_CACHE["ver"]:
+            return _HEADERS_CFG_CACHE["ver"]
+    raw = json.dumps(cfg, sort_keys=True, ensure_ascii=False, default=str)
+    ver = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    with _HEADERS_CFG_LOCK:
+        if _HEADERS_CFG_CACHE["cfg"] is cfg:
+            _HEADERS_CFG_CACHE["ver"] = ver
+    return ver
+
+def invalidate_headers_cfg() -> None:
+    with _HEADERS_CFG_LOCK:
+        _HEADERS_CFG_CACHE.update(stamp=None, checked=0.0, cfg=None, snap=None, headers=None, ver=None)
+
+def load_headers_cfg() -> dict:
+    """Editable copy of the config (change it, then save_headers_cfg). Readers: headers_cfg_snapshot()."""
+    return copy.deepcopy(_headers_cfg_cached())
+
+def save_headers_cfg(cfg: dict) -> None:
+    _write_json(_headers_cfg_path(), cfg)
+    invalidate_headers_cfg()
 
 # === [CHUNK 3 — A] Master-guarded edits for headers/synonyms/templates ===
 # Paste this block AFTER: def save_headers_cfg(cfg: dict) -> None
@@ -1313,12 +1463,19 @@ def delete_template_file(template_name: str, master_password: str | None = None)
 
 
 def all_headers() -> List[str]:
-    cfg = load_headers_cfg()
+    cfg = _headers_cfg_cached()
+    with _HEADERS_CFG_LOCK:
+        cached = _HEADERS_CFG_CACHE["headers"]
+        if cached is not None and _HEADERS_CFG_CACHE["cfg"] is cfg:
+            return list(cached)
     seen = set(); out = []
     for k in CORE_HEADERS:
         if k not in seen: out.append(k); seen.add(k)
     for k in cfg.keys():
         if k not in seen: out.append(k); seen.add(k)
+    with _HEADERS_CFG_LOCK:
+        if _HEADERS_CFG_CACHE["cfg"] is cfg:
+            _HEADERS_CFG_CACHE["headers"] = tuple(out)
     return out
 
 # ---------- UI constants / caches ----------
@@ -1396,14 +1553,741 @@ def _clamp_to_screen(x: int, y: int, w: int, h: int) -> tuple[int, int]:
     clamped_y = max(ag.top(),  min(y, max_y))
     return clamped_x, clamped_y
 
-# ---------- helpers ----------
-def load_db_rows()->List[Dict[str,str]]:
-    p = _db_path()
+# ---------- compact row records ----------
+# Imported/DB rows are LabelRecords: each row is one object holding its values in slots of a
+# class generated per key schema (shared by every row with the same columns), instead of a
+# 17+ key dict each. LabelRecord is a MutableMapping, so rec.get / rec[k] / items() / dict(rec)
+# / {**rec} keep working.
+_UNSET = object()   # schema slot not set on this row (the key is "missing")
+_RECORD_SCHEMAS: dict = {}
+
+class _RecordSchema:
+    __slots__ = ("keys", "slot", "cls")
+
+    def __init__(self, keys: tuple):
+        self.keys = keys
+        self.slot = {k: f"v{i}" for i, k in enumerate(keys)}   # key -> slot name on `cls`
+        self.cls = _record_class(self)
+
+def record_schema(keys) -> _RecordSchema:
+    """Shared schema for a key sequence (one instance per distinct key tuple)."""
+    keys = tuple(dict.fromkeys(keys))
+    sch = _RECORD_SCHEMAS.get(keys)
+    if sch is None:
+        sch = _RECORD_SCHEMAS[keys] = _RecordSchema(keys)
+    return sch
+
+def _record_from_state(keys: tuple, vals: list, extra: Optional[dict], unset=()) -> "LabelRecord":
+    for i in unset:   # _UNSET itself doesn't survive pickling
+        vals[i] = _UNSET
+    rec = LabelRecord(record_schema(keys), vals)
+    rec._extra = extra
+    return rec
+
+class LabelRecord(MutableMapping):
+    """
+    Dict-like row; keys outside the schema go to a small extras dict. LabelRecord(schema, vals)
+    returns an instance of schema.cls, the subclass whose slots hold the values.
+    """
+    __slots__ = ("_extra",)
+    _schema: _RecordSchema   # class attribute of each per-schema subclass
+
+    def __new__(cls, schema: _RecordSchema, vals: Optional[list] = None):
+        return object.__new__(schema.cls)
+
+    def _values(self) -> list:   # generated per schema
+        raise NotImplementedError
+
+    @classmethod
+    def from_mapping(cls, m, keys=None, default=_UNSET) -> "LabelRecord":
+        """Copy `m` into a record whose schema is `keys` (default: m's own keys)."""
+        sch = record_schema(m.keys() if keys is None else keys)
+        rec = cls(sch, [default] * len(sch.keys))
+        for k, v in m.items():
+            rec[k] = v
+        return rec
+
+    def __getitem__(self, k):
+        s = self._schema.slot.get(k)
+        if s is not None:
+            v = getattr(self, s)
+            if v is not _UNSET:
+                return v
+        elif self._extra is not None and k in self._extra:
+            return self._extra[k]
+        raise KeyError(k)
+
+    def get(self, k, default=None):
+        s = self._schema.slot.get(k)
+        if s is not None:
+            v = getattr(self, s)
+            return default if v is _UNSET else v
+        if self._extra is not None:
+            return self._extra.get(k, default)
+        return default
+
+    def __setitem__(self, k, v):
+        s = self._schema.slot.get(k)
+        if s is not None:
+            setattr(self, s, v)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[k] = v
+
+    def __delitem__(self, k):
+        s = self._schema.slot.get(k)
+        if s is not None and getattr(self, s) is not _UNSET:
+            setattr(self, s, _UNSET)
+        elif s is None and self._extra is not None and k in self._extra:
+            del self._extra[k]
+        else:
+            raise KeyError(k)
+
+    def __contains__(self, k):
+        s = self._schema.slot.get(k)
+        if s is not None:
+            return getattr(self, s) is not _UNSET
+        return self._extra is not None and k in self._extra
+
+    def __iter__(self):
+        for k, v in zip(self._schema.keys, self._values()):
+            if v is not _UNSET:
+                yield k
+        if self._extra:
+            yield from list(self._extra)
+
+    def __len__(self):
+        vals = self._values()
+        n = len(vals) - vals.count(_UNSET)
+        return n + (len(self._extra) if self._extra else 0)
+
+    def copy(self) -> "LabelRecord":
+        rec = LabelRecord(self._schema, self._values())
+        rec._extra = dict(self._extra) if self._extra else None
+        return rec
+
+    def __reduce__(self):
+        vals = self._values()
+        unset = [i for i, v in enumerate(vals) if v is _UNSET]
+        for i in unset:
+            vals[i] = None
+        return (_record_from_state, (self._schema.keys, vals, self._extra, unset))
+
+    def __repr__(self):
+        return f"LabelRecord({dict(self)!r})"
+
+def _record_class(sch: _RecordSchema) -> type:
+    """
+    The LabelRecord subclass for one schema: one slot per key, so a row is a single object with
+    no per-row value list. __init__ and _values are generated (as collections.namedtuple does),
+    which keeps building rows as fast as filling a list.
+    """
+    slots = tuple(sch.slot.values())
+    fields = "".join(f"self.{s}, " for s in slots)
+    src = ("def __init__(self, schema, vals=None):\n"
+           "    self._extra = None\n"
+           + (f"    {fields}= _FILL if vals is None else vals\n" if slots else "")
+           + "def _values(self):\n"
+           f"    return [{fields}]\n")
+    ns = {"_FILL": (_UNSET,) * len(slots)}
+    exec(src, ns)
+    return type("LabelRecord", (LabelRecord,), {
+        "__slots__": slots, "__module__": __name__, "_schema": sch,
+        "__init__": ns["__init__"], "_values": ns["_values"],
+    })
+
+def as_records(rows: List[Dict[str, str]]) -> List[LabelRecord]:
+    """Repack row dicts as LabelRecords (rows with the same key order share one schema)."""
+    out: List[LabelRecord] = []
+    sch = None
+    for r in rows:
+        if isinstance(r, LabelRecord):
+            out.append(r)
+            continue
+        keys = tuple(r)
+        if sch is None or keys != sch.keys:
+            sch = record_schema(keys)
+        out.append(LabelRecord(sch, list(r.values())))
+    return out
+
+# ---------- label DB storage ----------
+# "sqlite": indexed store in labels_db.sqlite3 (per-row upserts, no full rewrite).
+# "csv":    labels_db_shards/, one CSV shard per (SOURCE_FILE, SOURCE_SHEET) plus an
+#           append-only journal each; manifest.json lists the live shards, so pruning
+#           an old source deletes its files instead of rewriting the DB.
+DB_BACKEND = "sqlite"
+DB_JOURNAL_COMPACT_BYTES = 2 * 1024 * 1024  # fold a shard journal into its base file past this size
+
+_DB_LOCK = threading.RLock()
+_SQLITE_READY = False
+_CSV_KEYS_CACHE: dict = {}   # shard base path -> (stamp, [_db_key per base row])
+_CSV_COMPACTING: set = set()  # shard ids with a compaction in flight
+_MANUAL_SHARD = "manual"      # rows with empty SOURCE_FILE
+DB_NORM_VERSION = 1           # bump when _normalize_row_for_db changes its output
+_NORM_COL = "_NORM"           # hidden stored column: "<version><mode>:<content hash>"
+_JOURNAL_OP = "_OP"           # journal-only column: "" = upsert, "D" = row moved to another shard
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS labels (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    db_key       TEXT NOT NULL,
+    sig          TEXT NOT NULL,
+    source_file  TEXT NOT NULL DEFAULT '',
+    source_sheet TEXT NOT NULL DEFAULT '',
+    data         TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS labels_db_key ON labels(db_key);
+CREATE INDEX IF NOT EXISTS labels_sig ON labels(sig);
+CREATE INDEX IF NOT EXISTS labels_source ON labels(source_file, source_sheet);
+CREATE TABLE IF NOT EXISTS meta (k TEXT PRIMARY KEY, v TEXT NOT NULL);
+"""
+
+_SQLITE_UPSERT = """
+INSERT INTO labels (db_key, sig, source_file, source_sheet, data) VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(db_key) DO UPDATE SET
+    sig = excluded.sig,
+    source_file = excluded.source_file,
+    source_sheet = excluded.source_sheet,
+    data = excluded.data
+"""
+
+def _stored_cols(cols: List[str]) -> List[str]:
+    """Header Manager columns + the hidden normalization marker (not exported)."""
+    return list(cols) + [_NORM_COL]
+
+def _key_text(t: tuple) -> str:
+    """Flatten a _db_key/_row_signature tuple into an indexable TEXT value."""
+    return "\x1f".join("" if v is None else str(v) for v in (t or ()))
+
+def _sqlite_connect() -> sqlite3.Connection:
+    """Open the label DB. The first call creates the schema and migrates labels_db.csv once."""
+    global _SQLITE_READY
+    con = sqlite3.connect(_db_sqlite_path(), timeout=30)
+    if not _SQLITE_READY:
+        with _DB_LOCK:
+            if not _SQLITE_READY:
+                con.executescript(_SQLITE_SCHEMA)
+                _sqlite_migrate_csv(con)
+                _SQLITE_READY = True
+    return con
+
+def _sqlite_put_rows(con: sqlite3.Connection, rows: List[Dict[str, str]], cols: List[str]) -> None:
+    """Upsert already-normalized rows on the canonical key (caller owns the transaction)."""
+    con.executemany(_SQLITE_UPSERT, (
+        (
+            _key_text(_db_key(r)),
+            _key_text(_row_signature(r)),
+            (r.get("SOURCE_FILE") or "").strip(),
+            (r.get("SOURCE_SHEET") or "").strip(),
+            json.dumps({k: (r.get(k, "") or "") for k in _stored_cols(cols)}, ensure_ascii=False),
+        )
+        for r in rows
+    ))
+
+def _sqlite_migrate_csv(con: sqlite3.Connection) -> None:
+    """One-time copy of the CSV store into SQLite (the CSV files are left untouched)."""
+    if con.execute("SELECT 1 FROM meta WHERE k = 'csv_migrated'").fetchone():
+        return
+    rows = _csv_load_rows() if os.path.exists(_db_manifest_path()) else _read_csv_rows(_db_path())
+    with con:
+        _sqlite_put_rows(con, rows, all_headers())
+        con.execute("INSERT OR REPLACE INTO meta (k, v) VALUES ('csv_migrated', ?)",
+                    (datetime.now().isoformat(timespec="seconds"),))
+
+def _file_stamp(p: str):
+    try:
+        st = os.stat(p)
+        return (st.st_mtime_ns, st.st_size)
+    except Exception:
+        return None
+
+def _db_stamp():
+    """Cheap change marker of the active store (in-memory caches rebuild when it changes)."""
+    if DB_BACKEND == "sqlite":
+        return _file_stamp(_db_sqlite_path())
+    # every CSV write rewrites the manifest (compaction doesn't change content)
+    return _file_stamp(_db_manifest_path())
+
+def _read_csv_rows(p: str) -> List[Dict[str, str]]:
     if not os.path.exists(p):
         return []
     with open(p, "r", encoding="utf-8", newline="") as f:
         return [{k:(v or "") for k,v in row.items()} for row in csv.DictReader(f)]
 
+def _write_csv_rows(p: str, rows: List[Dict[str, str]], cols: List[str]) -> None:
+    """Write via a temp file + os.replace so readers never see a half-written DB."""
+    tmp = p + ".tmp"
+    with open(tmp, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=cols)
+        w.writeheader()
+        for r in rows:
+            w.writerow({k: (r.get(k, "") or "") for k in cols})
+    os.replace(tmp, p)
+
+def _remove_quiet(p: str) -> None:
+    try:
+        os.remove(p)
+    except FileNotFoundError:
+        pass
+
+# --- CSV shards: one <id>.csv (+ <id>.journal.csv) per (SOURCE_FILE, SOURCE_SHEET) ---
+def _shard_id(source_file: str, source_sheet: str) -> str:
+    sf = (source_file or "").strip()
+    if not sf:
+        return _MANUAL_SHARD
+    raw = f"{sf}\x1f{(source_sheet or '').strip()}".encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()[:16]
+
+def _row_shard(r: Dict[str, str]) -> str:
+    return _shard_id(r.get("SOURCE_FILE", ""), r.get("SOURCE_SHEET", ""))
+
+def _shard_files(sid: str) -> Tuple[str, str]:
+    d = _db_shards_dir()
+    return str(d / f"{sid}.csv"), str(d / f"{sid}.journal.csv")
+
+def _drop_shard(sid: str) -> None:
+    for p in _shard_files(sid):
+        _remove_quiet(p)
+        _CSV_KEYS_CACHE.pop(p, None)
+
+def _save_shard_manifest(shards: List[dict]) -> None:
+    """Persist the live shard list, oldest last_used first (= load order, newest wins)."""
+    shards.sort(key=lambda e: e.get("last_used", ""))
+    _make_shards_dir()
+    _write_json(_db_manifest_path(), {"version": 1, "shards": shards})
+
+def _load_shard_manifest() -> List[dict]:
+    """Live shards from manifest.json; the first call splits labels_db.csv into shards."""
+    data = _read_json(_db_manifest_path())
+    if isinstance(data, dict):
+        return [e for e in (data.get("shards") or []) if isinstance(e, dict) and e.get("id")]
+    return _migrate_csv_to_shards()
+
+def _migrate_csv_to_shards() -> List[dict]:
+    """One-time split of labels_db.csv (+ its old single-file journal) into per-source shards."""
+    rows = _read_csv_rows(_db_path())
+    idx = {}
+    for i, r in enumerate(rows):
+        idx[_db_key(r)] = i
+    for r in _read_csv_rows(_db_journal_path()):
+        k = _db_key(r)
+        if k in idx:
+            rows[idx[k]] = r
+        else:
+            idx[k] = len(rows)
+            rows.append(r)
+
+    last_used: Dict[str, str] = {}
+    for s in load_excel_sources():
+        last_used.setdefault((s.get("name") or "").strip(), s.get("last_used", ""))
+
+    groups: Dict[str, List[Dict[str, str]]] = {}
+    for r in rows:
+        groups.setdefault(_row_shard(r), []).append(r)
+    cols = _stored_cols(all_headers())
+    shards = []
+    _make_shards_dir()
+    for sid, rs in groups.items():
+        _write_csv_rows(_shard_files(sid)[0], rs, cols)
+        sf = (rs[0].get("SOURCE_FILE") or "").strip()
+        shards.append({"id": sid, "source_file": sf,
+                       "source_sheet": (rs[0].get("SOURCE_SHEET") or "").strip(),
+                       "last_used": last_used.get(sf, "")})
+    _save_shard_manifest(shards)
+    # labels_db.csv stays as a read-only copy for older installs
+    _remove_quiet(_db_journal_path())
+    return shards
+
+def _shard_rows_keyed(sid: str) -> Tuple[List[Dict[str, str]], List[tuple]]:
+    """
+    Replay one shard: a journal row replaces the row with the same _db_key in place
+    (later wins), unknown keys are appended, "D" rows are tombstones. Returns (rows, keys).
+    """
+    base_p, jp = _shard_files(sid)
+    stamp = _file_stamp(base_p)
+    rows = _read_csv_rows(base_p)
+    cached = _CSV_KEYS_CACHE.get(base_p)
+    if cached and cached[0] == stamp and len(cached[1]) == len(rows):
+        keys = list(cached[1])
+    else:
+        keys = [_db_key(r) for r in rows]
+        _CSV_KEYS_CACHE[base_p] = (stamp, list(keys))
+    journal = _read_csv_rows(jp)
+    if not journal:
+        return rows, keys
+
+    idx = {k: i for i, k in enumerate(keys)}
+    for r in journal:
+        op = r.pop(_JOURNAL_OP, "")
+        k = _db_key(r)
+        i = idx.get(k)
+        if op == "D":
+            if i is not None:
+                rows[i] = None
+                del idx[k]
+        elif i is None:
+            idx[k] = len(rows)
+            rows.append(r)
+            keys.append(k)
+        else:
+            rows[i] = r
+    live = [i for i, r in enumerate(rows) if r is not None]
+    return [rows[i] for i in live], [keys[i] for i in live]
+
+def _csv_load_rows_keyed() -> Tuple[List[Dict[str, str]], List[tuple], List[str]]:
+    """Concatenate the live shards (oldest first). Returns (rows, keys, shard id per row)."""
+    rows: List[Dict[str, str]] = []
+    keys: List[tuple] = []
+    sids: List[str] = []
+    idx: Dict[tuple, int] = {}
+    with _DB_LOCK:
+        for e in _load_shard_manifest():
+            rs, ks = _shard_rows_keyed(e["id"])
+            for r, k in zip(rs, ks):
+                i = idx.get(k)
+                if i is None:
+                    idx[k] = len(rows)
+                    rows.append(r)
+                    keys.append(k)
+                    sids.append(e["id"])
+                else:
+                    # moves leave a tombstone, so this only happens on hand-edited shards
+                    rows[i], sids[i] = r, e["id"]
+    return rows, keys, sids
+
+def _csv_load_rows() -> List[Dict[str, str]]:
+    return _csv_load_rows_keyed()[0]
+
+def _csv_compact_shard(sid: str) -> None:
+    """Fold a shard's journal into its base file and drop the journal."""
+    with _DB_LOCK:
+        base_p, jp = _shard_files(sid)
+        if not os.path.exists(jp):
+            return
+        rows, _ = _shard_rows_keyed(sid)
+        _write_csv_rows(base_p, rows, _stored_cols(all_headers()))
+        os.remove(jp)
+
+def _schedule_journal_compaction(sid: str) -> None:
+    """Run _csv_compact_shard on a daemon thread (at most one per shard at a time)."""
+    with _DB_LOCK:
+        if sid in _CSV_COMPACTING:
+            return
+        _CSV_COMPACTING.add(sid)
+
+    def _run():
+        try:
+            _csv_compact_shard(sid)
+        except Exception:
+            pass
+        finally:
+            _CSV_COMPACTING.discard(sid)
+
+    threading.Thread(target=_run, daemon=True).start()
+
+def _csv_journal_append(sid: str, rows: List[Dict[str, str]], cols: List[str], op: str = "") -> None:
+    """Append rows to a shard journal: an O(delta) write instead of an O(DB) rewrite."""
+    jcols = _stored_cols(cols) + [_JOURNAL_OP]
+    with _DB_LOCK:
+        _, jp = _shard_files(sid)
+        _make_shards_dir()
+        header = None
+        if os.path.exists(jp):
+            with open(jp, "r", encoding="utf-8", newline="") as f:
+                header = next(csv.reader(f), None)
+            if header != jcols:
+                # Header Manager changed the columns: fold the old journal first
+                _csv_compact_shard(sid)
+                header = None
+        with open(jp, "a", encoding="utf-8", newline="") as f:
+            w = csv.DictWriter(f, fieldnames=jcols)
+            if header is None:
+                w.writeheader()
+            for r in rows:
+                out = {k: (r.get(k, "") or "") for k in jcols}
+                out[_JOURNAL_OP] = op
+                w.writerow(out)
+        big = os.path.getsize(jp) >= DB_JOURNAL_COMPACT_BYTES
+    if big:
+        _schedule_journal_compaction(sid)
+
+def _csv_touch_shards(written: Dict[str, List[Dict[str, str]]]) -> None:
+    """Register new shards and bump last_used of the ones just written."""
+    now = datetime.now().isoformat(timespec="seconds")
+    with _DB_LOCK:
+        shards = _load_shard_manifest()
+        by_id = {e["id"]: e for e in shards}
+        for sid, rs in written.items():
+            e = by_id.get(sid)
+            if e is None:
+                e = {"id": sid, "source_file": (rs[0].get("SOURCE_FILE") or "").strip(),
+                     "source_sheet": (rs[0].get("SOURCE_SHEET") or "").strip()}
+                shards.append(e)
+                by_id[sid] = e
+            e["last_used"] = now
+        _save_shard_manifest(shards)
+
+def _csv_prune_shards(keep: set) -> int:
+    """Drop shards whose SOURCE_FILE is not in `keep` (manual shard always stays). Returns shards dropped."""
+    with _DB_LOCK:
+        shards = _load_shard_manifest()
+        live = [e for e in shards if e["id"] == _MANUAL_SHARD or e.get("source_file") in keep]
+        if len(live) == len(shards):
+            return 0
+        for e in shards:
+            if e not in live:
+                _drop_shard(e["id"])
+        _save_shard_manifest(live)
+        return len(shards) - len(live)
+
+def _store_replace_all(rows: List[Dict[str, str]], cols: List[str]) -> None:
+    """Replace the whole DB content with `rows` (already normalized, written as-is)."""
+    if DB_BACKEND != "sqlite":
+        with _DB_LOCK:
+            old = {e["id"]: e for e in _load_shard_manifest()}
+            groups: Dict[str, List[Dict[str, str]]] = {}
+            for r in rows:
+                groups.setdefault(_row_shard(r), []).append(r)
+            now = datetime.now().isoformat(timespec="seconds")
+            shards = []
+            _make_shards_dir()
+            for sid, rs in groups.items():
+                base_p, jp = _shard_files(sid)
+                _write_csv_rows(base_p, rs, _stored_cols(cols))
+                _remove_quiet(jp)
+                shards.append(old.pop(sid, None) or {
+                    "id": sid, "source_file": (rs[0].get("SOURCE_FILE") or "").strip(),
+                    "source_sheet": (rs[0].get("SOURCE_SHEET") or "").strip(), "last_used": now})
+            for sid in old:
+                _drop_shard(sid)
+            _save_shard_manifest(shards)
+        _schedule_db_snapshot()
+        return
+    with _DB_LOCK, closing(_sqlite_connect()) as con:
+        with con:
+            con.execute("DELETE FROM labels")
+            _sqlite_put_rows(con, rows, cols)
+    _schedule_db_snapshot()
+
+def export_db_csv(path: Optional[str] = None) -> int:
+    """Write the DB as a single CSV (default: labels_db.csv) for Excel/older installs. Returns row count."""
+    rows = load_db_rows()
+    _write_csv_rows(path or _db_path(), rows, all_headers())
+    return len(rows)
+
+# ---------- helpers ----------
+def load_db_rows()->List[Dict[str,str]]:
+    if DB_BACKEND != "sqlite":
+        return as_records(_csv_load_rows())
+    with closing(_sqlite_connect()) as con:
+        return as_records([json.loads(d) for (d,) in con.execute("SELECT data FROM labels ORDER BY id")])
+
+# ---------- search snapshot (columnar, for instant search warm-up) ----------
+# labels_db.snapshot = magic + JSON header + packed blocks. Each block is one column:
+# a uint32 array of char offsets followed by the UTF-8 text of all values joined.
+# It holds the search index in cache order (newest first): lowercased BARCODE/BRAND/ITEM,
+# lowercased searchable fields, BRAND/ITEM token lists and the raw row columns.
+# Written on a background thread after every DB write (once per batch inside
+# db_snapshot_deferred); valid only for the _db_stamp it was built from.
+# labels_db.csv / export_db_csv stay the interchange format.
+DB_SNAPSHOT = True
+_SNAPSHOT_MAGIC = b"PLDBSNAP"
+_SNAPSHOT_VERSION = 1
+_SNAPSHOT_STATE = {"busy": False, "again": False, "hold": 0, "held": False}
+
+def _db_snapshot_path()->str: return str(_db_dir() / "labels_db.snapshot")
+
+def _searchable_db_fields() -> List[str]:
+    """Header Manager fields marked searchable (falls back to CORE + defaults)."""
+    try:
+        cfg = headers_cfg_snapshot()
+        return [k for k, v in (cfg or {}).items() if isinstance(v, Mapping) and v.get("searchable", True)]
+    except Exception:
+        return ["BARCODE", "BRAND", "ITEM", "SECTION", "REG", "PROMO", "START_DATE", "END_DATE", "COOP",
+                "PLU", "ARABIC_DESCRIPTION", "ENGLISH_DESCRIPTION", "REGULAR_PRICE", "PROMO_PRICE"]
+
+def _build_search_index(rows: List[Dict[str, str]], searchable: List[str]) -> List[dict]:
+    """Search cache entries, latest rows first (same order as reversed(load_db_rows()))."""
+    cache = []
+    searchable = set(searchable)
+    for r in reversed(rows):
+        bc = (r.get("BARCODE", "") or "").strip().lower()
+        br = (r.get("BRAND", "") or "").strip().lower()
+        it = (r.get("ITEM", "") or "").strip().lower()
+
+        fields_lower = {}
+        for h in searchable:
+            v = r.get(h, "")
+            if v is None:
+                continue
+            s = str(v).strip().lower()
+            if s:
+                fields_lower[h] = s
+
+        # token sets for BRAND/ITEM matching bucket
+        tokens_brand = set(re.findall(r"[A-Za-z0-9]+", br))
+        tokens_item  = set(re.findall(r"[A-Za-z0-9]+", it))
+
+        cache.append({
+            "row": r,
+            "bc": bc,
+            "br": br,
+            "it": it,
+            "fields": fields_lower,
+            "tok_brand": tokens_brand,
+            "tok_item": tokens_item,
+        })
+    return cache
+
+def _stamp_json(stamp):
+    return json.loads(json.dumps(stamp))
+
+def _pack_block(values: List[str]) -> Tuple[bytes, bytes]:
+    offs = array("I", [0])
+    n = 0
+    for v in values:
+        n += len(v)
+        offs.append(n)
+    return offs.tobytes(), "".join(values).encode("utf-8")
+
+def _unpack_block(offs_b: bytes, data_b: bytes) -> List[str]:
+    offs = array("I")
+    offs.frombytes(offs_b)
+    s = data_b.decode("utf-8")
+    return [s[offs[i]:offs[i + 1]] for i in range(len(offs) - 1)]
+
+def write_db_snapshot(stamp, cache: List[dict], searchable: List[str]) -> None:
+    """Serialize a search cache built from the DB at `stamp`."""
+    cols: List[str] = []
+    for e in cache:
+        for k in e["row"]:
+            if k not in cols:
+                cols.append(k)
+    searchable = sorted(set(searchable))
+    blocks = [("bc", [e["bc"] for e in cache]),
+              ("br", [e["br"] for e in cache]),
+              ("it", [e["it"] for e in cache]),
+              ("tb", [" ".join(sorted(e["tok_brand"])) for e in cache]),
+              ("ti", [" ".join(sorted(e["tok_item"])) for e in cache])]
+    blocks += [("f:" + h, [e["fields"].get(h, "") for e in cache]) for h in searchable]
+    blocks += [("c:" + c, [str(e["row"].get(c, "") or "") for e in cache]) for c in cols]
+
+    packed = [(name,) + _pack_block(vals) for name, vals in blocks]
+    header = json.dumps({
+        "stamp": _stamp_json(stamp), "n": len(cache), "searchable": searchable, "cols": cols,
+        "blocks": [[name, len(o), len(d)] for name, o, d in packed],
+    }).encode("utf-8")
+    p = _db_snapshot_path()
+    tmp = p + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_SNAPSHOT_MAGIC + struct.pack("<II", _SNAPSHOT_VERSION, len(header)))
+        f.write(header)
+        for _name, o, d in packed:
+            f.write(o)
+            f.write(d)
+    os.replace(tmp, p)
+
+def load_db_snapshot(stamp, searchable: List[str]) -> Optional[List[dict]]:
+    """Search cache from labels_db.snapshot, or None if missing/stale/other version."""
+    try:
+        with open(_db_snapshot_path(), "rb") as f:
+            buf = f.read()
+    except Exception:
+        return None
+    try:
+        m = len(_SNAPSHOT_MAGIC)
+        if buf[:m] != _SNAPSHOT_MAGIC:
+            return None
+        version, hlen = struct.unpack_from("<II", buf, m)
+        if version != _SNAPSHOT_VERSION:
+            return None
+        pos = m + 8
+        header = json.loads(buf[pos:pos + hlen].decode("utf-8"))
+        if header.get("stamp") != _stamp_json(stamp) or header.get("searchable") != sorted(set(searchable)):
+            return None
+        pos += hlen
+        cols_data: Dict[str, List[str]] = {}
+        for name, olen, dlen in header["blocks"]:
+            cols_data[name] = _unpack_block(buf[pos:pos + olen], buf[pos + olen:pos + olen + dlen])
+            pos += olen + dlen
+    except Exception:
+        return None
+
+    n = int(header.get("n", 0))
+    cols = header.get("cols") or []
+    raw = [cols_data["c:" + c] for c in cols]
+    fld = [(h, cols_data["f:" + h]) for h in header["searchable"]]
+    bc, br, it = cols_data["bc"], cols_data["br"], cols_data["it"]
+    tb, ti = cols_data["tb"], cols_data["ti"]
+    sch = record_schema(cols)
+    cache = []
+    for i in range(n):
+        cache.append({
+            "row": LabelRecord(sch, [vals[i] for vals in raw]),
+            "bc": bc[i],
+            "br": br[i],
+            "it": it[i],
+            "fields": {h: vals[i] for h, vals in fld if vals[i]},
+            "tok_brand": set(tb[i].split()),
+            "tok_item": set(ti[i].split()),
+        })
+    return cache
+
+def _write_db_snapshot_now() -> None:
+    searchable = _searchable_db_fields()
+    with _DB_LOCK:
+        stamp = _db_stamp()
+        rows = load_db_rows()
+    write_db_snapshot(stamp, _build_search_index(rows, searchable), searchable)
+
+def _schedule_db_snapshot() -> None:
+    """Rebuild the snapshot on a daemon thread; writes during a rebuild coalesce into one more run."""
+    if not DB_SNAPSHOT:
+        return
+    with _DB_LOCK:
+        if _SNAPSHOT_STATE["hold"]:
+            _SNAPSHOT_STATE["held"] = True
+            return
+        if _SNAPSHOT_STATE["busy"]:
+            _SNAPSHOT_STATE["again"] = True
+            return
+        _SNAPSHOT_STATE["busy"] = True
+
+    def _run():
+        while True:
+            try:
+                _write_db_snapshot_now()
+            except Exception:
+                pass
+            with _DB_LOCK:
+                if not _SNAPSHOT_STATE["again"]:
+                    _SNAPSHOT_STATE["busy"] = False
+                    return
+                _SNAPSHOT_STATE["again"] = False
+
+    threading.Thread(target=_run, daemon=True).start()
+
+@contextmanager
+def db_snapshot_deferred():
+    """
+    Many writes in a row (a chunked import): no snapshot rebuild per write, one after the last.
+    Holds for every writer meanwhile, so each rebuild (a full load_db_rows) isn't repeated per chunk.
+    """
+    with _DB_LOCK:
+        _SNAPSHOT_STATE["hold"] += 1
+    try:
+        yield
+    finally:
+        with _DB_LOCK:
+            _SNAPSHOT_STATE["hold"] -= 1
+            run = not _SNAPSHOT_STATE["hold"] and _SNAPSHOT_STATE["held"]
+            if run:
+                _SNAPSHOT_STATE["held"] = False
+        if run:
+            _schedule_db_snapshot()
+
+
 
 def _db_key(r: Dict[str, str]) -> tuple:
     """
@@ -1431,46 +2315,60 @@ def _db_key(r: Dict[str, str]) -> tuple:
 # --- [STEP 4/4] REPLACE BOTH FUNCTIONS WITH THESE ---
 
 # === [CHUNK 4 — B] FULL REPLACEMENT for save_db_rows + upsert_db_rows
+def _norm_marker(r: Dict[str, str], cols: List[str]) -> str:
+    """Normalization version + mode + hash of the stored columns."""
+    raw = "\x1f".join((r.get(k, "") or "") for k in cols)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{DB_NORM_VERSION}{'F' if FRESH_SECTION_ACTIVE else 'L'}:{digest}"
+
+def _normalize_row_for_db(r: Dict[str, str], cols: List[str]) -> Optional[Dict[str, str]]:
+    """
+    Storage normalization for one row; None when it fails the completeness gate.
+    Rows whose _NORM marker still matches (same version, mode and content) are
+    returned as-is: they were normalized and gated when they were stored.
+    """
+    base = {k: "" for k in cols}
+    base.update({k: (v or "") for k, v in r.items()})
+    mark = base.get(_NORM_COL, "")
+    if mark and mark == _norm_marker(base, cols):
+        return base
+
+    # Normalize core fields
+    base["BARCODE"] = clean_barcode(base.get("BARCODE",""))
+    for p in ("REG","PROMO","COOP","REGULAR_PRICE","PROMO_PRICE"):
+        base[p] = price_text(base.get(p,""))
+    for d in ("START_DATE","END_DATE"):
+        base[d] = date_only(base.get(d,""))
+
+    # Merge Fresh/Legacy equivalents, then gate completeness
+    if FRESH_SECTION_ACTIVE:
+        base = _merge_fresh_legacy(base)
+        if not _is_complete_fresh_or_legacy_row(base):
+            return None
+    else:
+        if not _is_complete_legacy_row(base):
+            return None
+        base = _merge_fresh_legacy(base)
+
+    # Mode-specific storage rules (UOM + COOP + ASCII upper)
+    base = _normalize_record_for_mode(base)
+    base[_NORM_COL] = _norm_marker(base, cols)
+    return base
+
 def save_db_rows(rows: List[Dict[str,str]])->None:
     cols = all_headers()
     norm: List[Dict[str, str]] = []
 
     for r in rows or []:
-        base = {k: "" for k in cols}
-        base.update({k: (v or "") for k, v in r.items()})
-
-        # Normalize core fields
-        base["BARCODE"] = clean_barcode(base.get("BARCODE",""))
-        for p in ("REG","PROMO","COOP","REGULAR_PRICE","PROMO_PRICE"):
-            base[p] = price_text(base.get(p,""))
-        for d in ("START_DATE","END_DATE"):
-            base[d] = date_only(base.get(d,""))
-
-        # Merge Fresh/Legacy equivalents, then gate completeness
-        if FRESH_SECTION_ACTIVE:
-            base = _merge_fresh_legacy(base)
-            if not _is_complete_fresh_or_legacy_row(base):
-                continue
-        else:
-            if not _is_complete_legacy_row(base):
-                continue
-            base = _merge_fresh_legacy(base)
-
-        # Mode-specific storage rules (UOM + COOP + ASCII upper)
-        base = _normalize_record_for_mode(base)
-        norm.append(base)
+        base = _normalize_row_for_db(r, cols)
+        if base is not None:
+            norm.append(base)
 
     # Deduplicate and write
     seen: Dict[tuple, Dict[str, str]] = {}
     for r in norm:
         seen[_db_key(r)] = r
-    out = list(seen.values())
-
-    with open(_db_path(), "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
-        for r in out:
-            w.writerow({k: (r.get(k, "") or "") for k in cols})
+    _store_replace_all(list(seen.values()), cols)
 
 # === [CHUNK 5 — A] Manual entry normalization + price sanity ===
 def build_manual_record(
@@ -1552,90 +2450,127 @@ def build_manual_record(
     return rec
 
 
-def upsert_db_rows(new_rows: List[Dict[str, str]]) -> None:
-    allrows = load_db_rows()
+def normalize_db_rows(rows: List[Dict[str, str]]) -> List[Optional[Dict[str, str]]]:
+    """_normalize_row_for_db per row (None = fails the completeness gate), for normalized=True below."""
     cols = all_headers()
+    return [_normalize_row_for_db(r, cols) for r in (rows or [])]
 
-    idx_by_key = {_db_key(r): i for i, r in enumerate(allrows)}
-    idx_by_sig = {_row_signature(r): i for i, r in enumerate(allrows)}
-
-    for r in (new_rows or []):
-        base = {k: "" for k in cols}
-        base.update({k: (v or "") for k, v in r.items()})
+def upsert_db_rows(new_rows: List[Dict[str, str]], normalized: bool = False) -> None:
+    """normalized=True: new_rows come from normalize_db_rows (Nones are skipped, nothing is re-normalized)."""
+    cols = all_headers()
+    if normalized:
+        staged = [b for b in (new_rows or []) if b is not None]
+    else:
+        staged = [b for b in (_normalize_row_for_db(r, cols) for r in (new_rows or [])) if b is not None]
+    if DB_BACKEND == "sqlite":
+        # Only the incoming rows are normalized and written; the unique key index
+        # turns "same product again" into an in-place update.
+        if not staged:
+            return
+        with _DB_LOCK, closing(_sqlite_connect()) as con:
+            with con:
+                _sqlite_put_rows(con, staged, cols)
+        _schedule_db_snapshot()
+        return
 
-        # Normalize core fields
-        base["BARCODE"] = clean_barcode(base.get("BARCODE",""))
-        for p in ("REG","PROMO","COOP","REGULAR_PRICE","PROMO_PRICE"):
-            base[p] = price_text(base.get(p,""))
-        for d in ("START_DATE","END_DATE"):
-            base[d] = date_only(base.get(d,""))
+    # CSV: replay the shards once, then append only new/changed rows to their shard journal
+    with _DB_LOCK:
+        allrows, keys, sids = _csv_load_rows_keyed()
+        idx_by_key = {k: i for i, k in enumerate(keys)}
+        puts: Dict[str, List[Dict[str, str]]] = {}
+        moved: Dict[str, List[Dict[str, str]]] = {}
+
+        for base in staged:
+            # Canonical dedupe (collapses Fresh≡Legacy); identical rows cost nothing
+            k = _db_key(base)
+            sid = _row_shard(base)
+            i = idx_by_key.get(k)
+            if i is not None:
+                old = allrows[i]
+                # equal markers = same version/mode/content
+                if sids[i] == sid and old.get(_NORM_COL) == base[_NORM_COL]:
+                    continue
+                if sids[i] != sid:
+                    # same product now comes from another file/sheet: tombstone the old shard copy
+                    moved.setdefault(sids[i], []).append(old)
+                allrows[i], sids[i] = base, sid
+            else:
+                idx_by_key[k] = len(allrows)
+                allrows.append(base)
+                sids.append(sid)
+            puts.setdefault(sid, []).append(base)
 
-        # Merge Fresh/Legacy equivalents, then gate completeness
-        if FRESH_SECTION_ACTIVE:
-            base = _merge_fresh_legacy(base)
-            if not _is_complete_fresh_or_legacy_row(base):
-                continue
-        else:
-            if not _is_complete_legacy_row(base):
-                continue
-            base = _merge_fresh_legacy(base)
+        for sid, rs in moved.items():
+            _csv_journal_append(sid, rs, cols, op="D")
+        for sid, rs in puts.items():
+            _csv_journal_append(sid, rs, cols)
+        if puts:
+            _csv_touch_shards(puts)
+    if puts:
+        _schedule_db_snapshot()
 
-        # Mode-specific storage rules (UOM + COOP + ASCII upper)
-        base = _normalize_record_for_mode(base)
 
-        # Canonical dedupe (collapses Fresh≡Legacy)
-        sig = _row_signature(base)
-        if sig in idx_by_sig:
-            i = idx_by_sig[sig]
-            allrows[i].update(base)
-            idx_by_key[_db_key(base)] = i
-            continue
+def _write_rows_raw(rows: List[Dict[str,str]]) -> None:
+    _store_replace_all(rows, all_headers())
+
+# ---------- import delta (what changed since the previous import) ----------
+DELTA_NEW, DELTA_PRICE, DELTA_DATE, DELTA_SAME = "new", "price", "date", "same"
+_DELTA_PRICE_FIELDS = ("REG", "PROMO", "COOP", "REGULAR_PRICE", "PROMO_PRICE")
+_DELTA_DATE_FIELDS = ("START_DATE", "END_DATE")
+
+def _db_rows_for_keys(keys: List[tuple]) -> Dict[tuple, Dict[str, str]]:
+    """Stored rows for the given _db_keys (SQLite: unique-index IN lookups; CSV: one replay)."""
+    if not keys:
+        return {}
+    if DB_BACKEND != "sqlite":
+        rows, rkeys, _ = _csv_load_rows_keyed()
+        want = set(keys)
+        return {k: r for r, k in zip(rows, rkeys) if k in want}
+    by_text = {_key_text(k): k for k in keys}
+    texts = list(by_text)
+    out: Dict[tuple, Dict[str, str]] = {}
+    with closing(_sqlite_connect()) as con:
+        for i in range(0, len(texts), 500):
+            chunk = texts[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for kt, d in con.execute(f"SELECT db_key, data FROM labels WHERE db_key IN ({marks})", chunk):
+                out[by_text[kt]] = json.loads(d)
+    return out
 
-        k = _db_key(base)
-        if k in idx_by_key:
-            i = idx_by_key[k]
-            allrows[i].update(base)
-            idx_by_sig[_row_signature(allrows[i])] = i
+def classify_import_delta(rows: List[Dict[str, str]], normalized: bool = False) -> List[str]:
+    """
+    Compare incoming rows with the stored row of the same _db_key (call BEFORE upsert_db_rows).
+    Per row: DELTA_NEW, DELTA_PRICE (any price differs; wins over dates), DELTA_DATE or DELTA_SAME.
+    Rows failing the DB completeness gate are never stored, so they always count as new.
+    normalized=True: rows come from normalize_db_rows, so the upsert can reuse them as they are.
+    """
+    # Fresh mode mirrors UOM into COOP, so COOP is not a price there
+    price_fields = tuple(f for f in _DELTA_PRICE_FIELDS if not (FRESH_SECTION_ACTIVE and f == "COOP"))
+    norm = list(rows or []) if normalized else normalize_db_rows(rows)
+    keys = [None if b is None else _db_key(b) for b in norm]
+    stored = _db_rows_for_keys([k for k in keys if k is not None])
+
+    out: List[str] = []
+    for b, k in zip(norm, keys):
+        old = None if k is None else stored.get(k)
+        if old is None:
+            out.append(DELTA_NEW)
+        elif any((old.get(f) or "") != b.get(f, "") for f in price_fields):
+            out.append(DELTA_PRICE)
+        elif any((old.get(f) or "") != b.get(f, "") for f in _DELTA_DATE_FIELDS):
+            out.append(DELTA_DATE)
         else:
-            i = len(allrows)
-            idx_by_key[k] = i
-            idx_by_sig[sig] = i
-            allrows.append(base)
-
-    save_db_rows(allrows)
-
-
-def _write_rows_raw(rows: List[Dict[str,str]]) -> None:
-    cols = all_headers()
-    with open(_db_path(), "w", encoding="utf-8", newline="") as f:
-        w = csv.DictWriter(f, fieldnames=cols)
-        w.writeheader()
-        for r in rows:
-            w.writerow({k: (r.get(k, "") or "") for k in cols})
+            out.append(DELTA_SAME)
+    return out
 
-def _prune_db_to_recent_sources(limit: int = 15) -> None:
-    try:
-        sources = load_excel_sources()
-        if not sources:
-            return
-        keep = set()
-        for s in sources:
-            nm = (s.get("name") or "").strip()
-            if nm and nm not in keep:
-                keep.add(nm)
-                if len(keep) >= int(limit):
-                    break
-        all_rows = load_db_rows()
-        if not all_rows:
-            return
-        filtered = [
-            r for r in all_rows
-            if not (r.get("SOURCE_FILE") or "").strip() or (r.get("SOURCE_FILE") in keep)
-        ]
-        if len(filtered) != len(all_rows):
-            _write_rows_raw(filtered)  # ← write raw, no gating
-    except Exception:
-        pass
+def delta_summary(statuses) -> str:
+    """statuses: per-row list from classify_import_delta, or {status: count}."""
+    if isinstance(statuses, Mapping):
+        n = {s: int(statuses.get(s, 0)) for s in (DELTA_NEW, DELTA_PRICE, DELTA_DATE, DELTA_SAME)}
+    else:
+        n = {s: statuses.count(s) for s in (DELTA_NEW, DELTA_PRICE, DELTA_DATE, DELTA_SAME)}
+    return (f"{n[DELTA_NEW]} new • {n[DELTA_PRICE]} price changed • "
+            f"{n[DELTA_DATE]} dates changed • {n[DELTA_SAME]} unchanged")
 
 
 def clean_barcode(v) -> str:
@@ -1677,6 +2612,8 @@ def price_text(v)->str:
     return s
 
 # === FIX: restore _upper_english helper (used by various import paths) ===
+_ASCII_UPPER = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
 def _upper_english(text) -> str:
     """
     Uppercase ASCII a–z only; leave Arabic/other scripts unchanged.
@@ -1684,21 +2621,28 @@ def _upper_english(text) -> str:
     """
     if text is None:
         return ""
-    s = str(text)
-    return "".join((ch.upper() if "a" <= ch <= "z" else ch) for ch in s)
+    return str(text).translate(_ASCII_UPPER)
 
 
 
+_DATE_ONLY_MEMO: Dict[str, str] = {}   # text -> result; a sheet repeats a handful of dates
+
 def date_only(v)->str:
     if v in ("",None): return ""
     if isinstance(v,(datetime,date)):
         d=v if isinstance(v,date) else v.date()
         return d.strftime("%d.%m.%Y")
     s=str(v).strip()
+    out=_DATE_ONLY_MEMO.get(s)
+    if out is not None: return out
+    out=s
     for pat in("%d/%m/%Y","%Y-%m-%d","%m/%d/%Y","%d-%m-%Y","%d.%m.%Y"):
-        try: return datetime.strptime(s,pat).strftime("%d.%m.%Y")
+        try:
+            out=datetime.strptime(s,pat).strftime("%d.%m.%Y")
+            break
         except: pass
-    return s
+    if len(_DATE_ONLY_MEMO) < 4096: _DATE_ONLY_MEMO[s]=out
+    return out
 
 def _normalize_uom_for_storage(uom: str) -> str:
     u = (uom or "").strip()
@@ -1912,48 +2856,40 @@ def remember_excel_source(name: str, path: str, sheet: str):
 
 
 # --- DB SIZE CONTROL: keep only last N connected Excel files' rows ---
+def _recent_source_names(limit: int = 15) -> List[str]:
+    """Unique SOURCE_FILE names of the last `limit` connected Excel files, newest first."""
+    names: List[str] = []
+    for s in load_excel_sources():  # already sorted newest->oldest
+        nm = (s.get("name") or "").strip()
+        if nm and nm not in names:
+            names.append(nm)
+            if len(names) >= int(limit):
+                break
+    return names
+
 def _prune_db_to_recent_sources(limit: int = 15) -> None:
     """
     Keep DB rows only for the last `limit` connected Excel files (by last_used).
     Rows with empty SOURCE_FILE (e.g., manual entries) are preserved.
+    SQLite: one indexed DELETE. CSV: old sources' shard files are deleted.
     """
     try:
-        # 1) Figure out the recent SOURCE_FILE names from excel_sources.json
-        sources = load_excel_sources()  # [{name, path, sheet, last_used}, ...] already sorted newest->oldest
-        if not sources:
-            return
-
-        # take unique file names in order
-        keep_names: list[str] = []
-        seen: set[str] = set()
-        for s in sources:
-            nm = (s.get("name") or "").strip()
-            if not nm or nm in seen:
-                continue
-            keep_names.append(nm)
-            seen.add(nm)
-            if len(keep_names) >= int(limit):
-                break
-
+        keep_names = _recent_source_names(limit)
         if not keep_names:
             return
-        keep = set(keep_names)
-
-        # 2) Load DB, filter, and save back
-        all_rows = load_db_rows()
-        if not all_rows:
-            return
 
-        filtered = []
-        for r in all_rows:
-            src = (r.get("SOURCE_FILE") or "").strip()
-            # keep manual/unsourced and rows from recent files
-            if not src or src in keep:
-                filtered.append(r)
-
-        # Only write if something actually prunes
-        if len(filtered) != len(all_rows):
-            save_db_rows(filtered)
+        if DB_BACKEND == "sqlite":
+            marks = ",".join("?" * len(keep_names))
+            with _DB_LOCK, closing(_sqlite_connect()) as con:
+                with con:
+                    pruned = con.execute(
+                        f"DELETE FROM labels WHERE source_file <> '' AND source_file NOT IN ({marks})",
+                        keep_names,
+                    ).rowcount
+        else:
+            pruned = _csv_prune_shards(set(keep_names))
+        if pruned:
+            _schedule_db_snapshot()
     except Exception:
         # never let pruning break normal flow
         pass
@@ -1972,7 +2908,7 @@ def search_excel_sources_by_name(q: str)->List[dict]:
 
 # ---------- Excel mapping using Header Manager synonyms ----------
 def _build_synonyms_from_cfg() -> Dict[str, List[str]]:
-    cfg = load_headers_cfg(); return {k:list(v.get("synonyms", [])) for k,v in cfg.items()}
+    cfg = headers_cfg_snapshot(); return {k:list(v.get("synonyms", [])) for k,v in cfg.items()}
 
 def _best_header_row(ws):
     used=ws.used_range; r1,c1=used.row,used.column
@@ -2062,31 +2998,27 @@ def _price_to_float(v) -> Optional[float]:
 
 def _infer_adjacent_price_columns(headers: list[str], rows_ll: list[list],
                                   *, sample_rows: int = 200,
-                                  require_ratio: float = 0.60):
+                                  require_ratio: float = 0.60,
+                                  sample: Optional["ColumnSample"] = None):
     if not headers or not rows_ll:
         return (None, None)
 
     n = min(sample_rows, len(rows_ll))
+    sample = sample or ColumnSample(rows_ll[:n], len(headers))
+    ok, val = sample.price()
+    ok, val = ok[:n], val[:n]
+    both = ok[:, :-1] & ok[:, 1:]                 # rows where columns i and i+1 both parse
+    totals = both.sum(axis=0)
+    wins = (both & (val[:, 1:] < val[:, :-1])).sum(axis=0)
     best = None  # (wins, total, i)
 
-    for i in range(len(headers) - 1):
-        total = 0
-        wins = 0
-        for r in rows_ll[:n]:
-            if i >= len(r) or i + 1 >= len(r):
-                continue
-            a = _price_to_float(r[i])
-            b = _price_to_float(r[i + 1])
-            if a is None or b is None:
-                continue
-            total += 1
-            if b < a:
-                wins += 1
+    for i in range(min(len(headers) - 1, both.shape[1])):
+        total, w = int(totals[i]), int(wins[i])
         if total >= 5:
-            ratio = wins / total
+            ratio = w / total
             if ratio >= require_ratio:
-                if best is None or (wins, total) > (best[0], best[1]):
-                    best = (wins, total, i)
+                if best is None or (w, total) > (best[0], best[1]):
+                    best = (w, total, i)
 
     if not best:
         return (None, None)
@@ -2139,58 +3071,30 @@ def _looks_like_brand_header_name(header_text: str) -> bool:
         return False
     return False  # unknown: let content decide
 
-def _brand_content_score(headers: list[str], rows_ll: list[list], idx: int, *, sample_rows: int = 400) -> float:
+def _brand_content_score(headers: list[str], rows_ll: list[list], idx: int, *, sample_rows: int = 400,
+                         sample: Optional["ColumnSample"] = None) -> float:
     """How 'brand-like' is column idx? Higher → more likely BRAND."""
     if idx < 0 or idx >= len(headers) or not rows_ll:
         return float("-inf")
-    n = min(sample_rows, len(rows_ll))
-    values = []
-    for r in rows_ll[:n]:
-        try:
-            s = "" if r is None else str(r[idx] if idx < len(r) else "").strip()
-        except Exception:
-            s = ""
-        values.append(s)
-
-    nonempty = [s for s in values if s]
-    if len(nonempty) < 8:
-        return float("-inf")
+    sample = sample or ColumnSample(rows_ll[:sample_rows], len(headers))
+    return _brand_scores(sample, (idx,), sample_rows)[0]
 
-    letters = sum(any(ch.isalpha() for ch in s) for s in nonempty)
-    digits  = sum(any(ch.isdigit() for ch in s) for s in nonempty)
-    uppers  = sum(s == s.upper() for s in nonempty)
-    avg_len = (sum(len(s) for s in nonempty) / len(nonempty))
-    avg_words = (sum(len(s.split()) for s in nonempty) / len(nonempty))
-    dup_ratio = 1.0 - (len(set(nonempty)) / len(nonempty))
-
-    letters_ratio = letters / len(nonempty)
-    digits_ratio  = digits  / len(nonempty)
-    upper_ratio   = uppers  / len(nonempty)
-
-    score = 0.0
-    score += 2.5 * letters_ratio
-    score -= 1.2 * digits_ratio
-    score += 0.5 * upper_ratio
-    score += 0.8 * dup_ratio
-    if 3 <= avg_len <= 18: score += 0.6
-    if avg_words <= 3:     score += 0.3
-    if avg_len > 24 or avg_words > 5: score -= 1.0
-    return score
-
-def _infer_brand_column(headers: list[str], rows_ll: list[list], *, sample_rows: int = 400, threshold: float = 1.8) -> Optional[str]:
+def _infer_brand_column(headers: list[str], rows_ll: list[list], *, sample_rows: int = 400, threshold: float = 1.8,
+                        sample: Optional["ColumnSample"] = None) -> Optional[str]:
     """Pick most brand-like column by content."""
     if not headers or not rows_ll:
         return None
+    sample = sample or ColumnSample(rows_ll[:sample_rows], len(headers))
     best_i, best_s = -1, float("-inf")
-    for i in range(len(headers)):
-        s = _brand_content_score(headers, rows_ll, i, sample_rows=sample_rows)
+    for i, s in enumerate(_brand_scores(sample, range(len(headers)), sample_rows)):
         if s > best_s:
             best_s, best_i = s, i
     if best_i >= 0 and best_s >= threshold:
         return headers[best_i]
     return None
 
-def _is_plausible_brand_mapping(headers: list[str], rows_ll: list[list], header_name: Optional[str]) -> bool:
+def _is_plausible_brand_mapping(headers: list[str], rows_ll: list[list], header_name: Optional[str],
+                                sample: Optional["ColumnSample"] = None) -> bool:
     """
     Keep existing BRAND mapping if its label or content is plausible.
     Otherwise, we’ll infer and replace it.
@@ -2201,11 +3105,164 @@ def _is_plausible_brand_mapping(headers: list[str], rows_ll: list[list], header_
         return True
     try:
         idx = {h: i for i, h in enumerate(headers)}.get(header_name, -1)
-        s = _brand_content_score(headers, rows_ll, idx)
+        s = _brand_content_score(headers, rows_ll, idx, sample=sample)
         return s >= 1.4  # relaxed keep-threshold
     except Exception:
         return False
 
+# ---------- column sample features (vectorized mapping inference) ----------
+# The mapping heuristics (adjacent / any-pair price columns, brand content score, BRAND from
+# ITEM prefix) all look at the same few hundred sample rows. ColumnSample runs the per-cell
+# parsers (_price_to_float, text stats, [a-z0-9] tokens) once per distinct cell into
+# (rows x cols) NumPy arrays; the heuristics then reduce over whole columns at once.
+class ColumnSample:
+    """Sample rows (list of lists) with lazily built per-cell feature arrays."""
+    __slots__ = ("rows", "n", "width", "lens", "_price", "_text", "_tokens")
+
+    def __init__(self, rows_ll: list, width: int = 0):
+        np = _np()
+        self.rows = [r if isinstance(r, (list, tuple)) else None for r in (rows_ll or [])]
+        self.n = len(self.rows)
+        self.lens = np.array([-1 if r is None else len(r) for r in self.rows], dtype=np.int64)
+        self.width = max([int(width)] + [len(r) for r in self.rows if r is not None])
+        self._price = self._text = self._tokens = None
+
+    def _cells(self, fn, fills: tuple, dtypes: tuple) -> list:
+        """fn(cell) -> tuple of features, evaluated once per distinct cell; missing cells get `fills`."""
+        np = _np()
+        outs = [np.full((self.n, self.width), f, dtype=d) for f, d in zip(fills, dtypes)]
+        memo: dict = {}
+        for i, r in enumerate(self.rows):
+            if r is None:
+                continue
+            for j, v in enumerate(r):
+                k = (float, repr(v)) if type(v) is float else (type(v), v)
+                try:
+                    x = memo[k]
+                except KeyError:
+                    x = memo[k] = fn(v)
+                except TypeError:  # unhashable cell
+                    x = fn(v)
+                for o, xv in zip(outs, x):
+                    o[i, j] = xv
+        return outs
+
+    def price(self):
+        """(ok, value): ok where _price_to_float parsed the cell (value may still be NaN)."""
+        if self._price is None:
+            def f(v):
+                p = _price_to_float(v)
+                return (False, 0.0) if p is None else (True, p)
+            self._price = tuple(self._cells(f, (False, 0.0), (bool, float)))
+        return self._price
+
+    def text(self):
+        """(text, has_alpha, has_digit, is_upper, length, words) of str(cell).strip()."""
+        if self._text is None:
+            def f(v):
+                s = str(v).strip()
+                return (s, any(ch.isalpha() for ch in s), any(ch.isdigit() for ch in s),
+                        s == s.upper(), len(s), len(s.split()))
+            self._text = tuple(self._cells(f, ("", False, False, True, 0, 0),
+                                           (object, bool, bool, bool, int, int)))
+        return self._text
+
+    def tokens(self):
+        """(all, first1, first2): lowercase [a-z0-9] tokens of each cell, space-joined."""
+        if self._tokens is None:
+            def f(v):
+                toks = re.findall(r"[a-z0-9]+", ("" if v is None else str(v)).lower())
+                return (" ".join(toks), " ".join(toks[:1]), " ".join(toks[:2]))
+            self._tokens = tuple(a.astype(str) for a in self._cells(f, ("", "", ""), (object, object, object)))
+        return self._tokens
+
+def _brand_scores(sample: "ColumnSample", cols, sample_rows: int = 400) -> List[float]:
+    """_brand_content_score for each column index in `cols`, from one pass over the sample."""
+    np = _np()
+    text, alpha, digit, upper, length, words = sample.text()
+    n = min(sample_rows, sample.n)
+    ne = (text[:n] != "")
+    cnt = ne.sum(axis=0)
+    letters = (alpha[:n] & ne).sum(axis=0)
+    digits = (digit[:n] & ne).sum(axis=0)
+    uppers = (upper[:n] & ne).sum(axis=0)
+    tot_len = np.where(ne, length[:n], 0).sum(axis=0)
+    tot_words = np.where(ne, words[:n], 0).sum(axis=0)
+
+    scores = []
+    for i in cols:
+        c = int(cnt[i]) if 0 <= i < sample.width else 0
+        if c < 8:
+            scores.append(float("-inf"))
+            continue
+        distinct = len(set(text[:n, i][ne[:, i]].tolist()))
+        letters_ratio = int(letters[i]) / c
+        digits_ratio  = int(digits[i]) / c
+        upper_ratio   = int(uppers[i]) / c
+        avg_len = int(tot_len[i]) / c
+        avg_words = int(tot_words[i]) / c
+        dup_ratio = 1.0 - (distinct / c)
+
+        score = 0.0
+        score += 2.5 * letters_ratio
+        score -= 1.2 * digits_ratio
+        score += 0.5 * upper_ratio
+        score += 0.8 * dup_ratio
+        if 3 <= avg_len <= 18: score += 0.6
+        if avg_words <= 3:     score += 0.3
+        if avg_len > 24 or avg_words > 5: score -= 1.0
+        scores.append(score)
+    return scores
+
+def _detect_price_pairs(headers: list, rows_ll: list, limit: int = 300, min_ratio: float = 0.65,
+                        *, sample: Optional["ColumnSample"] = None):
+    """(higher, lower) header pair, any two columns: most rows where col i > col j (>= min_ratio)."""
+    np = _np()
+    H = len(headers)
+    if not H:
+        return None, None
+    sample = sample or ColumnSample(rows_ll[:limit], H)
+    ok, val = sample.price()
+    ok, val = ok[:limit, :H], val[:limit, :H]
+    both = ok[:, :, None] & ok[:, None, :]
+    total = both.sum(axis=0)
+    higher = (both & (val[:, :, None] > val[:, None, :])).sum(axis=0)
+    best = None   # (ratio, i, j); first pair wins ties, as max() over the i/j scan did
+    for i, j in zip(*np.nonzero(total >= 6)):
+        if i == j:
+            continue
+        ratio = int(higher[i, j]) / int(total[i, j])
+        if ratio >= min_ratio and (best is None or ratio > best[0]):
+            best = (ratio, int(i), int(j))
+    if best is None:
+        return None, None
+    return headers[best[1]], headers[best[2]]
+
+def _brand_prefix_column(headers: list, sample: "ColumnSample", item_idx: int) -> int:
+    """
+    Column whose cells equal the first one or two words of ITEM in >= 40% of its (>= 10)
+    non-empty sample cells; -1 if none. Date/time-looking header labels are skipped.
+    """
+    H = len(headers)
+    if item_idx < 0 or item_idx >= sample.width or not H:
+        return -1
+    norm, first1, first2 = sample.tokens()
+    p1, p2 = first1[:, item_idx], first2[:, item_idx]
+    rows = (sample.lens > item_idx) & ((p1 != "") | (p2 != ""))
+    vv = norm[rows][:, :H]
+    ne = vv != ""
+    comps = ne.sum(axis=0)
+    hits = (ne & ((vv == p1[rows][:, None]) | (vv == p2[rows][:, None]))).sum(axis=0)
+
+    best_j, best_hits = -1, -1
+    for j in range(min(H, vv.shape[1])):
+        if j == item_idx or _is_time_or_date_like_header(headers[j]):
+            continue
+        comp, h = int(comps[j]), int(hits[j])
+        if comp >= 10 and h / comp >= 0.40 and h > best_hits:
+            best_hits, best_j = h, j
+    return best_j
+
 
 
 def extract_rows_from_excel(ws):
@@ -2408,33 +3465,6 @@ def extract_rows_from_excel(ws):
     pos = {h: i for i, h in enumerate(headers)}
     out = []
 
-    # --- PRICE fallback (non-adjacent search) ---
-    def _detect_price_pairs(headers, rows_ll, limit=300, min_ratio=0.65):
-        candidates = []
-        for i in range(len(headers)):
-            for j in range(len(headers)):
-                if i == j:
-                    continue
-                hi, lo = [], []
-                for r in rows_ll[:limit]:
-                    if not isinstance(r, (list, tuple)):
-                        continue
-                    if i >= len(r) or j >= len(r):
-                        continue
-                    a = _price_to_float(r[i]); b = _price_to_float(r[j])
-                    if a is None or b is None:
-                        continue
-                    hi.append(a); lo.append(b)
-                if len(hi) >= 6:
-                    higher = sum(x > y for x, y in zip(hi, lo))
-                    ratio = higher / len(hi)
-                    if ratio >= min_ratio:
-                        candidates.append((ratio, i, j))
-        if not candidates:
-            return None, None
-        _, i_hi, j_lo = max(candidates, key=lambda t: t[0])
-        return headers[i_hi], headers[j_lo]
-
     # --- AUTO-INFER ADJACENT PRICE COLUMNS IF NEEDED (existing) ---
     try:
         need_reg = not (mapping.get("REG") or mapping.get("REGULAR_PRICE"))
@@ -2443,10 +3473,12 @@ def extract_rows_from_excel(ws):
             sample_ll = []
             for r in data[:200]:
                 sample_ll.append(list(r) if isinstance(r, (list, tuple)) else [r])
-            infer_reg, infer_pro = _infer_adjacent_price_columns(headers, sample_ll)
+            price_sample = ColumnSample(sample_ll, len(headers))
+            infer_reg, infer_pro = _infer_adjacent_price_columns(headers, sample_ll, sample=price_sample)
             if not (infer_reg and infer_pro):
                 # fallback to non-adjacent detection
-                infer_reg, infer_pro = _detect_price_pairs(headers, sample_ll, limit=300, min_ratio=0.65)
+                infer_reg, infer_pro = _detect_price_pairs(headers, sample_ll, limit=300, min_ratio=0.65,
+                                                           sample=price_sample)
             if infer_reg and infer_pro:
                 if not mapping.get("REG"):            mapping["REG"] = infer_reg
                 if not mapping.get("PROMO"):          mapping["PROMO"] = infer_pro
@@ -2456,29 +3488,19 @@ def extract_rows_from_excel(ws):
     except Exception:
         pass
 
-    # --- BRAND via ITEM prefix match (keep your logic as-is) ---
+    # BRAND heuristics below share one 400-row sample, parsed once
+    brand_ll = [(list(r) if isinstance(r, (list, tuple)) else [r]) for r in (data[:400] if data else [])]
+    brand_sample = ColumnSample(brand_ll, len(headers))
+
+    # --- BRAND via ITEM prefix match ---
     try:
         if not mapping.get("BRAND"):
-            sample_ll = []
-            for r in (data[:400] if data else []):
-                sample_ll.append(list(r) if isinstance(r, (list, tuple)) else [r])
-
-            if headers and sample_ll:
+            if headers and brand_ll:
                 def _norm_text(x: str) -> str:
                     s = "" if x is None else str(x).strip().lower()
                     toks = re.findall(r"[a-z0-9]+", s)
                     return " ".join(toks)
 
-                def _first_words(s: str, k: int) -> str:
-                    toks = re.findall(r"[a-z0-9]+", ("" if s is None else str(s)).lower())
-                    return " ".join(toks[:k])
-
-                def _looks_like_time_or_date(h: str) -> bool:
-                    return bool(re.match(
-                        r"^\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)|\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4})\s*$",
-                        ("" if h is None else str(h)).strip(), flags=re.IGNORECASE
-                    ))
-
                 item_like_keys = (
                     "ENGLISH_DESCRIPTION", "DESCRIPTION", "ITEM", "ITEM_DESCRIPTION",
                     "PRODUCT", "PRODUCT_DESCRIPTION", "NAME", "ITEM NAME", "ITEMNAME"
@@ -2505,54 +3527,19 @@ def extract_rows_from_excel(ws):
                             break
 
                 if item_idx >= 0:
-                    col_hits = [0] * len(headers)
-                    col_comparables = [0] * len(headers)
-
-                    for r in sample_ll:
-                        if not isinstance(r, (list, tuple)) or item_idx >= len(r):
-                            continue
-                        item_cell = r[item_idx]
-                        p1 = _first_words(item_cell, 1)
-                        p2 = _first_words(item_cell, 2)
-                        if not p1 and not p2:
-                            continue
-
-                        for j in range(len(headers)):
-                            if j == item_idx:
-                                continue
-                            if _looks_like_time_or_date(headers[j]):
-                                continue
-                            val = "" if j >= len(r) else r[j]
-                            vv = _norm_text(val)
-                            if not vv:
-                                continue
-                            col_comparables[j] += 1
-                            if vv == p1 or vv == p2:
-                                col_hits[j] += 1
-
-                    best_j, best_hits, best_comp = -1, -1, 0
-                    for j in range(len(headers)):
-                        comp = col_comparables[j]
-                        if comp >= 10:
-                            hits = col_hits[j]
-                            ratio = hits / comp if comp else 0.0
-                            if ratio >= 0.40:
-                                if hits > best_hits:
-                                    best_hits, best_comp, best_j = hits, comp, j
-
-                    if best_j >= 0:
-                        mapping["BRAND"] = headers[best_j]
-                        pos = {h: i for i, h in enumerate(headers)}
-    except Exception:
-        pass
+                    best_j = _brand_prefix_column(headers, brand_sample, item_idx)
+                    if best_j >= 0:
+                        mapping["BRAND"] = headers[best_j]
+                        pos = {h: i for i, h in enumerate(headers)}
+    except Exception:
+        pass
 
     # --- BRAND validation + content-based fallback (keep primary mapping) ---
     try:
-        _sample_ll = [(list(r) if isinstance(r, (list, tuple)) else [r]) for r in (data[:400] if data else [])]
         brand_hdr = mapping.get("BRAND")
-        brand_ok = _is_plausible_brand_mapping(headers, _sample_ll, brand_hdr)
+        brand_ok = _is_plausible_brand_mapping(headers, brand_ll, brand_hdr, sample=brand_sample)
         if not brand_ok:
-            inferred = _infer_brand_column(headers, _sample_ll)
+            inferred = _infer_brand_column(headers, brand_ll, sample=brand_sample)
             if inferred:
                 mapping["BRAND"] = inferred
                 pos = {h: i for i, h in enumerate(headers)}
@@ -2601,15 +3588,75 @@ def extract_rows_from_excel(ws):
 
 
 
-def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
+# ---------- Excel reader backends ----------
+# Every backend returns the raw sheet exactly like pd.read_excel(header=None, dtype=object).
+# read_sheet_frame() picks the highest-priority backend that handles the file type/size and
+# is installed (EXCEL_READER_FORCE overrides), falls back to plain pandas if it fails, and
+# reports what ran in `stats`. Backends registered with rows= can also hand out the raw rows
+# one by one, pruned to a column subset (see _excel_raw_records).
+EXCEL_READER_FORCE = ""               # e.g. "pandas" to bypass the registry
+EXCEL_STREAM_MIN_BYTES = 512 * 1024   # smaller .xlsx files load just as fast through pandas
+_EXCEL_READERS: List[dict] = []
+_MODULES_AVAILABLE: Dict[str, bool] = {}
+_XL_ERROR_CODES = frozenset(("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A", "#GETTING_DATA"))
+
+def register_excel_reader(name: str, read: Callable, exts, *, available: Optional[Callable] = None,
+                          min_bytes: int = 0, priority: int = 0, rows: Optional[Callable] = None) -> None:
     """
-    Fast import via pandas. Tries openpyxl/xlrd/pyxlsb automatically.
-    Fresh-mode aware: maps PLU, ARABIC_DESCRIPTION, ENGLISH_DESCRIPTION, REGULAR_PRICE, PROMO_PRICE.
-    Also detects optional UOM column (UOM/UNIT/UNIT OF MEASURE); if not present, attempts a light inference.
+    Add a backend: read(path, sheet) -> object DataFrame. Higher priority wins.
+    Optional rows(path, sheet, cols) -> iterator of raw rows (as the frame's rows, ragged is fine);
+    once the caller fills the `cols` list, later rows carry only those column positions.
     """
-    if not full_path or not os.path.exists(full_path):
-        raise FileNotFoundError(f"Excel not found: {full_path}")
+    _EXCEL_READERS[:] = [b for b in _EXCEL_READERS if b["name"] != name]
+    _EXCEL_READERS.append({"name": name, "read": read, "exts": {e.lower() for e in exts},
+                           "available": available or (lambda: True), "rows": rows,
+                           "min_bytes": int(min_bytes), "priority": int(priority)})
+    _EXCEL_READERS.sort(key=lambda b: -b["priority"])
+
+def _module_available(mod: str) -> bool:
+    if mod not in _MODULES_AVAILABLE:
+        try:
+            import importlib.util
+            _MODULES_AVAILABLE[mod] = importlib.util.find_spec(mod) is not None
+        except Exception:
+            _MODULES_AVAILABLE[mod] = False
+    return _MODULES_AVAILABLE[mod]
 
+def pick_excel_reader(path: str) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    if EXCEL_READER_FORCE and (ext not in TEXT_TABLE_EXTS or EXCEL_READER_FORCE == "csv"):
+        return EXCEL_READER_FORCE
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        size = 0
+    for b in _EXCEL_READERS:
+        if ext in b["exts"] and size >= b["min_bytes"] and b["available"]():
+            return b["name"]
+    return "pandas"
+
+def read_sheet_frame(full_path: str, sheet_name, stats: Optional[dict] = None):
+    """Raw sheet (header=None, dtype=object) via the picked backend; stats gets backend/seconds/rows."""
+    readers = {b["name"]: b["read"] for b in _EXCEL_READERS}
+    name = pick_excel_reader(full_path)
+    t0 = time.perf_counter()
+    try:
+        df = readers.get(name, _read_frame_pandas)(full_path, sheet_name)
+    except Exception as e:
+        if name == "pandas" or is_text_table(full_path):   # pandas has no other CSV reader to offer
+            raise
+        if stats is not None:
+            stats["fallback_from"] = f"{name}: {type(e).__name__}: {e}"
+        name = "pandas"
+        t0 = time.perf_counter()
+        df = _read_frame_pandas(full_path, sheet_name)
+    check_cancelled()
+    if stats is not None:
+        stats.update(backend=name, seconds=round(time.perf_counter() - t0, 3),
+                     rows=int(df.shape[0]), cols=int(df.shape[1]))
+    return df
+
+def _read_frame_pandas(full_path: str, sheet_name):
     pd = _pd()
     engine = None
     if full_path.lower().endswith(".xlsb"):
@@ -2618,10 +3665,502 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
             engine = "pyxlsb"
         except Exception:
             engine = None
+    return pd.read_excel(full_path, sheet_name=sheet_name or 0, header=None, engine=engine, dtype=object)
+
+def _read_frame_pyxlsb(full_path: str, sheet_name):
+    return _pd().read_excel(full_path, sheet_name=sheet_name or 0, header=None, engine="pyxlsb", dtype=object)
+
+def _calamine_available() -> bool:
+    if not _module_available("python_calamine"):
+        return False
+    try:
+        return tuple(int(x) for x in _pd().__version__.split(".")[:2]) >= (2, 2)
+    except Exception:
+        return False
+
+def _read_frame_calamine(full_path: str, sheet_name):
+    return _pd().read_excel(full_path, sheet_name=sheet_name or 0, header=None, engine="calamine", dtype=object)
+
+def _calamine_cell(v):
+    """pandas' calamine _convert_cell: integral floats to int, bare dates to datetime."""
+    t = type(v)
+    if t is float:
+        if v != v or v in (float("inf"), float("-inf")):
+            return v
+        iv = int(v)
+        return iv if iv == v else v
+    if t is date:
+        return datetime(v.year, v.month, v.day)
+    return v
+
+def _iter_calamine_raw_rows(full_path: str, sheet_name, cols: Optional[list] = None) -> Iterator[list]:
+    """
+    Sheet rows as pd.read_excel(engine="calamine") sees them; cells outside `cols` skipped once set.
+    Uses python_calamine's public iter_rows, so Python row lists are built one at a time; calamine
+    itself still parses the whole sheet into its own cell range when the sheet is opened.
+    """
+    from python_calamine import CalamineWorkbook
+
+    wb = CalamineWorkbook.from_path(full_path)
+    try:
+        if isinstance(sheet_name, str) and sheet_name:
+            sheet = wb.get_sheet_by_name(sheet_name)
+        else:
+            sheet = wb.get_sheet_by_index(sheet_name or 0)
+        start = sheet.start or (0, 0)
+        total = (sheet.end[0] + 1) if sheet.end else 0
+        lead_cols = [""] * start[1]   # iter_rows starts at the first used column, pandas at A
+        width = len(lead_cols) + sheet.width
+        # leading blank rows: some python_calamine versions yield them, others start at the range
+        blank = 0
+        i = 0
+        for r in sheet.iter_rows():
+            if blank is not None:
+                if not any(c != "" for c in r):
+                    blank += 1
+                    continue
+                pad = blank if blank >= start[0] else start[0] + blank
+                for _ in range(pad):
+                    yield [""] * len(cols) if cols else [""] * width
+                i, blank = pad, None
+            if not i % 512 and total:
+                work_progress(i / total)
+            i += 1
+            if cols:
+                n = len(lead_cols)
+                yield [_calamine_cell(r[j - n]) if n <= j < n + len(r) else "" for j in cols]
+            else:
+                yield lead_cols + [_calamine_cell(v) for v in r]
+    finally:
+        wb.close()
+
+def _stream_cell(v):
+    """pandas' openpyxl _convert_cell, for values_only rows."""
+    if v is None:
+        return ""
+    t = type(v)
+    if t is float:
+        if v != v or v in (float("inf"), float("-inf")):
+            return v
+        iv = int(v)
+        return iv if iv == v else v
+    if t is str and v in _XL_ERROR_CODES:
+        return float("nan")
+    return v
+
+def _iter_sheet_raw_rows(full_path: str, sheet_name, cols: Optional[list] = None) -> Iterator[list]:
+    """
+    Sheet rows from openpyxl read_only (values only), cells converted, right- and bottom-trimmed.
+    Once `cols` is filled in, only those column positions are converted and handed out.
+    """
+    from openpyxl import load_workbook
+
+    wb = load_workbook(full_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        if isinstance(sheet_name, str) and sheet_name:
+            ws = wb[sheet_name]
+        else:
+            ws = wb.worksheets[sheet_name or 0]
+        yield from _ws_raw_rows(ws, cols)
+    finally:
+        wb.close()
+
+def _ws_raw_rows(ws, cols: Optional[list] = None) -> Iterator[list]:
+    """The rows of _iter_sheet_raw_rows for an already opened read_only worksheet."""
+    total = ws.max_row or 0   # from the sheet's <dimension> tag: only good for progress
+    ws.reset_dimensions()
+    blank = 0   # empty rows are held back so trailing ones are dropped, as pd.read_excel does
+    for i, row in enumerate(ws.iter_rows(values_only=True)):
+        if not i % 1000:
+            work_progress(min(0.99, i / total) if total else 0.0)
+        if cols:
+            n = len(row)
+            conv = [_stream_cell(row[i]) if i < n else "" for i in cols]
+        else:
+            conv = [_stream_cell(v) for v in row]
+        while conv and conv[-1] == "":
+            conv.pop()
+        if not conv:
+            blank += 1
+            continue
+        for _ in range(blank):
+            yield []
+        blank = 0
+        yield conv
+
+def _raw_rows_frame(data: List[list], width: int = 0):
+    """Padded raw rows -> object frame through pandas' own TextParser (as pd.read_excel does)."""
+    from pandas.io.parsers import TextParser
+    from pandas.errors import EmptyDataError
+
+    if data:
+        width = max(width, max(len(r) for r in data))
+        data = [r + [""] * (width - len(r)) for r in data]
+    try:
+        return TextParser(data, header=None, dtype=object, skip_blank_lines=False).read()
+    except EmptyDataError:
+        return _pd().DataFrame()
+
+def _read_frame_openpyxl_stream(full_path: str, sheet_name):
+    """
+    openpyxl read_only rows (values only, no cell objects) fed to pandas' own TextParser,
+    the same way pd.read_excel builds its frame, minus the per-cell object overhead.
+    """
+    return _raw_rows_frame(list(_iter_sheet_raw_rows(full_path, sheet_name)))
+
+register_excel_reader("pandas", _read_frame_pandas, (".xlsx", ".xlsm", ".xls", ".xlsb"), priority=0)
+register_excel_reader("pyxlsb", _read_frame_pyxlsb, (".xlsb",),
+                      available=lambda: _module_available("pyxlsb"), priority=10)
+register_excel_reader("openpyxl-stream", _read_frame_openpyxl_stream, (".xlsx", ".xlsm"),
+                      available=lambda: _module_available("openpyxl"),
+                      min_bytes=EXCEL_STREAM_MIN_BYTES, priority=20, rows=_iter_sheet_raw_rows)
+register_excel_reader("calamine", _read_frame_calamine, (".xlsx", ".xlsm", ".xlsb", ".xls"),
+                      available=_calamine_available, priority=30, rows=_iter_calamine_raw_rows)
+
+# ---------- Delimited text (CSV / TSV) ----------
+# ERP exports often come as CSV/TSV instead of a workbook. They go through the same registry:
+# one "sheet" per file, encoding and delimiter sniffed from the first _TEXT_SNIFF_BYTES, every
+# cell kept as text (barcodes keep their leading zeros), ragged rows padded like sheet rows.
+# ';'-separated files come from decimal-comma locales: their price cells read "12,5" / "1.234,50".
+TEXT_TABLE_EXTS = (".csv", ".tsv")
+_TEXT_SNIFF_BYTES = 64 * 1024
+_TEXT_ENCODINGS = ("utf-8", "cp1256", "latin-1")   # cp1256: Arabic Windows exports
+_TEXT_DELIMITERS = ",;\t|"
+
+def is_text_table(path: str) -> bool:
+    return os.path.splitext(path or "")[1].lower() in TEXT_TABLE_EXTS
+
+def sniff_text_table(path: str) -> Tuple[str, str]:
+    """(encoding, delimiter) of a CSV/TSV file, from its BOM / first bytes."""
+    import codecs
+
+    with open(path, "rb") as fh:
+        head = fh.read(_TEXT_SNIFF_BYTES)
+    if head.startswith(codecs.BOM_UTF8):
+        enc = "utf-8-sig"
+    elif head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        enc = "utf-16"
+    else:
+        enc = _TEXT_ENCODINGS[-1]
+        for cand in _TEXT_ENCODINGS:
+            try:
+                # incremental: a multi-byte character cut at the sample end is not an error
+                codecs.getincrementaldecoder(cand)().decode(head, final=False)
+                enc = cand
+                break
+            except UnicodeDecodeError:
+                continue
+    text = codecs.getincrementaldecoder(enc)(errors="replace").decode(head, final=False)
+    lines = [ln for ln in text.splitlines()[:50] if ln.strip()]
+    if len(text) == _TEXT_SNIFF_BYTES and len(lines) > 1:
+        lines.pop()   # probably cut short
+    sep = "\t" if path.lower().endswith(".tsv") else ","
+    try:
+        sep = csv.Sniffer().sniff("\n".join(lines), delimiters=_TEXT_DELIMITERS).delimiter
+    except csv.Error:
+        # no consistent pattern (title lines, ragged rows): most frequent candidate wins
+        counts = {d: sum(ln.count(d) for ln in lines) for d in _TEXT_DELIMITERS}
+        if max(counts.values(), default=0) > 0:
+            sep = max(counts, key=counts.get)
+    return enc, sep
+
+def text_table_decimal_comma(path: str) -> bool:
+    """True for a CSV/TSV sniffed as ';'-separated: its prices use ',' as the decimal separator."""
+    if not is_text_table(path):
+        return False
+    try:
+        return sniff_text_table(path)[1] == ";"
+    except OSError:
+        return False
+
+def _iter_text_raw_rows(full_path: str, sheet_name=None, cols: Optional[list] = None) -> Iterator[list]:
+    """CSV/TSV rows as text cells (csv module, C tokenizer); only `cols` positions once it is filled."""
+    enc, sep = sniff_text_table(full_path)
+    total = os.path.getsize(full_path) or 1
+    with open(full_path, "r", encoding=enc, errors="replace", newline="") as fh:
+        for i, row in enumerate(csv.reader(fh, delimiter=sep)):
+            if not i % 5000:
+                work_progress(min(0.99, fh.buffer.tell() / total))
+            if cols:
+                n = len(row)
+                row = [row[j] if j < n else "" for j in cols]
+            yield row
+
+def _read_frame_text(full_path: str, sheet_name=None):
+    """Whole CSV/TSV as a raw object frame; pandas' C parser, or the row reader for ragged files."""
+    pd = _pd()
+    enc, sep = sniff_text_table(full_path)
+    try:
+        return pd.read_csv(full_path, header=None, dtype=object, sep=sep, encoding=enc,
+                           encoding_errors="replace", skip_blank_lines=False, engine="c")
+    except pd.errors.EmptyDataError:
+        return pd.DataFrame()
+    except pd.errors.ParserError:
+        # a row wider than the first one (title line above the table)
+        return _raw_rows_frame(list(_iter_text_raw_rows(full_path, sheet_name)))
+
+register_excel_reader("csv", _read_frame_text, TEXT_TABLE_EXTS, priority=40, rows=_iter_text_raw_rows)
+
+# ---------- Workbook probe ----------
+# Sheet names and the first rows of each sheet: .xlsx/.xlsm sheet names come straight from
+# xl/workbook.xml in the zip, rows from one openpyxl read_only pass that stops after `nrows`.
+# Opening the workbook still loads its whole shared-strings table (seconds on a large file saved
+# by Excel), so probes run on worker threads only: the date scan, the sheet picker
+# (SheetProbeWorker) and bulk import's first sheet.
+PROBE_ROWS = 200
+PROBE_MAX_SHEETS = 8
+
+def workbook_sheet_names(path: str) -> List[str]:
+    """Sheet names in workbook order ([""] for CSV/TSV: one unnamed sheet)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in TEXT_TABLE_EXTS:
+        return [""]
+    if ext in (".xlsx", ".xlsm"):
+        import zipfile
+        from xml.etree import ElementTree as ET
+        try:
+            with zipfile.ZipFile(path) as zf:
+                root = ET.fromstring(zf.read("xl/workbook.xml"))
+            return [el.get("name", "") for el in root.iter() if el.tag.rsplit("}", 1)[-1] == "sheet"]
+        except (KeyError, zipfile.BadZipFile, ET.ParseError):
+            pass   # unusual producer: let the readers below try
+    if _calamine_available():
+        from python_calamine import CalamineWorkbook
+        wb = CalamineWorkbook.from_path(path)
+        try:
+            return [str(n) for n in wb.sheet_names]
+        finally:
+            wb.close()
+    engine = "pyxlsb" if ext == ".xlsb" and _module_available("pyxlsb") else None
+    with _pd().ExcelFile(path, engine=engine) as xf:
+        return [str(n) for n in xf.sheet_names]
+
+def _probe_frames(path: str, sheets: List[str], nrows: int) -> Iterator[Tuple[str, object]]:
+    """(sheet, first `nrows` raw rows as a header=None object frame); unreadable sheets skipped."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in TEXT_TABLE_EXTS:
+        rows = _iter_text_raw_rows(path)
+        try:
+            yield "", _raw_rows_frame(list(itertools.islice(rows, nrows)))
+        finally:
+            rows.close()
+        return
+    if ext in (".xlsx", ".xlsm") and _module_available("openpyxl"):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+        try:
+            for sheet in sheets:
+                try:
+                    rows = list(itertools.islice(_ws_raw_rows(wb[sheet]), nrows))
+                except (KeyError, AttributeError):
+                    continue   # chartsheet / name mismatch
+                yield sheet, _raw_rows_frame(rows)
+        finally:
+            wb.close()
+        return
+    engine = "calamine" if _calamine_available() else ("pyxlsb" if ext == ".xlsb" else None)
+    for sheet in sheets:
+        try:
+            df = _pd().read_excel(path, sheet_name=sheet, header=None, nrows=nrows, dtype=object, engine=engine)
+        except Exception:
+            continue
+        yield sheet, df
+
+def probe_workbook(path: str, nrows: int = PROBE_ROWS, max_sheets: int = PROBE_MAX_SHEETS) -> List[dict]:
+    """
+    The first `max_sheets` sheets as {"sheet", "frame", "header_row", "headers"}: frame holds the
+    first `nrows` raw rows (header=None, dtype=object), header_row/headers as the import finds them.
+    """
+    out: List[dict] = []
+    with no_work_progress():
+        sheets = workbook_sheet_names(path)[:max(1, int(max_sheets))]
+        for sheet, df in _probe_frames(path, sheets, max(1, int(nrows))):
+            hr = _header_row_index(df) if len(df) else 0
+            out.append({"sheet": sheet, "frame": df, "header_row": hr,
+                        "headers": _header_texts(df, hr) if len(df) else []})
+    return out
 
-    df = pd.read_excel(full_path, sheet_name=sheet_name or 0, header=None, engine=engine, dtype=object)
+def probe_sheet_mappings(path: str) -> List[dict]:
+    """Mapping preview per sheet: probe_workbook entries + "mapping" (mapped fields only)."""
+    out = []
+    for p in probe_workbook(path, nrows=10):
+        p["mapping"] = {k: v for k, v in _automap(p["headers"]).items() if v}
+        out.append(p)
+    return out
 
-    # Detect header row: pick the row (within first 10) with most non-null cells
+def _normalize_column(values: list, fn: Callable) -> List[str]:
+    """
+    fn() over a whole column, evaluated once per distinct cell (keyed by type + value,
+    floats by repr so NaN and -0.0 stay distinct). Same strings as calling fn per cell.
+    """
+    memo: dict = {}
+    out: List[str] = []
+    for v in values:
+        k = (float, repr(v)) if type(v) is float else (type(v), v)
+        try:
+            vv = memo[k]
+        except KeyError:
+            vv = memo[k] = fn(v)
+        except TypeError:  # unhashable cell
+            vv = fn(v)
+        out.append(vv)
+    return out
+
+# ---------- Mapping memo ----------
+# mapping_memo.json remembers the final column mapping per header layout, so a supplier file
+# with last week's headers skips _automap and the content heuristics. The key hashes the header
+# row (case/spacing-insensitive) with Fresh mode and the headers config version; entries keep
+# column positions, so a re-cased header still resolves to the current text. Each entry also
+# keeps a small profile of the mapped columns (share of filled cells, share of those that parse
+# as prices); when a new sample no longer fits it, the layout is inferred again and re-stored.
+# Bulk-import children defer their writes: touched entries go back to the parent, which merges
+# them with merge_mapping_memo and saves the file once.
+MAPPING_MEMO = True
+MAPPING_MEMO_MAX = 500          # entries; least recently used dropped first
+MAPPING_MEMO_CHECK_ROWS = 50
+_MAPPING_MEMO = {"data": None, "defer": False, "dirty": set(), "stale": False}
+_MAPPING_MEMO_LOCK = threading.RLock()
+
+def header_signature(headers_raw: List[str]) -> str:
+    """Layout key: normalized header texts + Fresh mode + headers config version."""
+    hdr = "\x1f".join(" ".join(str(h).split()).casefold() for h in headers_raw)
+    raw = "\x1e".join((hdr, "F" if FRESH_SECTION_ACTIVE else "L", headers_cfg_version()))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+def _mapping_memo() -> dict:
+    with _MAPPING_MEMO_LOCK:
+        if _MAPPING_MEMO["data"] is None:
+            data = _read_json(_mapping_memo_path())
+            _MAPPING_MEMO["data"] = data if isinstance(data, dict) else {}
+        return _MAPPING_MEMO["data"]
+
+def _save_mapping_memo() -> None:
+    if _MAPPING_MEMO["defer"]:
+        return
+    p = _mapping_memo_path()
+    tmp = f"{p}.{os.getpid()}.tmp"
+    with _MAPPING_MEMO_LOCK:
+        _MAPPING_MEMO["stale"] = False
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_mapping_memo(), f, ensure_ascii=False)
+            os.replace(tmp, p)
+        except OSError:
+            try: _remove_quiet(tmp)
+            except OSError: pass
+
+def flush_mapping_memo() -> None:
+    """Write out "used" stamps from memo hits that no real change has saved yet (called at exit)."""
+    if _MAPPING_MEMO["stale"]:
+        _save_mapping_memo()
+
+def _trim_mapping_memo(data: dict) -> None:
+    if len(data) > MAPPING_MEMO_MAX:
+        by_age = sorted(data, key=lambda k: (data[k] or {}).get("used", 0) if isinstance(data[k], dict) else 0)
+        for k in by_age[:len(data) - MAPPING_MEMO_MAX]:
+            data.pop(k, None)
+
+def mapping_memo_updates() -> Dict[str, Optional[dict]]:
+    """Entries touched since the last call ({signature: entry, or None if dropped}); used while deferring."""
+    with _MAPPING_MEMO_LOCK:
+        data = _mapping_memo()
+        out = {sig: data.get(sig) for sig in _MAPPING_MEMO["dirty"]}
+        _MAPPING_MEMO["dirty"].clear()
+    return out
+
+def merge_mapping_memo(updates: Dict[str, Optional[dict]]) -> None:
+    """Apply entries from mapping_memo_updates (another process) and save the memo once."""
+    if not updates:
+        return
+    with _MAPPING_MEMO_LOCK:
+        data = _mapping_memo()
+        for sig, ent in updates.items():
+            if isinstance(ent, dict):
+                data[sig] = ent
+            else:
+                data.pop(sig, None)
+        _trim_mapping_memo(data)
+    _save_mapping_memo()
+
+def _mapping_profile(rows_ll: list, cols) -> Dict[str, list]:
+    """{column index: [filled share, price share of the filled cells]} over the sample rows."""
+    n = len(rows_ll)
+    prof: Dict[str, list] = {}
+    for i in sorted(set(cols)):
+        filled = [t for t in (_excel_cell_text(r[i]) if i < len(r) else "" for r in rows_ll) if t]
+        prices = sum(1 for t in filled if _price_to_float(t) is not None)
+        prof[str(i)] = [round(len(filled) / n, 2) if n else 0.0,
+                        round(prices / len(filled), 2) if filled else 0.0]
+    return prof
+
+def _mapping_profile_fits(then: dict, now: dict) -> bool:
+    for i, (filled0, price0) in then.items():
+        filled1, price1 = now.get(i, (0.0, 0.0))
+        if filled0 >= 0.5 and not filled1:          # a well-filled column came back empty
+            return False
+        if filled0 and filled1 and abs(price0 - price1) > 0.5:   # prices <-> text
+            return False
+    return True
+
+def recall_mapping(headers_raw: List[str], rows_ll: list) -> Optional[Dict[str, Optional[str]]]:
+    """
+    Remembered mapping for this header layout, or None (unknown layout, or the sample rows
+    below the header no longer fit the remembered columns; that entry is then dropped).
+    """
+    if not MAPPING_MEMO or not any(headers_raw):
+        return None
+    sig = header_signature(headers_raw)
+    with _MAPPING_MEMO_LOCK:
+        ent = _mapping_memo().get(sig)
+    if not isinstance(ent, dict):
+        return None
+    try:
+        cols = ent["cols"]
+        mapping = {need: (headers_raw[i] if 0 <= i < len(headers_raw) else None) for need, i in cols.items()}
+        sample = rows_ll[:MAPPING_MEMO_CHECK_ROWS]
+        fits = len(sample) < 5 or _mapping_profile_fits(
+            ent.get("profile") or {}, _mapping_profile(sample, [i for i in cols.values() if i >= 0]))
+    except Exception:
+        fits, mapping = False, None
+    with _MAPPING_MEMO_LOCK:
+        if fits:
+            ent["used"] = time.time()
+            _MAPPING_MEMO["stale"] = True   # saved with the next real change, or at exit
+        else:
+            _mapping_memo().pop(sig, None)
+        if _MAPPING_MEMO["defer"]:
+            _MAPPING_MEMO["dirty"].add(sig)
+    if not fits:
+        _save_mapping_memo()
+    return mapping if fits else None
+
+def remember_mapping(headers_raw: List[str], mapping: Dict[str, Optional[str]], rows_ll: list) -> None:
+    """Store the final mapping for this header layout (replacing any earlier one)."""
+    if not MAPPING_MEMO or not any(headers_raw):
+        return
+    pos = {h: i for i, h in enumerate(headers_raw)}   # same rule as the readers: last duplicate wins
+    cols: Dict[str, int] = {}
+    for need, col in mapping.items():
+        if col is None:
+            cols[need] = -1
+        elif col in pos:
+            cols[need] = pos[col]
+        else:
+            return   # not expressible as a column position: don't remember
+    ent = {"headers": list(headers_raw), "cols": cols, "used": time.time(),
+           "profile": _mapping_profile(rows_ll[:MAPPING_MEMO_CHECK_ROWS], [i for i in cols.values() if i >= 0])}
+    sig = header_signature(headers_raw)
+    with _MAPPING_MEMO_LOCK:
+        data = _mapping_memo()
+        data[sig] = ent
+        if _MAPPING_MEMO["defer"]:
+            _MAPPING_MEMO["dirty"].add(sig)
+        _trim_mapping_memo(data)
+    _save_mapping_memo()
+
+def _header_row_index(df) -> int:
+    """Header row of a raw sheet frame: the row (within the first 10) with most non-null cells."""
     head_span = min(10, len(df))
     best_row = 0
     best_n = -1
@@ -2630,14 +4169,32 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
         if int(n) > best_n:
             best_n = int(n)
             best_row = r
+    return best_row
 
-    headers_raw = [("" if pd.isna(v) else str(v).strip()) for v in df.iloc[best_row].tolist()]
-    mapping = _automap(headers_raw)
-    pos = {h: i for i, h in enumerate(headers_raw)}
+def _header_texts(df, row: int) -> List[str]:
+    pd = _pd()
+    return [("" if pd.isna(v) else str(v).strip()) for v in df.iloc[row].tolist()]
+
+def _excel_frame_mapping(df) -> Tuple[int, List[str], Dict[str, Optional[str]]]:
+    """
+    Header row, raw header texts and inferred column mapping for a raw sheet frame
+    (header=None). Only the first 10 rows and ~400 data rows below the header are looked at.
+    """
+
+    best_row = _header_row_index(df)
+    headers_raw = _header_texts(df, best_row)
 
     # Data frame below header
     data_df = df.iloc[best_row + 1:].reset_index(drop=True)
 
+    # Known layout: reuse the remembered mapping while the data still fits it
+    check_ll = data_df.head(MAPPING_MEMO_CHECK_ROWS).values.tolist() if MAPPING_MEMO else []
+    remembered = recall_mapping(headers_raw, check_ll)
+    if remembered is not None:
+        return best_row, headers_raw, remembered
+
+    mapping = _automap(headers_raw)
+
     # --- AUTO-INFER ADJACENT PRICE COLUMNS IF NEEDED ---
     try:
         need_reg = not (mapping.get("REG") or mapping.get("REGULAR_PRICE"))
@@ -2652,32 +4209,28 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
                 mapping.setdefault("PROMO", infer_pro)
                 mapping.setdefault("REGULAR_PRICE", infer_reg)
                 mapping.setdefault("PROMO_PRICE", infer_pro)
-                pos = {h: i for i, h in enumerate(headers_raw)}  # refresh positions
     except Exception:
         pass
 
+    # BRAND heuristics below share one 400-row sample (object columns blank-filled), parsed once
+    try:
+        tmp_brand = data_df.head(400).copy()
+        obj_cols = tmp_brand.select_dtypes(include=["object"]).columns
+        tmp_brand[obj_cols] = tmp_brand[obj_cols].fillna("")
+        tmp_brand = tmp_brand.infer_objects(copy=False)
+        brand_ll = tmp_brand.values.tolist()
+        brand_sample = ColumnSample(brand_ll, len(headers_raw))
+    except Exception:
+        brand_ll, brand_sample = [], None
+
     # --- BRAND via ITEM prefix match (only if automap didn't set BRAND) ---
     try:
         if not mapping.get("BRAND"):
-            tmp_brand = data_df.head(400).copy()
-            obj_cols = tmp_brand.select_dtypes(include=["object"]).columns
-            tmp_brand[obj_cols] = tmp_brand[obj_cols].fillna("")
-            tmp_brand = tmp_brand.infer_objects(copy=False)
-            sample_ll = tmp_brand.values.tolist()
-
-            if headers_raw and sample_ll:
+            if headers_raw and brand_ll:
                 def _norm_text(x: str) -> str:
                     s = "" if x is None else str(x).strip().lower()
                     toks = re.findall(r"[a-z0-9]+", s)
                     return " ".join(toks)
-                def _first_words(s: str, k: int) -> str:
-                    toks = re.findall(r"[a-z0-9]+", ("" if s is None else str(s)).lower())
-                    return " ".join(toks[:k])
-                def _looks_like_time_or_date(h: str) -> bool:
-                    return bool(re.match(
-                        r"^\s*(?:\d{1,2}:\d{2}\s*(?:am|pm)|\d{1,2}/\d{1,2}/\d{2,4}|\d{1,2}-\d{1,2}-\d{2,4})\s*$",
-                        ("" if h is None else str(h)).strip(), flags=re.IGNORECASE
-                    ))
 
                 item_like_keys = ("ENGLISH_DESCRIPTION","DESCRIPTION","ITEM","ITEM_DESCRIPTION","PRODUCT","PRODUCT_DESCRIPTION","NAME","ITEM NAME","ITEMNAME")
                 item_idx = -1
@@ -2697,48 +4250,20 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
                         if item_idx >= 0: break
 
                 if item_idx >= 0:
-                    col_hits = [0] * len(headers_raw)
-                    col_comparables = [0] * len(headers_raw)
-                    for r in sample_ll:
-                        if item_idx >= len(r): continue
-                        item_cell = r[item_idx]
-                        p1 = _first_words(item_cell, 1)
-                        p2 = _first_words(item_cell, 2)
-                        if not p1 and not p2: continue
-                        for j in range(len(headers_raw)):
-                            if j == item_idx or _looks_like_time_or_date(headers_raw[j]): continue
-                            vv = _norm_text("" if j >= len(r) else r[j])
-                            if not vv: continue
-                            col_comparables[j] += 1
-                            if vv == p1 or vv == p2: col_hits[j] += 1
-                    best_j, best_hits, best_comp = -1, -1, 0
-                    for j in range(len(headers_raw)):
-                        comp = col_comparables[j]
-                        if comp >= 10:
-                            hits = col_hits[j]
-                            ratio = hits / comp if comp else 0.0
-                            if ratio >= 0.40 and hits > best_hits:
-                                best_hits, best_comp, best_j = hits, comp, j
+                    best_j = _brand_prefix_column(headers_raw, brand_sample, item_idx)
                     if best_j >= 0:
                         mapping["BRAND"] = headers_raw[best_j]
-                        pos = {h: i for i, h in enumerate(headers_raw)}
     except Exception:
         pass
 
     # --- BRAND validation + content-based fallback ---
     try:
-        tmp2 = data_df.head(400).copy()
-        obj_cols = tmp2.select_dtypes(include=["object"]).columns
-        tmp2[obj_cols] = tmp2[obj_cols].fillna("")
-        tmp2 = tmp2.infer_objects(copy=False)
-        _sample_ll = tmp2.values.tolist()
         brand_hdr = mapping.get("BRAND")
-        brand_ok = _is_plausible_brand_mapping(headers_raw, _sample_ll, brand_hdr)
+        brand_ok = _is_plausible_brand_mapping(headers_raw, brand_ll, brand_hdr, sample=brand_sample)
         if not brand_ok:
-            inferred = _infer_brand_column(headers_raw, _sample_ll)
+            inferred = _infer_brand_column(headers_raw, brand_ll, sample=brand_sample)
             if inferred:
                 mapping["BRAND"] = inferred
-                pos = {h: i for i, h in enumerate(headers_raw)}
     except Exception:
         pass
 
@@ -2753,60 +4278,92 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
     except Exception:
         pass
 
-    # Light UOM normalizer
-    def _norm_uom(val: str) -> str:
-        s = ("" if val is None else str(val)).strip()
-        if not s:
-            return ""
-        s_low = s.lower()
-        # drop pandas/null markers
-        if s_low in {"nan", "none", "null", "n/a", "na", "-", "--"}:
-            return ""
-        # normalize common spellings/abbreviations
-        table = {
-            "kg": "KG", "kgs": "KG", "kgm": "KG",
-            "packet": "PACKET", "pac": "PACKET", "pckt": "PACKET", "pack": "PACKET",
-            "ctn": "CTN", "carton": "CTN", "cartons": "CTN",
-        }
-        s_low = s_low.replace(".", "").replace(",", " ").strip()
-        if s_low in table:
-            return table[s_low]
-        for t in ("kgm", "kg", "packet", "pac", "pckt", "ctn"):
-            if t in s_low:
-                return table.get(t, t.upper())
-        return s.upper()
+    remember_mapping(headers_raw, mapping, check_ll)
+    return best_row, headers_raw, mapping
+
+# Light UOM normalizer
+def _norm_uom_text(val: str) -> str:
+    s = ("" if val is None else str(val)).strip()
+    if not s:
+        return ""
+    s_low = s.lower()
+    # drop pandas/null markers
+    if s_low in {"nan", "none", "null", "n/a", "na", "-", "--"}:
+        return ""
+    # normalize common spellings/abbreviations
+    table = {
+        "kg": "KG", "kgs": "KG", "kgm": "KG",
+        "packet": "PACKET", "pac": "PACKET", "pckt": "PACKET", "pack": "PACKET",
+        "ctn": "CTN", "carton": "CTN", "cartons": "CTN",
+    }
+    s_low = s_low.replace(".", "").replace(",", " ").strip()
+    if s_low in table:
+        return table[s_low]
+    for t in ("kgm", "kg", "packet", "pac", "pckt", "ctn"):
+        if t in s_low:
+            return table.get(t, t.upper())
+    return s.upper()
+
+def _excel_cell_text(v) -> str:
+    return "" if (v is None or (isinstance(v, float) and v != v)) else str(v).strip()
+
+_DECIMAL_COMMA_RE = re.compile(r"\s*((?i:aed)\s*)?([+-]?(?:\d{1,3}(?:\.\d{3})+|\d*))(?:,(\d+))?\s*")
+
+def price_text_decimal_comma(v) -> str:
+    """price_text for decimal-comma cells ("12,5", "AED 1.234,50", "1.100" = 1100); others as price_text."""
+    if isinstance(v, str):
+        m = _DECIMAL_COMMA_RE.fullmatch(v)
+        if m and (m.group(3) or "." in m.group(2)):
+            frac = f".{m.group(3)}" if m.group(3) else ""
+            v = f"{m.group(1) or ''}{m.group(2).replace('.', '')}{frac}"
+    return price_text(v)
+
+def _excel_converter(need: str, decimal_comma: bool = False) -> Callable:
+    if need == "BARCODE":
+        return clean_barcode
+    if need in ("REG", "PROMO", "COOP", "REGULAR_PRICE", "PROMO_PRICE"):
+        return price_text_decimal_comma if decimal_comma else price_text
+    if need in ("START_DATE", "END_DATE"):
+        return date_only
+    if need == "UOM":
+        return _norm_uom_text
+    return _excel_cell_text  # PLU, descriptions, BRAND/ITEM/SECTION, ...
+
+def _excel_frame_records(data_df, headers_raw: List[str], mapping: Dict[str, Optional[str]],
+                         decimal_comma: bool = False) -> List[LabelRecord]:
+    """Records for the data rows below the header, normalized column-wise (see text_table_decimal_comma)."""
+    pos = {h: i for i, h in enumerate(headers_raw)}
 
+    # Column-wise: convert each mapped column once (per distinct cell value), then zip into rows
+    n_rows, n_cols = data_df.shape
+    raw_cols: Dict[int, list] = {}
+    out_cols: List[Tuple[str, List[str]]] = []
+    for need, col in mapping.items():
+        i = pos.get(col, -1)
+        fn = _excel_converter(need, decimal_comma)
+        if 0 <= i < n_cols:
+            if i not in raw_cols:
+                raw_cols[i] = data_df.iloc[:, i].tolist()
+            out_cols.append((need, _normalize_column(raw_cols[i], fn)))
+        else:
+            out_cols.append((need, [fn("")] * n_rows))
 
+    # One shared record schema: mapped fields + the keys set below / by _finalize_import
+    sch = record_schema([need for need, _ in out_cols] + ["UOM", "COOP", "BARCODE", "BRAND", "SOURCE_FILE", "SOURCE_SHEET"])
+    tail = [_UNSET] * (len(sch.keys) - len(out_cols))
+    uom_memo: Dict[str, str] = {}
     rows: List[Dict[str, str]] = []
-    for _, row in data_df.iterrows():
-        rec: Dict[str, str] = {}
-        any_val = False
-        for need, col in mapping.items():
-            i = pos.get(col, -1)
-            v = row.iloc[i] if (0 <= i < len(row)) else ""
-            if need == "BARCODE":
-                vv = clean_barcode(v)
-            elif need in ("REG","PROMO","COOP"):
-                vv = price_text(v)
-            elif need in ("START_DATE","END_DATE"):
-                vv = date_only(v)
-            elif need == "PLU":
-                vv = "" if (v is None or (isinstance(v, float) and pd.isna(v))) else str(v).strip()
-            elif need in ("REGULAR_PRICE","PROMO_PRICE"):
-                vv = price_text(v)
-            elif need in ("ARABIC_DESCRIPTION","ENGLISH_DESCRIPTION"):
-                vv = "" if (v is None or (isinstance(v, float) and pd.isna(v))) else str(v).strip()
-            elif need == "UOM":
-                vv = _norm_uom(v)
-            else:
-                vv = "" if (v is None or (isinstance(v, float) and pd.isna(v))) else str(v).strip()
-            rec[need] = vv
-            any_val = any_val or bool(vv)
+    for r in range(n_rows):
+        vals_r = [vals[r] for _, vals in out_cols]
+        any_val = any(vals_r)
+        rec = LabelRecord(sch, vals_r + tail)
 
         # If UOM column is missing/empty, try a light inference from descriptions
         if not rec.get("UOM"):
             guess_src = " ".join([rec.get("ENGLISH_DESCRIPTION",""), rec.get("ARABIC_DESCRIPTION","")]).strip()
-            rec["UOM"] = _norm_uom(guess_src)
+            if guess_src not in uom_memo:
+                uom_memo[guess_src] = _norm_uom_text(guess_src)
+            rec["UOM"] = uom_memo[guess_src]
 
         # >>> ADD: ensure Fresh UOM has "/ " and mirror to COOP (dedup slashes)
         if FRESH_SECTION_ACTIVE:
@@ -2828,6 +4385,103 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
         if any_val:
             rows.append(rec)
 
+    return rows
+
+# ---------- Two-phase read (column pruning) ----------
+# Only the mapped columns end up in the records, but wide supplier sheets carry dozens of others.
+# Backends with a row reader parse the first _EXCEL_HEAD_ROWS rows in full (header search plus
+# the inference samples), then hand out only the mapped columns of every later row, so those
+# never go through cell conversion or TextParser.
+EXCEL_PRUNE_COLUMNS = True
+_EXCEL_HEAD_ROWS = 10 + 400   # header search window + largest inference sample
+
+def _mapped_columns(headers_raw: List[str], mapping: Dict[str, Optional[str]]) -> List[int]:
+    """Column positions _excel_frame_records reads for `mapping`."""
+    pos = {h: i for i, h in enumerate(headers_raw)}
+    return sorted({pos[c] for c in mapping.values() if c in pos})
+
+def _excel_raw_records(raw: Iterator[list], cols: Optional[list] = None, chunk_rows: Optional[int] = None,
+                       info: Optional[dict] = None, decimal_comma: bool = False
+                       ) -> Iterator[Tuple[List[LabelRecord], Dict[str, Optional[str]]]]:
+    """
+    Records from raw sheet rows: header + mapping from the first _EXCEL_HEAD_ROWS rows (all columns),
+    then the rest in chunks of `chunk_rows` (None: one chunk). If `raw` was opened with `cols`, it is
+    filled with the mapped column positions after the head so later rows arrive pruned.
+    Yields (records, mapping), head first; `info` gets rows / cols / read_cols.
+    """
+    head = list(itertools.islice(raw, _EXCEL_HEAD_ROWS))
+    head_df = _raw_rows_frame(head)
+    best_row, headers_raw, mapping = _excel_frame_mapping(head_df)
+    n_raw = len(head)
+    headers, width = headers_raw, len(headers_raw)
+    if cols is not None and EXCEL_PRUNE_COLUMNS:
+        cols[:] = _mapped_columns(headers_raw, mapping)
+        headers, width = [headers_raw[i] for i in cols], len(cols)
+    if info is not None:
+        info.update(cols=len(headers_raw), read_cols=width)
+    yield _excel_frame_records(head_df.iloc[best_row + 1:].reset_index(drop=True), headers_raw, mapping,
+                               decimal_comma), mapping
+
+    buf: List[list] = []
+    for row in raw:
+        buf.append(row)
+        if chunk_rows and len(buf) >= chunk_rows:
+            n_raw += len(buf)
+            yield _excel_frame_records(_raw_rows_frame(buf, width), headers, mapping, decimal_comma), mapping
+            buf = []
+    if buf:
+        n_raw += len(buf)
+        yield _excel_frame_records(_raw_rows_frame(buf, width), headers, mapping, decimal_comma), mapping
+    if info is not None:
+        info["rows"] = n_raw
+
+def _excel_rows_reader(full_path: str) -> Tuple[str, Optional[Callable]]:
+    """(picked backend, its row reader or None)."""
+    name = pick_excel_reader(full_path)
+    for b in _EXCEL_READERS:
+        if b["name"] == name:
+            return name, b["rows"]
+    return name, None
+
+def _read_excel_pruned(full_path: str, sheet_name, stats: Optional[dict] = None):
+    """(rows, mapping) through the two-phase row reader, or None if the backend has none / it failed."""
+    name, rows_fn = _excel_rows_reader(full_path)
+    if rows_fn is None or not EXCEL_PRUNE_COLUMNS:
+        return None
+    t0 = time.perf_counter()
+    cols: list = []
+    info: dict = {}
+    raw = rows_fn(full_path, sheet_name, cols)
+    try:
+        parts = list(_excel_raw_records(raw, cols, None, info, text_table_decimal_comma(full_path)))
+    except Exception as e:
+        if stats is not None:
+            stats["fallback_from"] = f"{name}: {type(e).__name__}: {e}"
+        return None
+    finally:
+        raw.close()
+    rows = [r for part, _ in parts for r in part]
+    if stats is not None:
+        stats.update(backend=name, seconds=round(time.perf_counter() - t0, 3), **info)
+    return rows, parts[0][1]
+
+def _read_excel_fast(full_path: str, sheet_name: Optional[str], stats: Optional[dict] = None) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
+    """
+    Fast import via the Excel reader backends (calamine / openpyxl stream / pyxlsb / pandas).
+    Fresh-mode aware: maps PLU, ARABIC_DESCRIPTION, ENGLISH_DESCRIPTION, REGULAR_PRICE, PROMO_PRICE.
+    Also detects optional UOM column (UOM/UNIT/UNIT OF MEASURE); if not present, attempts a light inference.
+    `stats` (optional dict) receives the backend that ran and its timing.
+    """
+    if not full_path or not os.path.exists(full_path):
+        raise FileNotFoundError(f"Excel not found: {full_path}")
+
+    pruned = _read_excel_pruned(full_path, sheet_name, stats)
+    if pruned is not None:
+        return pruned
+    df = read_sheet_frame(full_path, sheet_name, stats)
+    best_row, headers_raw, mapping = _excel_frame_mapping(df)
+    rows = _excel_frame_records(df.iloc[best_row + 1:].reset_index(drop=True), headers_raw, mapping,
+                                text_table_decimal_comma(full_path))
     return rows, mapping
 
 # === CHUNK 2: post-process wrapper for _read_excel_fast ===
@@ -2835,42 +4489,452 @@ def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Di
 # Keep a reference to the original implementation
 __orig__read_excel_fast = _read_excel_fast
 
-def _read_excel_fast(full_path: str, sheet_name: Optional[str]) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
+def _read_excel_fast(full_path: str, sheet_name: Optional[str], stats: Optional[dict] = None) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
     """
     Wrapper that calls the original _read_excel_fast, then ensures
     ITEM, BRAND, UOM have English letters uppercased only (Arabic/other scripts unchanged).
     """
-    rows, mapping = __orig__read_excel_fast(full_path, sheet_name)
+    rows, mapping = __orig__read_excel_fast(full_path, sheet_name, stats)
+    return _upper_english_fields(rows), mapping
+
+def _upper_english_fields(rows: list) -> list:
+    # once per distinct text: rows repeating a brand/item/UOM share one string instead of a copy each
+    memo: Dict[tuple, str] = {}
+
+    def up(v):
+        k = (type(v), v)   # 1 / 1.0 / True stay apart
+        try:
+            return memo[k]
+        except KeyError:
+            out = memo[k] = _upper_english(v)
+            return out
+        except TypeError:   # unhashable cell
+            return _upper_english(v)
+
     for rec in rows:
-        if isinstance(rec, dict):
-            rec["ITEM"]  = _upper_english(rec.get("ITEM", ""))
-            rec["BRAND"] = _upper_english(rec.get("BRAND", ""))
-            rec["UOM"]   = _upper_english(rec.get("UOM", ""))
+        if isinstance(rec, MutableMapping):
+            rec["ITEM"]  = up(rec.get("ITEM", ""))
+            rec["BRAND"] = up(rec.get("BRAND", ""))
+            rec["UOM"]   = up(rec.get("UOM", ""))
+    return rows
+
+# ---------- parsed-workbook cache ----------
+# parse_cache/<name>.bin holds the rows + mapping _read_excel_fast produced for one sheet:
+# magic + JSON header + one dictionary-encoded block per field (uint32 row -> value index,
+# then the distinct values packed like the search snapshot), plus a presence mask for
+# fields that are unset on some rows. <name> hashes path/sheet/Fresh mode,
+# so a changed file overwrites its old entry; the header carries mtime/size, the headers
+# config version and PARSE_CACHE_VERSION, and a mismatch is a miss. Hits bump the file's
+# mtime; the directory is kept under PARSE_CACHE_MAX_BYTES, least recently used out first.
+# Bulk-import children only read the cache: new entries are handed back and stored by the parent.
+PARSE_CACHE = True
+PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+PARSE_CACHE_VERSION = 2        # bump when the reader's output changes
+_PARSE_CACHE_MAGIC = b"PLPARSE2"
+_PARSE_CACHE_DEFER = {"on": False, "pending": []}   # (key, mapping) not stored while deferring
+
+def _parse_cache_dir() -> Path:
+    d = _db_dir() / "parse_cache"
+    d.mkdir(parents=True, exist_ok=True)
+    return d
+
+def _parse_cache_key(full_path: str, sheet_name) -> Optional[dict]:
+    """Identity of one parse, or None if the file can't be stat'ed (or caching is off)."""
+    if not PARSE_CACHE:
+        return None
+    try:
+        real = os.path.realpath(full_path)
+        st = os.stat(real)
+    except OSError:
+        return None
+    return {"path": os.path.normcase(real), "sheet": "" if sheet_name is None else str(sheet_name),
+            "fresh": bool(FRESH_SECTION_ACTIVE), "mtime_ns": st.st_mtime_ns, "size": st.st_size,
+            "cfg": headers_cfg_version(), "version": PARSE_CACHE_VERSION}
+
+def _parse_cache_file(key: dict) -> Path:
+    raw = "\x1f".join((key["path"], key["sheet"], "F" if key["fresh"] else "L"))
+    return _parse_cache_dir() / (hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20] + ".bin")
+
+def store_parsed_workbook(key: dict, rows: list, mapping: dict) -> bool:
+    """Write one cache entry (then trim the cache). False if the rows can't be packed."""
+    keys: List[str] = list(getattr(getattr(rows[0], "_schema", None), "keys", ())) if rows else []
+    seen = set(keys)
+    for r in rows:
+        for k in r:
+            if k not in seen:
+                seen.add(k)
+                keys.append(k)
+    blocks = []
+    try:
+        for k in keys:
+            vals = [r.get(k, _UNSET) for r in rows]
+            mask = bytes(0 if v is _UNSET else 1 for v in vals)
+            if 0 in mask:
+                vals = ["" if v is _UNSET else v for v in vals]
+            else:
+                mask = b""
+            distinct: Dict[str, int] = {}
+            idx = array("I", [distinct.setdefault(v, len(distinct)) for v in vals]).tobytes()
+            blocks.append((k, mask, idx) + _pack_block(list(distinct)))
+    except TypeError:   # non-text value somewhere: leave this sheet uncached
+        return False
+    header = json.dumps({
+        "key": key, "n": len(rows), "mapping": mapping, "keys": keys,
+        "blocks": [[k, len(m), len(i), len(o), len(d)] for k, m, i, o, d in blocks],
+    }, ensure_ascii=False).encode("utf-8")
+    p = _parse_cache_file(key)
+    tmp = f"{p}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as f:
+            f.write(_PARSE_CACHE_MAGIC + struct.pack("<I", len(header)))
+            f.write(header)
+            for _k, m, i, o, d in blocks:
+                f.write(m)
+                f.write(i)
+                f.write(o)
+                f.write(d)
+        os.replace(tmp, p)
+    except OSError:
+        _remove_quiet(tmp)
+        return False
+    _trim_parse_cache(keep=p)
+    return True
+
+def load_parsed_workbook(key: dict) -> Optional[Tuple[list, dict]]:
+    """(rows, mapping) for `key`, or None on a miss / stale or unreadable entry."""
+    p = _parse_cache_file(key)
+    try:
+        with open(p, "rb") as f:
+            buf = f.read()
+        m = len(_PARSE_CACHE_MAGIC)
+        if buf[:m] != _PARSE_CACHE_MAGIC:
+            return None
+        (hlen,) = struct.unpack_from("<I", buf, m)
+        pos = m + 4
+        header = json.loads(buf[pos:pos + hlen].decode("utf-8"))
+        if header.get("key") != key:
+            return None
+        pos += hlen
+        n = int(header["n"])
+        cols = []
+        for k, mlen, ilen, olen, dlen in header["blocks"]:
+            mask = buf[pos:pos + mlen]
+            idx = array("I")
+            idx.frombytes(buf[pos + mlen:pos + mlen + ilen])
+            pos += mlen + ilen
+            distinct = _unpack_block(buf[pos:pos + olen], buf[pos + olen:pos + olen + dlen])
+            pos += olen + dlen
+            vals = [distinct[i] for i in idx]
+            if mlen:
+                vals = [v if mask[i] else _UNSET for i, v in enumerate(vals)]
+            cols.append(vals)
+    except Exception:
+        return None
+    try:
+        os.utime(p)   # LRU: most recently used = newest mtime
+    except OSError:
+        pass
+    sch = record_schema(header["keys"])
+    rows = [LabelRecord(sch, list(vals)) for vals in zip(*cols)] if cols else [LabelRecord(sch, []) for _ in range(n)]
+    return rows, header.get("mapping") or {}
+
+def _trim_parse_cache(keep: Optional[Path] = None) -> None:
+    try:
+        entries = []
+        for e in os.scandir(_parse_cache_dir()):
+            if e.name.endswith(".bin") and e.is_file():
+                st = e.stat()
+                entries.append((st.st_mtime_ns, st.st_size, e.path))
+    except OSError:
+        return
+    total = sum(sz for _, sz, _ in entries)
+    for _, sz, path in sorted(entries):
+        if total <= PARSE_CACHE_MAX_BYTES:
+            break
+        if keep is not None and os.path.basename(path) == keep.name:
+            continue
+        _remove_quiet(path)
+        total -= sz
+
+def clear_parse_cache() -> None:
+    try:
+        for e in os.scandir(_parse_cache_dir()):
+            if e.name.endswith(".bin") or e.name.endswith(".tmp"):
+                _remove_quiet(e.path)
+    except OSError:
+        pass
+
+__orig__read_excel_fast_uncached = _read_excel_fast
+
+def _read_excel_fast(full_path: str, sheet_name: Optional[str], stats: Optional[dict] = None) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
+    """_read_excel_fast behind the parsed-workbook cache (stats backend "cache" on a hit)."""
+    t0 = time.perf_counter()
+    key = _parse_cache_key(full_path, sheet_name)
+    hit = load_parsed_workbook(key) if key else None
+    if hit is not None:
+        if stats is not None:
+            stats.update(backend="cache", seconds=round(time.perf_counter() - t0, 3), rows=len(hit[0]))
+        return hit
+    rows, mapping = __orig__read_excel_fast_uncached(full_path, sheet_name, stats)
+    if key and _PARSE_CACHE_DEFER["on"]:
+        _PARSE_CACHE_DEFER["pending"].append((key, mapping))
+    elif key:
+        store_parsed_workbook(key, rows, mapping)
     return rows, mapping
 
+# ---------- Streaming import ----------
+# Connect / Recent Downloads hand rows to the Excel grid while the sheet is still being read.
+# .xlsx/.xlsm stream through openpyxl read_only and CSV/TSV through the csv module: the header
+# and mapping come from the first _EXCEL_HEAD_ROWS rows, then every EXCEL_STREAM_CHUNK_ROWS rows
+# go through the same column-wise normalizer. Other files are read whole and then handed out in chunks.
+EXCEL_STREAM_IMPORT = True
+EXCEL_STREAM_CHUNK_ROWS = 2000
+
+def _stream_rows_reader(full_path: str) -> Tuple[str, Optional[Callable]]:
+    """(backend, row reader) iter_excel_fast streams through, or ("", None) to read the sheet whole."""
+    ext = os.path.splitext(full_path)[1].lower()
+    if ext in TEXT_TABLE_EXTS:
+        return "csv", _iter_text_raw_rows
+    if (ext in (".xlsx", ".xlsm") and EXCEL_READER_FORCE in ("", "openpyxl-stream")
+            and _module_available("openpyxl")):
+        return "openpyxl-stream", _iter_sheet_raw_rows
+    return "", None
+
+def _can_stream_sheet(full_path: str) -> bool:
+    return _stream_rows_reader(full_path)[1] is not None
+
+def iter_excel_fast(full_path: str, sheet_name: Optional[str], stats: Optional[dict] = None,
+                    chunk_rows: Optional[int] = None, cache: bool = True
+                    ) -> Iterator[Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]]:
+    """
+    _read_excel_fast in pieces: yields (rows, mapping) as the sheet is read. The first chunk
+    carries the rows under the header; the mapping is the same object in every chunk.
+    cache=False skips the parse cache, so streamed rows are not kept around (see import_table_to_db).
+    """
+    if not full_path or not os.path.exists(full_path):
+        raise FileNotFoundError(f"Excel not found: {full_path}")
+    chunk_rows = max(1, int(chunk_rows or EXCEL_STREAM_CHUNK_ROWS))
+
+    t0 = time.perf_counter()
+    backend, rows_fn = _stream_rows_reader(full_path)
+    key = _parse_cache_key(full_path, sheet_name) if rows_fn is not None and cache else None
+    hit = load_parsed_workbook(key) if key else None
+    if hit is not None and stats is not None:
+        stats.update(backend="cache", seconds=round(time.perf_counter() - t0, 3), rows=len(hit[0]))
+    if hit is not None or rows_fn is None:
+        rows, mapping = hit or _read_excel_fast(full_path, sheet_name, stats)
+        for i in range(0, max(1, len(rows)), chunk_rows):
+            yield rows[i:i + chunk_rows], mapping
+        return
 
-class ExcelFastImportWorker(QThread):
+    n_rows = 0
+    done: list = []   # copies for the parse cache (callers may tag yielded rows in place)
+    info: dict = {}
+    cols: list = []
+    raw = rows_fn(full_path, sheet_name, cols)
+    try:
+        for rows, mapping in _excel_raw_records(raw, cols, chunk_rows, info, text_table_decimal_comma(full_path)):
+            if stats is not None and "first_rows_seconds" not in stats:
+                stats["first_rows_seconds"] = round(time.perf_counter() - t0, 3)
+            n_rows += len(rows)
+            rows = _upper_english_fields(rows)
+            if key:
+                done.extend(r.copy() for r in rows)
+            yield rows, mapping
+    finally:
+        raw.close()
+    if stats is not None:
+        stats.update(backend=backend, seconds=round(time.perf_counter() - t0, 3), rows=n_rows,
+                     cols=info.get("cols"), read_cols=info.get("read_cols"))
+    if key:
+        store_parsed_workbook(key, done, mapping)
+
+# ---------- Clipboard ranges ----------
+# A block copied from Excel arrives as TSV (cells with tabs/newlines quoted). When its first lines
+# hold a header the column mapping recognizes, it is imported like a sheet: same header search,
+# inference, normalization and pruning, no temp workbook. Anything else stays a token list.
+CLIPBOARD_TABLE_IMPORT = True
+CLIPBOARD_SOURCE_NAME = "Clipboard"   # SOURCE_FILE of pasted rows (kept by DB pruning like a file)
+
+def looks_like_sheet_paste(text: str) -> bool:
+    """True if one of the first 10 lines is a tab-separated header mapping 2+ fields."""
+    if not CLIPBOARD_TABLE_IMPORT or "\t" not in (text or "")[:_TEXT_SNIFF_BYTES]:
+        return False
+    for line in text.splitlines()[:10]:
+        cells = [c.strip() for c in line.split("\t")]
+        if len(cells) > 1 and sum(1 for v in _automap(cells).values() if v) >= 2:
+            return True
+    return False
+
+def _iter_clipboard_raw_rows(text: str, cols: Optional[list] = None) -> Iterator[list]:
+    import io
+
+    total = len(text) or 1
+    buf = io.StringIO(text, newline="")
+    for i, row in enumerate(csv.reader(buf, delimiter="\t")):
+        if not i % 5000:
+            work_progress(min(0.99, buf.tell() / total))
+        if cols:
+            n = len(row)
+            row = [row[j] if j < n else "" for j in cols]
+        yield row
+
+def read_clipboard_table(text: str, stats: Optional[dict] = None) -> Tuple[List[Dict[str, str]], Dict[str, Optional[str]]]:
+    """(rows, mapping) from a TSV range, as _read_excel_fast would give for the same sheet."""
+    t0 = time.perf_counter()
+    cols: list = []
+    info: dict = {}
+    parts = list(_excel_raw_records(_iter_clipboard_raw_rows(text, cols), cols, None, info))
+    rows = _upper_english_fields([r for part, _ in parts for r in part])
+    if stats is not None:
+        stats.update(backend="clipboard", seconds=round(time.perf_counter() - t0, 3), **info)
+    return rows, parts[0][1]
+
+# ---------- Large CSV/TSV straight into the DB ----------
+# A multi-million-row export would not fit in the Excel grid anyway: from TEXT_DIRECT_DB_MIN_BYTES
+# up, every streamed chunk is normalized (once), classified and upserted on its own, then dropped.
+TEXT_DIRECT_DB_MIN_BYTES = 64 * 1024 * 1024
+TEXT_DIRECT_DB_CHUNK_ROWS = 20000
+
+def prepare_import_rows(rows, file_name: str, sheet_name: str) -> None:
+    """Normalize imported rows and tag their source, in place."""
+    for r in rows:
+        r["BARCODE"] = clean_barcode(r.get("BARCODE", ""))
+        for p in ("REG", "PROMO", "COOP", "REGULAR_PRICE", "PROMO_PRICE"):
+            r[p] = price_text(r.get(p, ""))
+        for d in ("START_DATE", "END_DATE"):
+            r[d] = date_only(r.get(d, ""))
+        r["SOURCE_FILE"]  = file_name
+        r["SOURCE_SHEET"] = sheet_name
+
+def wants_direct_db_import(full_path: str) -> bool:
+    try:
+        return is_text_table(full_path) and os.path.getsize(full_path) >= TEXT_DIRECT_DB_MIN_BYTES
+    except OSError:
+        return False
+
+def import_table_to_db(full_path: str, sheet_name: str, file_name: str, stats: Optional[dict] = None,
+                       summary: Optional[dict] = None, chunk_rows: Optional[int] = None) -> dict:
+    """
+    Stream a sheet into the DB one chunk at a time; only the running counts are kept.
+    `summary` (updated in place, so it is still valid after a cancel): rows, saved, delta, mapping.
+    """
+    summary = {} if summary is None else summary
+    summary.update(rows=0, saved=0, mapping={},
+                   delta=dict.fromkeys((DELTA_NEW, DELTA_PRICE, DELTA_DATE, DELTA_SAME), 0))
+    # one search-snapshot rebuild for the whole import (also after a cancel), not one per chunk
+    with db_snapshot_deferred():
+        for rows, mapping in iter_excel_fast(full_path, sheet_name or None, stats,
+                                             chunk_rows or TEXT_DIRECT_DB_CHUNK_ROWS, cache=False):
+            check_cancelled()
+            # the reader already cleaned barcodes/prices/dates: tag the source, then the DB normalization
+            for r in rows:
+                r["SOURCE_FILE"] = file_name
+                r["SOURCE_SHEET"] = sheet_name
+            staged = normalize_db_rows(rows)
+            for st in classify_import_delta(staged, normalized=True):
+                summary["delta"][st] += 1
+            upsert_db_rows(staged, normalized=True)
+            summary["rows"] += len(rows)
+            summary["saved"] += sum(1 for b in staged if b is not None)
+            summary["mapping"] = mapping
+    return summary
+
+
+class ExcelFastImportWorker(ProgressWorker):
         finished_ok = Signal(list, dict)   # rows, mapping
-        failed = Signal(Exception)
+        rows_chunk = Signal(list, dict)    # stream=True: next rows as they are read, mapping
+        failed = Signal(Exception)         # (+ fraction / cancelled, see ProgressWorker)
 
-        def __init__(self, full_path: str, sheet_name: Optional[str]):
+        def __init__(self, full_path: str, sheet_name: Optional[str], stream: bool = False):
             super().__init__()
             self._full = full_path
             self._sheet = sheet_name
+            self._stream = stream
+            self.stats: dict = {}   # reader backend + timing (see read_sheet_frame)
 
-        def run(self):
+        def work(self):
             try:
-                rows, mapping = _read_excel_fast(self._full, self._sheet)
+                if self._stream:
+                    rows: list = []
+                    mapping: dict = {}
+                    for chunk, mapping in iter_excel_fast(self._full, self._sheet, self.stats):
+                        check_cancelled()
+                        rows.extend(chunk)
+                        self.rows_chunk.emit(chunk, mapping)
+                    self.finished_ok.emit(rows, mapping)
+                    return
+                rows, mapping = _read_excel_fast(self._full, self._sheet, self.stats)
+                check_cancelled()
                 self.finished_ok.emit(rows, mapping)
             except Exception as e:
                 self.failed.emit(e) 
+
+class SheetProbeWorker(ProgressWorker):
+    """
+    probe_sheet_mappings on a thread for the import's sheet choice ([] for a one-sheet workbook).
+    Opening the workbook can't be interrupted: Cancel takes effect once it is open.
+    """
+    finished_ok = Signal(list)   # probe_sheet_mappings entries
+    failed = Signal(Exception)
+
+    def __init__(self, full_path: str):
+        super().__init__()
+        self._full = full_path
+
+    def work(self):
+        try:
+            probes = probe_sheet_mappings(self._full) if len(workbook_sheet_names(self._full)) > 1 else []
+            check_cancelled()
+            self.finished_ok.emit(probes)
+        except Exception as e:
+            self.failed.emit(e)
+
+class TableToDbWorker(ProgressWorker):
+    """import_table_to_db on a thread; `summary` holds what was saved so far (also after Cancel)."""
+    finished_ok = Signal(dict)   # summary
+    failed = Signal(Exception)
+
+    def __init__(self, full_path: str, sheet_name: str, file_name: str):
+        super().__init__()
+        self._full = full_path
+        self._sheet = sheet_name
+        self._name = file_name
+        self.stats: dict = {}
+        self.summary: dict = {}
+
+    def work(self):
+        try:
+            self.finished_ok.emit(import_table_to_db(self._full, self._sheet, self._name,
+                                                     self.stats, self.summary))
+        except Exception as e:
+            self.failed.emit(e)
+
+class ClipboardImportWorker(ProgressWorker):
+    """read_clipboard_table on a thread."""
+    finished_ok = Signal(list, dict)   # rows, mapping
+    failed = Signal(Exception)
+
+    def __init__(self, text: str):
+        super().__init__()
+        self._text = text
+        self.stats: dict = {}
+
+    def work(self):
+        try:
+            rows, mapping = read_clipboard_table(self._text, self.stats)
+            check_cancelled()
+            self.finished_ok.emit(rows, mapping)
+        except Exception as e:
+            self.failed.emit(e)
+
 # === [STEP 2] DateScanWorker: walk disks, inspect Excel files for matching Start/End date ===
 from PySide6.QtCore import QThread, Signal
 from pathlib import Path
 from typing import List, Dict, Optional, Iterable, Tuple, Set
 
 # File types we will consider
-_EXCEL_EXTS = {".xlsx", ".xlsm", ".xlsb", ".csv"}
+_EXCEL_EXTS = {".xlsx", ".xlsm", ".xlsb", ".csv", ".tsv"}
 
 def _iter_roots_for_scan() -> list[Path]:
     roots: list[Path] = []
@@ -2906,11 +4970,154 @@ def _safe_listdir(p: Path) -> Iterable[Path]:
     except Exception:
         return []
 
-def _looks_excel(p: Path) -> bool:
+# ---------- bulk import (one workbook per process) ----------
+BULK_IMPORT_MAX_WORKERS = 0   # 0 = os.cpu_count()
+_BULK_EXTS = {".xlsx", ".xlsm", ".xls", ".xlsb", ".csv", ".tsv"}
+
+def _first_sheet_name(path: str) -> str:
     try:
-        return p.is_file() and p.suffix.lower() in _EXCEL_EXTS
+        names = workbook_sheet_names(path)
+        return names[0] if names else ""
     except Exception:
-        return False
+        return ""
+
+def _bulk_read_one(path: str, fresh: bool) -> dict:
+    """
+    Process-pool task: read the first sheet of one workbook with _read_excel_fast.
+    Runs in a child process, so the Fresh toggle is passed in and rows come back as plain dicts.
+    The child writes neither mapping_memo.json nor the parse cache: "memo" holds the memo entries
+    it touched and "cache" the (key, mapping) of a fresh parse, for the parent to persist once.
+    """
+    global FRESH_SECTION_ACTIVE
+    FRESH_SECTION_ACTIVE = bool(fresh)
+    _MAPPING_MEMO["defer"] = True
+    _PARSE_CACHE_DEFER["on"] = True
+    _PARSE_CACHE_DEFER["pending"].clear()
+    t0 = time.perf_counter()
+    out = {"path": path, "name": os.path.basename(path), "sheet": "", "rows": [], "mapping": {}, "error": "",
+           "reader": "", "memo": {}, "cache": None}
+    try:
+        out["sheet"] = _first_sheet_name(path)
+        stats: dict = {}
+        rows, mapping = _read_excel_fast(path, out["sheet"] or None, stats)
+        out["reader"] = _reader_label(stats)
+        out["rows"] = [dict(r) for r in rows]
+        out["mapping"] = {k: v for k, v in (mapping or {}).items() if v}
+        if _PARSE_CACHE_DEFER["pending"]:
+            out["cache"] = _PARSE_CACHE_DEFER["pending"][-1]
+    except Exception as e:
+        out["error"] = f"{type(e).__name__}: {e}"
+    out["memo"] = mapping_memo_updates()
+    out["seconds"] = round(time.perf_counter() - t0, 2)
+    return out
+
+def _reader_label(stats: dict) -> str:
+    """'calamine 0.42s' (+ fallback note) for status lines and reports."""
+    if not stats.get("backend"):
+        return ""
+    label = f"{stats['backend']} {stats.get('seconds', 0):.2f}s"
+    if stats.get("first_rows_seconds") is not None:
+        label += f", first rows {stats['first_rows_seconds']:.2f}s"
+    if stats.get("read_cols") and stats.get("cols") and stats["read_cols"] < stats["cols"]:
+        label += f", {stats['read_cols']}/{stats['cols']} cols"
+    if stats.get("fallback_from"):
+        label += f" (fallback from {stats['fallback_from'].split(':', 1)[0]})"
+    return label
+
+def bulk_excel_paths(folder: str) -> List[str]:
+    """Workbooks directly inside `folder` (Excel lock files '~$…' skipped), sorted by name."""
+    out = []
+    for p in _safe_listdir(Path(folder)):
+        if p.suffix.lower() in _BULK_EXTS and not p.name.startswith("~$") and p.is_file():
+            out.append(str(p))
+    return sorted(out, key=lambda s: os.path.basename(s).lower())
+
+class BulkImportWorker(ProgressWorker):
+    """
+    Reads many workbooks in a process pool (one file per worker), then stores all rows
+    with a single upsert_db_rows. Later files in `paths` win on duplicate products.
+    Cancelling drops files not started yet and stores nothing.
+    """
+    file_done = Signal(dict)     # per-file report as soon as that file is read
+    finished_ok = Signal(list)   # reports in input order: name, path, sheet, rows, saved, mapping, seconds, error
+    failed = Signal(Exception)
+
+    def __init__(self, paths: List[str], fresh: bool):
+        super().__init__()
+        self._paths = list(paths)
+        self._fresh = bool(fresh)
+
+    @staticmethod
+    def _report(res: dict) -> dict:
+        rep = {k: v for k, v in res.items() if k not in ("rows", "memo", "cache")}
+        rep["rows"] = len(res.get("rows") or [])
+        return rep
+
+    def work(self):
+        try:
+            from concurrent.futures import ProcessPoolExecutor, as_completed
+            workers = BULK_IMPORT_MAX_WORKERS or (os.cpu_count() or 2)
+            workers = max(1, min(workers, len(self._paths)))
+            results: Dict[str, dict] = {}
+            ex = ProcessPoolExecutor(max_workers=workers)
+            finished = False
+            try:
+                futs = {ex.submit(_bulk_read_one, p, self._fresh): p for p in self._paths}
+                for fut in as_completed(futs):
+                    p = futs[fut]
+                    try:
+                        res = fut.result()
+                    except Exception as e:  # e.g. a worker process died
+                        res = {"path": p, "name": os.path.basename(p), "sheet": "", "rows": [],
+                               "mapping": {}, "seconds": 0.0, "error": f"{type(e).__name__}: {e}"}
+                    results[p] = res
+                    self.file_done.emit(self._report(res))
+                    work_progress(len(results) / len(self._paths))
+                finished = True
+            finally:
+                # on cancel: don't wait for files still being read in the pool
+                ex.shutdown(wait=finished, cancel_futures=not finished)
+
+            # memo entries and new parse-cache entries from the children, written once here
+            memo: Dict[str, Optional[dict]] = {}
+            for p in self._paths:
+                memo.update(results[p].get("memo") or {})
+                if results[p].get("cache") and not results[p]["error"]:
+                    key, mapping = results[p]["cache"]
+                    store_parsed_workbook(key, results[p]["rows"], mapping)
+            try:
+                merge_mapping_memo(memo)
+            except Exception:
+                pass
+
+            all_rows: List[Dict[str, str]] = []
+            reports = []
+            for p in self._paths:
+                res = results[p]
+                for r in res["rows"]:
+                    r["SOURCE_FILE"] = res["name"]
+                    r["SOURCE_SHEET"] = res["sheet"]
+                all_rows.extend(res["rows"])
+                rep = self._report(res)
+                rep["saved"] = sum(1 for r in res["rows"] if _is_complete_db_row(r))
+                reports.append(rep)
+
+            # One merge for the whole batch
+            if all_rows:
+                upsert_db_rows(all_rows)
+
+            ok = [results[p] for p in self._paths if not results[p]["error"]]
+            for res in ok:
+                try:
+                    remember_excel_source(res["name"], res["path"], res["sheet"])
+                except Exception:
+                    pass
+            # keep every file of this batch even when it is larger than the usual 15
+            _prune_db_to_recent_sources(limit=max(15, len(ok)))
+            self.finished_ok.emit(reports)
+        except Exception as e:
+            self.failed.emit(e)
+
 
 def _headers_like_start_end(cols: Iterable[str], cfg: dict) -> Tuple[Optional[str], Optional[str]]:
     start_col = None
@@ -2922,111 +5129,679 @@ def _headers_like_start_end(cols: Iterable[str], cfg: dict) -> Tuple[Optional[st
             end_col = c
     return start_col, end_col
 
-class DateScanWorker(QThread):
+# ---------- Workbook catalogue ----------
+# workbook_catalog.json remembers every workbook the date scan has probed, keyed by path: mtime,
+# size, header-config key, and per sheet the START/END columns plus the START dates and
+# (START, END) ranges found in its first PROBE_ROWS rows (min/max for a glance). A scan re-probes
+# only files whose mtime/size changed; catalog_date_matches() answers a date from the index alone.
+WORKBOOK_CATALOG = True
+WORKBOOK_CATALOG_MAX = 20000
+_CATALOG = {"data": None, "dirty": False}
+_CATALOG_LOCK = threading.RLock()
+
+def _cell_start_date(v) -> Optional[date]:
+    """The date date_in_row_matches() compares cell `v` with (None: it matches no date)."""
+    if v is None or v == "":
+        return None
+    pd = _pd()
+    try:
+        d = pd.to_datetime(v, errors="coerce", dayfirst=True)
+        if d is not None and hasattr(d, "date"):
+            d = d.date()
+            return None if pd.isna(d) else d
+    except Exception:
+        pass
+    if isinstance(v, str):
+        m = re.search(r"(\d{1,2})[.\-/](\d{1,2})[.\-/](\d{2,4})", v)
+        if m:
+            dd, mm, yy = m.groups()
+            if len(yy) == 2:
+                yy = "20" + yy
+            try:
+                return datetime(int(yy), int(mm), int(dd)).date()
+            except Exception:
+                return None
+    return None
+
+def _row_date_range(start_val, end_val) -> Optional[Tuple[date, date]]:
+    """The (start, end) row_in_range() tests a target against (None: it contains no date)."""
+    pd = _pd()
+    try:
+        sd = pd.to_datetime(start_val, errors="coerce")
+        ed = pd.to_datetime(end_val, errors="coerce", dayfirst=True)
+        if sd is not None and ed is not None and hasattr(sd, "date") and hasattr(ed, "date"):
+            sd, ed = sd.date(), ed.date()
+            if not (pd.isna(sd) or pd.isna(ed)):
+                return sd, ed
+    except Exception:
+        pass
+    return None
+
+def _catalog_cfg_key(cfg: dict) -> str:
+    raw = json.dumps(cfg or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=8).hexdigest()
+
+def _workbook_catalog() -> dict:
+    with _CATALOG_LOCK:
+        if _CATALOG["data"] is None:
+            data = _read_json(_workbook_catalog_path())
+            ok = isinstance(data, dict) and isinstance(data.get("files"), dict)
+            _CATALOG["data"] = data if ok else {"files": {}}
+        return _CATALOG["data"]
+
+def save_workbook_catalog() -> None:
+    p = _workbook_catalog_path()
+    tmp = f"{p}.{os.getpid()}.tmp"
+    with _CATALOG_LOCK:
+        if not _CATALOG["dirty"]:
+            return
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(_workbook_catalog(), f, ensure_ascii=False)
+            os.replace(tmp, p)
+            _CATALOG["dirty"] = False
+        except OSError:
+            try: _remove_quiet(tmp)
+            except OSError: pass
+
+def _probe_catalog_entry(path: str, st: os.stat_result, cfg: dict, cfg_key: str) -> dict:
+    entry = {"path": path, "mtime": st.st_mtime, "size": st.st_size, "cfg": cfg_key, "sheets": []}
+    try:
+        probes = probe_workbook(path, nrows=PROBE_ROWS, max_sheets=PROBE_MAX_SHEETS)
+    except Exception as e:
+        entry["error"] = type(e).__name__   # unreadable: remembered too, so it is not re-probed
+        return entry
+    starts_memo: dict = {}
+    ranges_memo: dict = {}
+    for p in probes:
+        sc, ec = _headers_like_start_end(p["headers"], cfg)
+        sheet = {"sheet": p["sheet"], "start_col": sc or "", "end_col": ec or "", "starts": [], "ranges": []}
+        if sc:
+            data = p["frame"].iloc[p["header_row"] + 1:]
+            col_s = data.iloc[:, p["headers"].index(sc)].tolist()
+            starts = set()
+            for v in col_s:
+                k = (type(v).__name__, v)
+                if k not in starts_memo:
+                    starts_memo[k] = _cell_start_date(v)
+                starts.add(starts_memo[k])
+            starts.discard(None)
+            ranges = set()
+            if ec:
+                for sv, ev in zip(col_s, data.iloc[:, p["headers"].index(ec)].tolist()):
+                    k = (type(sv).__name__, sv, type(ev).__name__, ev)
+                    if k not in ranges_memo:
+                        ranges_memo[k] = _row_date_range(sv, ev)
+                    ranges.add(ranges_memo[k])
+                ranges.discard(None)
+            sheet["starts"] = sorted(d.isoformat() for d in starts)
+            sheet["ranges"] = sorted([s.isoformat(), e.isoformat()] for s, e in ranges)
+            dates = sheet["starts"] + [d for r in sheet["ranges"] for d in r]
+            if dates:
+                sheet["min"], sheet["max"] = min(dates), max(dates)
+        entry["sheets"].append(sheet)
+    return entry
+
+def catalog_entry(path: str, cfg: dict, cfg_key: Optional[str] = None) -> Optional[dict]:
+    """Catalogue entry for `path`, re-probed only if its mtime/size or the header config changed; None if gone."""
+    key = os.path.normcase(os.path.abspath(path))
+    files = _workbook_catalog()["files"]
+    cfg_key = cfg_key or _catalog_cfg_key(cfg)
+    try:
+        st = os.stat(path)
+    except OSError:
+        with _CATALOG_LOCK:
+            if files.pop(key, None) is not None:
+                _CATALOG["dirty"] = True
+        return None
+    with _CATALOG_LOCK:
+        entry = files.get(key)
+    if (entry and entry.get("mtime") == st.st_mtime and entry.get("size") == st.st_size
+            and entry.get("cfg") == cfg_key):
+        return entry
+    entry = _probe_catalog_entry(path, st, cfg, cfg_key)
+    with _CATALOG_LOCK:
+        files.pop(key, None)
+        files[key] = entry   # re-inserted: the oldest probes go first when trimming
+        while len(files) > WORKBOOK_CATALOG_MAX:
+            files.pop(next(iter(files)))
+        _CATALOG["dirty"] = True
+    return entry
+
+def _entry_date_matches(entry: dict, target) -> List[Dict[str, str]]:
+    t = target.isoformat()
+    out = []
+    for sh in entry.get("sheets") or ():
+        if t in sh.get("starts", ()) or any(s <= t <= e for s, e in sh.get("ranges", ())):
+            out.append({"name": os.path.basename(entry["path"]), "path": entry["path"], "sheet": sh.get("sheet", "")})
+    return out
+
+def catalog_date_matches(target, cfg: dict) -> List[Dict[str, str]]:
+    """Matches for `target` from the catalogue alone; files changed or gone since their probe are left out."""
+    cfg_key = _catalog_cfg_key(cfg)
+    with _CATALOG_LOCK:
+        entries = list(_workbook_catalog()["files"].values())
+    out: List[Dict[str, str]] = []
+    for e in entries:
+        if e.get("cfg") != cfg_key:
+            continue
+        hits = _entry_date_matches(e, target)
+        if not hits:
+            continue
+        try:
+            st = os.stat(e["path"])
+        except OSError:
+            continue
+        if st.st_mtime == e.get("mtime") and st.st_size == e.get("size"):
+            out.extend(hits)
+    return out
+
+# ---------- File discovery ----------
+# One walker behind the Recent Downloads menu, the date scan and the folder watcher.
+# Breadth-first, one level at a time: with a thread pool a level's directories are listed
+# in parallel and merged back in queue order, so the files found, and where the cap cuts them, are
+# exactly a sequential BFS's. Listings are cached per directory and reused while the directory's
+# mtime is unchanged (adding, removing or renaming an entry bumps it), so walks that overlap -
+# Downloads under home, the menu right after a scan - list each folder once. FAT/exFAT volumes
+# and some SMB shares don't bump a folder's mtime, so a listing is also only trusted for
+# DISCOVERY_CACHE_TTL seconds. System, tool and cache folders are never entered.
+DATE_SCAN_MAX_WORKERS = 0   # 0 = min(32, os.cpu_count() + 4) threads (disk-bound)
+DATE_SCAN_PROBE_WORKERS = 4   # workbooks the date scan probes at once (listing uses the bigger pool)
+DISCOVERY_CACHE_MAX = 50000   # cached directory listings; cleared when exceeded
+DISCOVERY_CACHE_TTL = 30.0    # seconds a listing is reused even with its folder's mtime unchanged
+DISCOVERY_EXTS = RECENT_EXCEL_EXTS | _EXCEL_EXTS | _BULK_EXTS   # files kept in listings
+# folder names skipped anywhere (compared case-insensitively); hidden ".x" folders are skipped too
+DISCOVERY_SKIP_DIRS = {
+    "node_modules", "__pycache__", "site-packages", "venv", "bower_components",
+    "$recycle.bin", "system volume information", "windows", "program files",
+    "program files (x86)", "programdata", "recovery", "perflogs",
+    "cache", "caches", "code cache", "gpucache", "inetcache", "temporary internet files",
+}
+DISCOVERY_SKIP_APPDATA = {"local", "locallow"}   # AppData\Local*: caches, temp, app packages
+DISCOVERY_SKIP_SYSTEM = {"proc", "sys", "dev", "run"}   # pseudo filesystems directly under "/"
+
+# dir -> (mtime_ns, monotonic time listed, subdirs, files)
+_WALK_CACHE: Dict[str, Tuple[int, float, List[str], List[str]]] = {}
+_WALK_CACHE_LOCK = threading.Lock()
+_WALK_CACHE_RACY_NS = 2_000_000_000   # listings of folders changed this recently are not cached
+
+def _date_scan_workers() -> int:
+    return int(DATE_SCAN_MAX_WORKERS) or min(32, (os.cpu_count() or 1) + 4)
+
+def _discovery_skip(parent: str, name: str) -> bool:
+    n = name.casefold()
+    if n.startswith(".") or n in DISCOVERY_SKIP_DIRS:
+        return True
+    if parent == os.sep:
+        return n in DISCOVERY_SKIP_SYSTEM
+    return n in DISCOVERY_SKIP_APPDATA and os.path.basename(parent).casefold() == "appdata"
+
+def _discovery_listing(d: str) -> Tuple[List[str], List[str]]:
+    """(subdirectories to enter, workbook files) of `d` in directory order, from the cache when still valid."""
+    try:
+        mt = os.stat(d).st_mtime_ns
+    except OSError:
+        return [], []
+    with _WALK_CACHE_LOCK:
+        hit = _WALK_CACHE.get(d)
+    if hit is not None and hit[0] == mt and time.monotonic() - hit[1] < DISCOVERY_CACHE_TTL:
+        return hit[2], hit[3]
+    dirs: List[str] = []
+    files: List[str] = []
+    try:
+        with os.scandir(d) as it:
+            for e in it:
+                try:
+                    if e.is_dir():
+                        if not _discovery_skip(d, e.name):
+                            dirs.append(e.path)
+                    elif os.path.splitext(e.name)[1].lower() in DISCOVERY_EXTS and e.is_file():
+                        files.append(e.path)
+                except OSError:
+                    continue
+    except OSError:
+        return [], []
+    # a change within the mtime granularity could leave the same mtime behind: don't trust it yet
+    if time.time_ns() - mt > _WALK_CACHE_RACY_NS:
+        with _WALK_CACHE_LOCK:
+            if len(_WALK_CACHE) >= DISCOVERY_CACHE_MAX:
+                _WALK_CACHE.clear()
+            _WALK_CACHE[d] = (mt, time.monotonic(), dirs, files)
+    return dirs, files
+
+def discover_files(root, exts, max_depth: int, cap: int, pool=None,
+                   on_dir: Optional[Callable[[str], None]] = None,
+                   on_level: Optional[Callable[[List[str], int], None]] = None) -> List[str]:
+    """
+    Files under `root` with an extension in `exts`, in BFS order: at most `cap`, subfolders
+    down to `max_depth`. `pool` lists each level in parallel; on_level(dirs, depth) sees every level.
+    """
+    out: List[str] = []
+    level = [str(root)]
+    depth = 0
+    mapper = pool.map if pool is not None else map
+    batch = _date_scan_workers() * 4   # bounded look-ahead: a huge level stops early once the cap is hit
+    while level:
+        if on_level is not None:
+            on_level(level, depth)
+        nxt: List[str] = []
+        for i in range(0, len(level), batch):
+            check_cancelled()
+            part = level[i:i + batch]
+            for d, (dirs, files) in zip(part, mapper(_discovery_listing, part)):
+                if on_dir is not None:
+                    on_dir(d)
+                if depth < max_depth:
+                    nxt.extend(dirs)
+                for f in files:
+                    if os.path.splitext(f)[1].lower() in exts:
+                        out.append(f)
+                        if len(out) >= cap:
+                            return out
+        level = nxt
+        depth += 1
+    return out
+
+def scan_root_parallel(root, pool, max_depth: int, cap: int,
+                       on_dir: Optional[Callable[[str], None]] = None) -> List[str]:
+    """Workbook paths under `root` in BFS order (at most `cap`, subfolders down to `max_depth`)."""
+    return discover_files(root, _EXCEL_EXTS, max_depth, cap, pool, on_dir)
+
+# ---------- Date-scan ranking ----------
+# Matches rank by the scan root they sit under (Downloads, Desktop, Documents, home, drives - in
+# _iter_roots_for_scan() order), then newest first, then file name. The scan probes each root's
+# files in that order too, so once DATE_SCAN_TOP_K matches are in, nothing left can outrank them
+# and it stops.
+DATE_SCAN_TOP_K = 10   # 0 = always scan everything
+
+def _scan_root_keys(roots=None) -> List[str]:
+    keys = []
+    for r in (roots if roots is not None else _iter_roots_for_scan()):
+        if os.path.isdir(r):
+            k = os.path.normcase(str(r))
+            keys.append(k if k.endswith(os.sep) else k + os.sep)
+    return keys
+
+def _root_priority(path: str, root_keys: List[str]) -> int:
+    """Index of the first scan root `path` sits under (len(root_keys) when none)."""
+    p = os.path.normcase(path)
+    for i, k in enumerate(root_keys):
+        if p.startswith(k):
+            return i
+    return len(root_keys)
+
+def date_match_rank(m: dict, root_keys: List[str]) -> tuple:
+    path = m.get("path", "")
+    try:
+        mt = os.stat(path).st_mtime
+    except OSError:
+        mt = 0.0
+    return (_root_priority(path, root_keys), -mt, os.path.basename(path).lower(), m.get("sheet", ""))
+
+def rank_date_matches(matches: List[dict], root_keys: Optional[List[str]] = None) -> List[dict]:
+    """Best first: root priority, then newest file."""
+    keys = root_keys if root_keys is not None else _scan_root_keys()
+    return sorted(matches, key=lambda m: date_match_rank(m, keys))
+
+class DateScanWorker(ProgressWorker):
     """
     Scans common folders for Excel files and checks inside for:
       - a START_DATE-like column that contains the target date, OR
       - a (START, END)-like pair where target ∈ [START..END].
-    Emits a list of {name, path, sheet}.
+    Emits each {name, path, sheet} as it is found, then the ranked list (see "Date-scan ranking");
+    with top_k it stops once the best top_k are known. Fraction goes by roots, then files within a root.
     """
     finished_ok = Signal(list)     # List[Dict[str,str]]
     failed      = Signal(Exception)
     progress    = Signal(str)      # current folder/file path
+    match_found = Signal(dict)     # one new match, as soon as it is found
 
-    def __init__(self, target_date, headers_cfg: dict, per_root_cap: int = 200, max_depth: int = 4):
+    def __init__(self, target_date, headers_cfg: dict, per_root_cap: int = 200, max_depth: int = 4,
+                 top_k: Optional[int] = None):
         super().__init__()
         self._target = target_date
         self._cfg = headers_cfg or {}
         self._per_root_cap = max(50, int(per_root_cap))
         self._max_depth = max_depth
+        self._cfg_key = _catalog_cfg_key(self._cfg)
+        self._top_k = DATE_SCAN_TOP_K if top_k is None else int(top_k)
 
-    def _scan_root(self, root: Path) -> List[Path]:
+    def _scan_root(self, root: Path, pool) -> List[Path]:
         # BFS to a limited depth; cap files per root to keep UI responsive
-        out: List[Path] = []
-        q: List[Tuple[Path, int]] = [(root, 0)]
-        while q and len(out) < self._per_root_cap:
-            d, depth = q.pop(0)
-            self.progress.emit(str(d))
-            for child in _safe_listdir(d):
-                if child.is_dir():
-                    if depth < self._max_depth:
-                        q.append((child, depth + 1))
-                else:
-                    if _looks_excel(child):
-                        out.append(child)
-                        if len(out) >= self._per_root_cap:
-                            break
-        return out
+        paths = scan_root_parallel(root, pool, self._max_depth, self._per_root_cap, self.progress.emit)
+        return [Path(p) for p in paths]
 
     def _check_file(self, file_path: Path) -> List[Dict[str, str]]:
         """
         Returns 0+ matches: each as {"name": base, "path": str(path), "sheet": sheet_name_or_empty}
-        We only peek at a few rows for speed.
+        Answered from the workbook catalogue; only new or changed files are probed.
         """
-        matches: List[Dict[str, str]] = []
+        entry = catalog_entry(str(file_path), self._cfg, self._cfg_key)
+        return _entry_date_matches(entry, self._target) if entry else []
+
+    def work(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        pool = ThreadPoolExecutor(max_workers=_date_scan_workers())
+        probes = ThreadPoolExecutor(max_workers=max(1, int(DATE_SCAN_PROBE_WORKERS)))
         try:
-            import pandas as pd
+            roots = [r for r in _iter_roots_for_scan() if r.is_dir()]
+            keys = _scan_root_keys(roots)
+            seen: Set[Tuple[str, str]] = set()
+            uniq: List[Dict[str, str]] = []
+            for ri, root in enumerate(roots):
+                work_progress(ri / len(roots))
+                # a file under an earlier root (Downloads inside home) was that root's to find;
+                # the rest go in date_match_rank order (newest first, then file name) so the
+                # top_k stop can't skip a same-mtime file that ranks above one already probed
+                dated = []
+                for f in self._scan_root(root, pool):
+                    if _root_priority(str(f), keys) == ri:
+                        try:
+                            dated.append((-f.stat().st_mtime, f.name.lower(), len(dated), f))
+                        except OSError:
+                            continue
+                files = [f for *_, f in sorted(dated)]
+                # probes run on their own small pool; map() hands results back in that order
+                for fi, (f, found) in enumerate(zip(files, probes.map(self._check_file, files))):
+                    work_progress((ri + fi / len(files)) / len(roots))
+                    self.progress.emit(str(f))
+                    for m in found:   # de-dupe by (path, sheet)
+                        k = (m.get("path",""), m.get("sheet",""))
+                        if k not in seen:
+                            seen.add(k); uniq.append(m)
+                            self.match_found.emit(m)
+                    if self._top_k and len(uniq) >= self._top_k:
+                        break   # everything not probed yet ranks below these
+                else:
+                    continue
+                break
+            self.finished_ok.emit(rank_date_matches(uniq, keys))
         except Exception as e:
-            # pandas is required for content peeking
-            raise e
+            self.failed.emit(e)
+        finally:
+            probes.shutdown(wait=True, cancel_futures=True)
+            pool.shutdown(wait=True, cancel_futures=True)
+            save_workbook_catalog()   # also after Cancel: what was probed so far is kept
+
+
+
+# ---------- Folder watcher ----------
+# Optional background thread on the _candidate_recent_roots() folders (FOLDER_WATCH_MAX_DEPTH
+# deep): inotify through ctypes on Linux, an mtime poll every FOLDER_WATCH_POLL_SECS elsewhere
+# (or when inotify is unavailable / out of watches). It keeps every workbook there ranked for the
+# Recent Downloads menu and probes new or modified ones into the workbook catalogue once they
+# stop changing, so the menu and the date search answer without walking the disks.
+# Off by default (it keeps a thread and, when polling, a walk every few seconds going); a
+# "folder_watcher": true entry in app_settings.json turns it on without editing this flag.
+# Cloud-only files (OneDrive "Files On-Demand" placeholders, offline files) are listed but never
+# probed: reading them would download every workbook in the synced folders.
+FOLDER_WATCHER = False
+FOLDER_WATCH_MAX_DEPTH = 3
+FOLDER_WATCH_POLL_SECS = 10.0
+FOLDER_WATCH_SETTLE_SECS = 2.0   # unchanged this long before a file is probed (downloads in flight)
+FOLDER_WATCH_PREINDEX = 50       # newest existing workbooks probed at start; later ones on arrival
+
+# Windows attributes of a file whose data is not on the disk yet (reading it recalls it)
+_CLOUD_ONLY_ATTRS = 0x1000 | 0x40000 | 0x400000   # OFFLINE | RECALL_ON_OPEN | RECALL_ON_DATA_ACCESS
+
+def _is_cloud_only(st: os.stat_result) -> bool:
+    return bool(getattr(st, "st_file_attributes", 0) & _CLOUD_ONLY_ATTRS)
+
+class _Inotify:
+    """Just enough inotify (Linux, ctypes) to watch directories for finished or removed files."""
+    IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO = 0x8, 0x40, 0x80
+    IN_CREATE, IN_DELETE, IN_DELETE_SELF, IN_MOVE_SELF = 0x100, 0x200, 0x400, 0x800
+    IN_Q_OVERFLOW, IN_IGNORED, IN_ONLYDIR, IN_ISDIR = 0x4000, 0x8000, 0x01000000, 0x40000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF
+    _HEADER = struct.Struct("iIII")   # wd, mask, cookie, len
 
-        suffix = file_path.suffix.lower()
+    def __init__(self):
+        import ctypes, ctypes.util
+
+        self._ctypes = ctypes
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self._libc = libc
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: Dict[int, Tuple[str, int]] = {}   # wd -> (directory, depth)
+
+    def add(self, path: str, depth: int) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK | self.IN_ONLYDIR)
+        if wd < 0:
+            err = self._ctypes.get_errno()
+            if err == 28:   # ENOSPC: out of watches; the caller falls back to polling
+                raise OSError(err, "inotify watch limit reached")
+            return          # gone / no access: nothing to watch
+        self.dirs[wd] = (path, depth)
+
+    def read(self, timeout: float) -> List[Tuple[str, str, int, int]]:
+        """(directory, name, mask, depth) events; [] after `timeout` seconds without any."""
+        import select
+
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
         try:
-            if suffix == ".csv":
-                # CSV: single pseudo-sheet
-                df = pd.read_csv(file_path, nrows=200)
-                sc, ec = _headers_like_start_end(df.columns, self._cfg)
-                if sc and any(date_in_row_matches(self._target, v) for v in df[sc].head(200).tolist()):
-                    matches.append({"name": file_path.name, "path": str(file_path), "sheet": ""})
-                elif sc and ec and any(
-                    row_in_range(self._target, sv, ev)
-                    for sv, ev in zip(df[sc].head(200).tolist(), df[ec].head(200).tolist())
-                ):
-                    matches.append({"name": file_path.name, "path": str(file_path), "sheet": ""})
-                return matches
-
-            import openpyxl  # ensures engine is available for xlsx/xlsm
-            xl = pd.ExcelFile(file_path)
-            for sheet in xl.sheet_names[:8]:
-                try:
-                    df = xl.parse(sheet, nrows=200, dtype=str)
+            data = os.read(self.fd, 256 * 1024)
+        except BlockingIOError:
+            return []
+        out = []
+        off = 0
+        while off + self._HEADER.size <= len(data):
+            wd, mask, _cookie, n = self._HEADER.unpack_from(data, off)
+            off += self._HEADER.size
+            name = os.fsdecode(data[off:off + n].rstrip(b"\0"))
+            off += n
+            if mask & self.IN_Q_OVERFLOW:
+                out.append(("", "", mask, 0))
+                continue
+            d, depth = self.dirs.get(wd, ("", 0))
+            if mask & self.IN_IGNORED:
+                self.dirs.pop(wd, None)
+            if d:
+                out.append((d, name, mask, depth))
+        return out
 
-                except Exception:
-                    continue
-                sc, ec = _headers_like_start_end(df.columns, self._cfg)
-                if sc:
-                    col = df[sc]
-                    if any(date_in_row_matches(self._target, v) for v in col.head(200).tolist()):
-                        matches.append({"name": file_path.name, "path": str(file_path), "sheet": sheet})
-                        continue
-                if sc and ec:
-                    col_s = df[sc]; col_e = df[ec]
-                    if any(row_in_range(self._target, sv, ev)
-                           for sv, ev in zip(col_s.head(200).tolist(), col_e.head(200).tolist())):
-                        matches.append({"name": file_path.name, "path": str(file_path), "sheet": sheet})
-            return matches
-        except Exception:
-            return matches  # ignore unreadable files gracefully
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+class FolderWatcher:
+    """Background index of the workbooks under `roots` (see start_folder_watcher)."""
+
+    def __init__(self, roots: List[Path], max_depth: int = FOLDER_WATCH_MAX_DEPTH):
+        self._roots = [str(r) for r in roots]
+        self._depth = int(max_depth)
+        self._files: Dict[str, float] = {}     # path -> mtime
+        self._pending: Dict[str, Tuple[float, Optional[float]]] = {}   # path -> (last seen changing, mtime)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.ready = False     # initial walk done: recent() can answer
+        self.backend = ""      # "inotify" / "poll"
+        self._thread = threading.Thread(target=self._run, name="folder-watcher", daemon=True)
+
+    def start(self) -> "FolderWatcher":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def recent(self, limit: int = 5) -> List[Path]:
+        with self._lock:
+            ranked = [(mt, Path(p)) for p, mt in self._files.items()]
+        return _rank_recent(ranked, limit)
+
+    # --- index upkeep ---
+    def _walk(self, top: str, depth: int, dirs: Optional[list] = None) -> Dict[str, float]:
+        """Workbooks under `top` (which sits at `depth`) -> mtime; subfolders to watch go to `dirs`."""
+        found: Dict[str, float] = {}
+
+        def _level(level: List[str], d: int) -> None:
+            if dirs is not None:
+                dirs.extend((x, depth + d) for x in level)
+
+        for p in discover_files(top, RECENT_EXCEL_EXTS, self._depth - depth, sys.maxsize, on_level=_level):
+            if self._stop.is_set():
+                break
+            try:
+                found[p] = os.stat(p).st_mtime
+            except OSError:
+                continue
+        return found
+
+    def _touched(self, path: str, mtime: Optional[float] = None) -> None:
+        """Queue `path` for indexing; a poll passing the mtime it saw only restarts the settle clock on change."""
+        if os.path.splitext(path)[1].lower() in RECENT_EXCEL_EXTS and not os.path.basename(path).startswith("~$"):
+            with self._lock:
+                prev = self._pending.get(path)
+                if prev is None or mtime is None or prev[1] != mtime:
+                    self._pending[path] = (time.monotonic(), mtime)
+
+    def _forget(self, path: str, is_dir: bool = False) -> None:
+        prefix = path.rstrip(os.sep) + os.sep
+        with self._lock:
+            for p in [p for p in self._files if p == path or (is_dir and p.startswith(prefix))]:
+                self._files.pop(p, None)
+            self._pending.pop(path, None)
+
+    def _settle(self) -> None:
+        """Index + probe the files that stopped changing."""
+        now = time.monotonic()
+        with self._lock:
+            due = [p for p, (t, _mt) in self._pending.items() if now - t >= FOLDER_WATCH_SETTLE_SECS]
+            for p in due:
+                self._pending.pop(p, None)
+        self._index(due)
+
+    def _index(self, paths: List[str]) -> None:
+        if not paths:
+            return
+        cfg = load_headers_cfg()
+        cfg_key = _catalog_cfg_key(cfg)
+        for p in paths:
+            if self._stop.is_set():
+                break
+            try:
+                st = os.stat(p)
+            except OSError:
+                self._forget(p)
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            with self._lock:
+                self._files[p] = st.st_mtime
+            if _is_cloud_only(st):
+                continue   # still in the cloud: probing it would download it
+            try:
+                catalog_entry(p, cfg, cfg_key)
+            except Exception:
+                pass
+        save_workbook_catalog()
 
-    def run(self):
+    # --- thread ---
+    def _run(self) -> None:
+        ino = None
+        dirs: List[Tuple[str, int]] = []
         try:
-            results: List[Dict[str, str]] = []
-            for root in _iter_roots_for_scan():
-                files = self._scan_root(root)
-                for f in files:
-                    self.progress.emit(str(f))
-                    results.extend(self._check_file(f))
-            # de-dupe by (path, sheet)
-            seen: Set[Tuple[str, str]] = set()
-            uniq: List[Dict[str, str]] = []
-            for m in results:
-                k = (m.get("path",""), m.get("sheet",""))
-                if k not in seen:
-                    seen.add(k); uniq.append(m)
-            self.finished_ok.emit(uniq)
-        except Exception as e:
-            self.failed.emit(e)
+            if sys.platform.startswith("linux"):
+                try:
+                    ino = _Inotify()
+                except Exception:
+                    ino = None
+            for r in self._roots:
+                found = self._walk(r, 0, dirs if ino is not None else None)
+                with self._lock:
+                    self._files.update(found)
+            if ino is not None:
+                try:
+                    for d, depth in dirs:
+                        ino.add(d, depth)
+                except OSError:
+                    ino.close()
+                    ino = None
+            self.ready = True
+            with self._lock:
+                newest = sorted(self._files, key=self._files.get, reverse=True)[:FOLDER_WATCH_PREINDEX]
+            self._index(newest)
+            if ino is not None:
+                self.backend = "inotify"
+                self._loop_inotify(ino)
+            else:
+                self.backend = "poll"
+                self._loop_poll()
+        except Exception:
+            self.ready = False   # menu and date search fall back to walking
+        finally:
+            if ino is not None:
+                ino.close()
+
+    def _loop_inotify(self, ino: _Inotify) -> None:
+        while not self._stop.is_set():
+            for d, name, mask, depth in ino.read(1.0):
+                if mask & ino.IN_Q_OVERFLOW:
+                    self._rescan()   # events were lost
+                    continue
+                path = os.path.join(d, name) if name else d
+                if mask & ino.IN_ISDIR:
+                    if (mask & (ino.IN_CREATE | ino.IN_MOVED_TO) and depth < self._depth
+                            and not _discovery_skip(d, name)):
+                        sub: List[Tuple[str, int]] = []
+                        found = self._walk(path, depth + 1, sub)   # files may land before the watch
+                        try:
+                            for sd, sdepth in sub:
+                                ino.add(sd, sdepth)
+                        except OSError:
+                            pass   # out of watches: those folders are only seen by a rescan
+                        for p in found:
+                            self._touched(p)
+                    elif mask & (ino.IN_DELETE | ino.IN_MOVED_FROM):
+                        self._forget(path, is_dir=True)
+                elif mask & (ino.IN_CLOSE_WRITE | ino.IN_MOVED_TO):
+                    self._touched(path)
+                elif mask & (ino.IN_DELETE | ino.IN_MOVED_FROM):
+                    self._forget(path)
+            self._settle()
+
+    def _rescan(self) -> Dict[str, float]:
+        """Walk again; changed or new files become pending, vanished ones are dropped."""
+        now: Dict[str, float] = {}
+        for r in self._roots:
+            now.update(self._walk(r, 0))
+        with self._lock:
+            old = dict(self._files)
+        for p, mt in now.items():
+            if old.get(p) != mt:
+                self._touched(p, mt)
+        for p in old:
+            if p not in now:
+                self._forget(p)
+        return now
+
+    def _loop_poll(self) -> None:
+        while not self._stop.wait(FOLDER_WATCH_POLL_SECS):
+            self._rescan()
+            self._settle()
+
+def start_folder_watcher() -> Optional[FolderWatcher]:
+    """Start the background watcher (once; FOLDER_WATCHER or the "folder_watcher" setting turns it on)."""
+    global _FOLDER_WATCHER
+    if not (FOLDER_WATCHER or load_settings().get("folder_watcher")):
+        return None
+    if _FOLDER_WATCHER is None:
+        _FOLDER_WATCHER = FolderWatcher(_candidate_recent_roots()).start()
+    return _FOLDER_WATCHER
 
+def stop_folder_watcher() -> None:
+    global _FOLDER_WATCHER
+    if _FOLDER_WATCHER is not None:
+        _FOLDER_WATCHER.stop()
+        _FOLDER_WATCHER = None
 
 
 class Debouncer(QObject):
@@ -3825,7 +6600,7 @@ def render_page_JSON(out_path: str, tpl: dict, rows: List[Dict[str, str]]) -> st
 
     # Filter rows strictly: no empty, no price-only, no 1–2 char noise
     try:
-        data = [r for r in (rows or []) if isinstance(r, dict) and _row_is_meaningful(r)]
+        data = [r for r in (rows or []) if isinstance(r, Mapping) and _row_is_meaningful(r)]
     except Exception:
         data = []
 
@@ -3878,7 +6653,8 @@ def render_page_JSON(out_path: str, tpl: dict, rows: List[Dict[str, str]]) -> st
     c.setTitle(tpl.get("title") or "Labels")
 
 
-    for page_start, batch in pages_to_draw:
+    for page_no, (page_start, batch) in enumerate(pages_to_draw):
+        work_progress(page_no / len(pages_to_draw))
         c.saveState()
         drew_anything = False
 
@@ -3886,7 +6662,7 @@ def render_page_JSON(out_path: str, tpl: dict, rows: List[Dict[str, str]]) -> st
             if slot_idx >= len(batch):
                 continue
             rec = batch[slot_idx]
-            if not isinstance(rec, dict):
+            if not isinstance(rec, Mapping):
                 continue
 
             # --- STACKED LAYOUT: BRAND -> ITEM/ENGLISH_DESCRIPTION -> PRICE ---
@@ -4162,6 +6938,23 @@ def render_page_JSON(out_path: str, tpl: dict, rows: List[Dict[str, str]]) -> st
     c.save()
     return out_path
 
+class RenderWorker(ProgressWorker):
+    """render_page_JSON off the UI thread (fraction per page; cancelling leaves no PDF)."""
+    finished_ok = Signal(str)   # out path
+    failed = Signal(Exception)
+
+    def __init__(self, out_path: str, tpl: dict, rows: List[Dict[str, str]]):
+        super().__init__()
+        self._out = out_path
+        self._tpl = tpl
+        self._rows = rows
+
+    def work(self):
+        try:
+            self.finished_ok.emit(render_page_JSON(self._out, self._tpl, self._rows))
+        except Exception as e:
+            self.failed.emit(e)
+
 
 
 
@@ -4908,7 +7701,7 @@ class App(QMainWindow):
         except Exception:
             pass
         try:
-            _ = load_headers_cfg()
+            _ = headers_cfg_snapshot()
             _ = load_excel_sources()
         except Exception:
             pass
@@ -4923,7 +7716,7 @@ class App(QMainWindow):
         self._user_overrides_size = False; self._custom_geom = None
         self._resizing_programmatically = False
         self.connected = None
-        self.preview_rows = []; self.preview_qty = []
+        self.preview_rows = []; self.preview_qty = []; self.preview_delta = []
         self.last_mapping = {}
         self.selected_template = None
         self.selected_template_name = None
@@ -4987,6 +7780,13 @@ class App(QMainWindow):
         except Exception:
             pass
 
+        # Shortcut: Ctrl+Shift+E to export the label DB as CSV
+        try:
+            sc_exp = QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+Shift+E"), self)
+            sc_exp.activated.connect(self.export_db_csv_ui)
+        except Exception:
+            pass
+
         # Try to guard delete buttons if present in UI
         try:
             self._guard_header_delete_button()
@@ -5342,6 +8142,17 @@ class App(QMainWindow):
                                     f"Updated UOM with '/ ' for {count} Fresh row(s).")
         except Exception as e:
             QMessageBox.warning(self, "Migration failed", f"Error: {e}")
+
+    def export_db_csv_ui(self):
+        """Export the label DB to a CSV file chosen by the user (defaults to labels_db.csv)."""
+        path, _ = QFileDialog.getSaveFileName(self, "Export label DB", _db_path(), "CSV files (*.csv)")
+        if not path:
+            return
+        try:
+            count = export_db_csv(path)
+            QMessageBox.information(self, "Export complete", f"Exported {count} row(s) to:\n{path}")
+        except Exception as e:
+            QMessageBox.warning(self, "Export failed", f"Error: {e}")
         
         
 
@@ -5459,8 +8270,13 @@ class App(QMainWindow):
         connect_btn.setFixedSize(220, 44)
         manual_btn.setFixedSize(220, 44)
 
+        bulk_btn = QPushButton("Bulk Import…")
+        bulk_btn.setFixedSize(220, 36)
+        bulk_btn.setToolTip("Import many workbooks (or a whole folder) into the DB at once")
+
         btn_col.addWidget(connect_btn, alignment=Qt.AlignHCenter)
         btn_col.addWidget(manual_btn,  alignment=Qt.AlignHCenter)
+        btn_col.addWidget(bulk_btn,    alignment=Qt.AlignHCenter)
 
         center_wrap.addLayout(btn_col)
 
@@ -5478,6 +8294,7 @@ class App(QMainWindow):
         # Wire as before
         connect_btn.clicked.connect(self._on_connect)
         manual_btn.clicked.connect(self._build_manual)
+        bulk_btn.clicked.connect(self._on_bulk_import)
 
         # NEW: defer any heavy startup work until after the window is visible
         QTimer.singleShot(0, self._defer_startup_tasks)
@@ -5821,10 +8638,95 @@ class App(QMainWindow):
             self._excel_set_match_index(i + delta)
         except Exception:
             pass
+
+    def _stop_date_scan(self):
+        """Drop the running date scan (if any); its late signals are ignored."""
+        _stop_thread(getattr(self, "_date_scan_worker", None))
+        self._date_scan_worker = None
+        self._excel_date_scanning = False
+
+    def _cancel_date_scan(self):
+        """Stop looking for more date matches; the ones already found stay on the chip."""
+        self._stop_date_scan()
+        self._hide_busy()
+        found = len(getattr(self, "_excel_date_matches", None) or [])
+        try:
+            self.status.setText(f"Scan stopped. Found {found} file(s).")
+        except Exception:
+            pass
+        self._show_excel_date_chip()
+
+    def _show_excel_date_chip(self, scanning: bool = False):
+        """
+        Chip above the search box for the date matches (current one + count, "+" while scanning).
+        Click cycles, double-click / Enter imports, right-click lists them all.
+        """
+        ms = getattr(self, "_excel_date_matches", None)
+        if not ms:
+            return
+        self._excel_date_scanning = scanning
+        self._ensure_excel_popup()
+        btn = getattr(self, "_excel_suggest_btn", None)
+        if not _is_alive(btn):
+            return
+
+        def _render_chip():
+            ms = self._excel_date_matches
+            cur = ms[self._excel_date_index]
+            folder = os.path.basename(os.path.dirname(cur['path']))
+            count = f"{len(ms)}+" if getattr(self, "_excel_date_scanning", False) else len(ms)
+            label = f"{self._excel_date_index+1}/{count}  {cur['name']}  •  {folder}"
+            sh = cur.get("sheet")
+            if sh:
+                label += f" [{sh}]"
+            btn.setText(label)
+
+        def _cycle_next():
+            if not getattr(self, "_excel_date_matches", None):
+                return
+            self._excel_date_index = (self._excel_date_index + 1) % len(self._excel_date_matches)
+            _render_chip()
+
+        def _import(i: int):
+            cur = self._excel_date_matches[i]
+            self._stop_date_scan()   # picked while the scan was still going
+            self._open_recent_excel(cur["path"], cur.get("sheet") or None)
+
+        def _context_menu(point):
+            menu = QMenu(self)
+            for idx, m in enumerate(self._excel_date_matches):
+                folder = os.path.basename(os.path.dirname(m['path']))
+                act = menu.addAction(f"{idx+1}. {m['name']}  •  {folder}" + (f" [{m.get('sheet')}]" if m.get('sheet') else ""))
+                act.triggered.connect(
+                    lambda _=False, i=idx: (setattr(self, "_excel_date_index", i), _render_chip(), _import(i))
+                )
+            if getattr(self, "_excel_date_scanning", False):
+                menu.addSeparator()
+                menu.addAction("Stop scanning for more").triggered.connect(self._cancel_date_scan)
+            menu.exec(btn.mapToGlobal(point))
+
+        try:
+            for sig in (btn.clicked, btn.customContextMenuRequested):
+                try:
+                    sig.disconnect()
+                except Exception:
+                    pass
+            btn.clicked.connect(_cycle_next)
+            btn.mouseDoubleClickEvent = lambda e: _import(self._excel_date_index)
+            btn.setContextMenuPolicy(Qt.CustomContextMenu)
+            btn.customContextMenuRequested.connect(_context_menu)
+        except Exception:
+            pass
+
+        _render_chip()
+        self._place_excel_popup()
         
 
     def _on_excel_date_enter(self):
-        """When user presses Enter in the Excel search box with a date."""
+        """
+        When user presses Enter in the Excel search box with a date.
+        Catalogue hits show at once and the scan still runs to add new files.
+        """
         edit = getattr(self, "_excel_lookup_edit", None)
         if not edit:
             return
@@ -5835,6 +8737,7 @@ class App(QMainWindow):
                 if self._excel_lookup_popup.isVisible() and self._excel_date_matches:
                     idx = int(getattr(self, "_excel_date_index", 0) or 0)
                     cur = self._excel_date_matches[idx]
+                    self._stop_date_scan()   # picked while the scan was still going
                     self._open_recent_excel(cur["path"], cur.get("sheet") or None)
                     self._hide_excel_popup()
                     self._excel_date_matches = []
@@ -5859,17 +8762,55 @@ class App(QMainWindow):
 
         # Create worker
         cfg = load_headers_cfg() if "load_headers_cfg" in globals() else DEFAULT_HEADERS_CFG
-        self._date_scan_worker = DateScanWorker(target, cfg, per_root_cap=300, max_depth=4)
+        self._stop_date_scan()
+        self._excel_date_matches = []
+        self._excel_date_index = 0
 
         def _on_progress(path_str: str):
             try:
                 base = os.path.basename(path_str)
+                found = len(self._excel_date_matches or [])
                 if hasattr(self, "status") and self.status:
-                    self.status.setText(f"Scanning… {base}")
+                    self.status.setText(f"Scanning… {base}" + (f"  •  {found} found" if found else ""))
+            except Exception:
+                pass
+
+        root_keys = _scan_root_keys()
+        live: List[tuple] = []   # (rank, match), best first
+        live_keys: Set[Tuple[str, str]] = set()
+
+        def _on_match(m: dict):
+            # Show matches while the scan goes on: the chip and the Recent menu read the ranked list
+            try:
+                k = (m.get("path", ""), m.get("sheet", ""))
+                if k in live_keys:   # the scan finds catalogue hits again
+                    return
+                live_keys.add(k)
+                ms = self._excel_date_matches or []
+                cur = ms[self._excel_date_index] if ms else None
+                bisect.insort(live, (date_match_rank(m, root_keys), len(live), m))
+                self._excel_date_matches = [x for _, _, x in live]
+                self._excel_date_index = self._excel_date_matches.index(cur) if cur is not None else 0
+                if len(live) == 1:
+                    self._hide_busy()   # first hit: stop blocking the window, keep scanning
+                self._show_excel_date_chip(scanning=True)
+            except Exception:
+                pass
+
+        def _on_cancelled():
+            self._hide_busy()
+            try:
+                self.status.setText("Scan cancelled.")
             except Exception:
                 pass
+            self._date_scan_worker = None
+            self._excel_date_scanning = False
+            self._show_excel_date_chip()   # drops the "+" of the matches shown so far
 
         def _on_fail(err: Exception):
+            self._hide_busy()
+            self._excel_date_scanning = False
+            self._show_excel_date_chip()
             try:
                 self.status.setText("Scan failed.")
             except Exception:
@@ -5885,6 +8826,8 @@ class App(QMainWindow):
             self._date_scan_worker = None
 
         def _on_done(matches: list):
+            self._hide_busy()
+            self._excel_date_scanning = False
             try:
                 self.status.setText(f"Found {len(matches)} file(s).")
             except Exception:
@@ -5904,6 +8847,9 @@ class App(QMainWindow):
 
             if len(matches) == 1:
                 choice = matches[0]
+                if live:   # its chip went up while scanning; opening it settles that
+                    self._hide_excel_popup()
+                    self._excel_date_matches = []
                 self._open_recent_excel(choice["path"], choice.get("sheet") or None)
                 try:
                     _stop_thread(self._date_scan_worker)
@@ -5936,72 +8882,12 @@ class App(QMainWindow):
             pt = edit.mapToGlobal(edit.rect().topLeft())
             menu.exec(pt)
 
-            # Also update the small chip to show the first entry + count (optional)
-            self._ensure_excel_popup()
-            btn = getattr(self, "_excel_suggest_btn", None)
-            if btn:
-                first = matches[0]
-                folder = os.path.basename(os.path.dirname(first['path']))
-                btn.setText(f"1/{len(matches)}  {first['name']}  •  {folder}" + (f" [{first.get('sheet')}]" if first.get('sheet') else ""))
-                self._place_excel_popup()
-
-            # store for Enter-to-import current
+            # store for Enter-to-import current; the chip shows it + the count (keeps a live pick)
+            prev = self._excel_date_matches or []
+            cur = prev[self._excel_date_index] if prev and self._excel_date_index < len(prev) else None
             self._excel_date_matches = matches
-            self._excel_date_index   = 0
-
-
-            def _render_chip():
-                cur = self._excel_date_matches[self._excel_date_index]
-                folder = os.path.basename(os.path.dirname(cur['path']))
-                label = f"{self._excel_date_index+1}/{len(self._excel_date_matches)}  {cur['name']}  •  {folder}"
-                sh = cur.get("sheet")
-                if sh:
-                    label += f" [{sh}]"
-                btn.setText(label)
-
-            def _cycle_next():
-                if not getattr(self, "_excel_date_matches", None):
-                    return
-                self._excel_date_index = (self._excel_date_index + 1) % len(self._excel_date_matches)
-                _render_chip()
-
-            def _import_current():
-                cur = self._excel_date_matches[self._excel_date_index]
-                self._open_recent_excel(cur["path"], cur.get("sheet") or None)
-
-            try:
-                try:
-                    btn.clicked.disconnect()
-                except Exception:
-                    pass
-                btn.clicked.connect(_cycle_next)
-                btn.mouseDoubleClickEvent = lambda e: _import_current()
-            except Exception:
-                pass
-
-            self._place_excel_popup()
-
-            def _context_menu(point):
-                menu = QMenu(self)
-                for idx, m in enumerate(self._excel_date_matches):
-                    folder = os.path.basename(os.path.dirname(m['path']))
-                    act = menu.addAction(f"{idx+1}. {m['name']}  •  {folder}" + (f" [{m.get('sheet')}]" if m.get('sheet') else ""))
-                    act.triggered.connect(
-                        lambda _=False, i=idx: (
-                            setattr(self, "_excel_date_index", i),
-                            _render_chip(),
-                            self._open_recent_excel(self._excel_date_matches[i]['path'], self._excel_date_matches[i].get('sheet') or None)
-                        )
-                    )
-                menu.exec(btn.mapToGlobal(point))
-
-            try:
-                btn.setContextMenuPolicy(Qt.CustomContextMenu)
-                btn.customContextMenuRequested.connect(_context_menu)
-            except Exception:
-                pass
-
-            _render_chip()
+            self._excel_date_index   = matches.index(cur) if cur in matches else 0
+            self._show_excel_date_chip()
 
             try:
                 _stop_thread(self._date_scan_worker)
@@ -6009,12 +8895,33 @@ class App(QMainWindow):
                 pass
             self._date_scan_worker = None
 
-        self._date_scan_worker.progress.connect(_on_progress)
-        self._date_scan_worker.failed.connect(_on_fail)
-        self._date_scan_worker.finished_ok.connect(_on_done)
-        self._date_scan_worker.start()
-        self._date_scan_worker.finished_ok.connect(_on_done)
-        self._date_scan_worker.start()
+        # Workbooks seen by an earlier scan answer from the catalogue at once; the (incremental) scan
+        # still runs so new downloads for that date get merged in
+        try:
+            hits = rank_date_matches(catalog_date_matches(target, cfg), root_keys) if WORKBOOK_CATALOG else []
+        except Exception:
+            hits = []
+
+        def _on_scan_done(matches: list):
+            found = {(m.get("path", ""), m.get("sheet", "")) for m in matches}
+            extra = [m for m in hits if (m.get("path", ""), m.get("sheet", "")) not in found]
+            _on_done(rank_date_matches(matches + extra, root_keys) if extra else matches)
+
+        self._date_scan_worker = worker = DateScanWorker(target, cfg, per_root_cap=300, max_depth=4)
+        # a scan dropped for a newer one (or a pick from the chip) must not touch the UI any more
+        live_only = lambda fn: (lambda *a: fn(*a) if self._date_scan_worker is worker else None)
+        if not hits:
+            self._show_busy(f"Scanning files for {target.strftime('%d/%m/%Y')}…",
+                            on_cancel=worker.cancel)
+        worker.progress.connect(live_only(_on_progress))
+        worker.match_found.connect(live_only(_on_match))
+        worker.fraction.connect(live_only(self._busy_progress))
+        worker.cancelled.connect(live_only(_on_cancelled))
+        worker.failed.connect(live_only(_on_fail))
+        worker.finished_ok.connect(live_only(_on_scan_done))
+        for m in hits:
+            _on_match(m)
+        worker.start()
 
 
 
@@ -6035,7 +8942,12 @@ class App(QMainWindow):
                 sheet = m.get("sheet") or ""
                 label = f"{idx+1}. {name}  •  {folder}" + (f" [{sheet}]" if sheet else "")
                 act = menu.addAction(label)
-                act.triggered.connect(lambda _=False, p=m["path"], s=m.get("sheet") or None: self._open_recent_excel(p, s))
+                act.triggered.connect(lambda _=False, p=m["path"], s=m.get("sheet") or None:
+                                      (self._stop_date_scan(), self._open_recent_excel(p, s)))
+            if getattr(self, "_excel_date_scanning", False):
+                menu.addSeparator()
+                menu.addAction("Scanning for more…").setEnabled(False)
+                menu.addAction("Stop scanning").triggered.connect(self._cancel_date_scan)
             menu.exec(btn.mapToGlobal(btn.rect().bottomLeft()))
             return
 
@@ -6065,10 +8977,67 @@ class App(QMainWindow):
 
         
 
+    def _probe_import_sheet(self, full_path: str):
+        """Probe the sheets behind the busy overlay, then _open_recent_excel with the chosen one."""
+        file_name = os.path.basename(full_path)
+        self._import_worker = worker = SheetProbeWorker(full_path)
+
+        def _cancel():
+            # the open itself can't be interrupted: drop the worker and let it finish unseen
+            if getattr(self, "_import_worker", None) is worker:
+                self._import_worker = None
+                self._hide_busy()
+                self._import_status(f"Import of {file_name} cancelled.")
+            _stop_thread(worker)
+
+        def _ok(probes):
+            if getattr(self, "_import_worker", None) is not worker:
+                return
+            self._import_worker = None
+            self._hide_busy()
+            sheet = self._pick_import_sheet(full_path, probes)
+            if sheet is not None:
+                self._open_recent_excel(full_path, sheet)
+
+        def _fail(_err: Exception):
+            # unreadable for the probe: the import itself reports the error
+            if getattr(self, "_import_worker", None) is not worker:
+                return
+            self._import_worker = None
+            self._hide_busy()
+            self._open_recent_excel(full_path, "")
+
+        self._show_busy(f"Opening {file_name}…", on_cancel=_cancel)
+        worker.finished_ok.connect(_ok)
+        worker.failed.connect(_fail)
+        worker.start()
+
+    def _pick_import_sheet(self, full_path: str, every: List[dict]) -> Optional[str]:
+        """
+        Sheet to import from SheetProbeWorker's probes: the only sheet whose header maps 2+ fields,
+        or the user's choice (with a mapping preview) when several do. "" = first sheet; None = cancelled.
+        """
+        first = every[0]["sheet"] if every else ""
+        probes = [p for p in every if len(p["mapping"]) >= 2]
+        if len(probes) <= 1:
+            return probes[0]["sheet"] if probes and probes[0]["sheet"] != first else ""
+        labels = []
+        for p in probes:
+            preview = ", ".join(f"{k}←{v}" for k, v in p["mapping"].items())
+            if len(preview) > 90:
+                preview = preview[:87] + "…"
+            labels.append(f"{p['sheet']}  •  {len(p['mapping'])} fields: {preview}")
+        choice, ok = QInputDialog.getItem(self, "Import", f"Sheet to import from {os.path.basename(full_path)}:",
+                                          labels, 0, False)
+        if not ok:
+            return None
+        sheet = probes[labels.index(choice)]["sheet"]
+        return "" if sheet == first else sheet
+
     def _open_recent_excel(self, full_path: str, sheet_name: Optional[str] = None):
         """
         Import a recently-downloaded Excel file directly (fast pandas path).
-        Uses first sheet by default. Remembers for Quick Import.
+        Without a sheet, the sheet probe picks it (or asks) first. Remembers for Quick Import.
         """
         try:
             if not full_path or not os.path.exists(full_path):
@@ -6076,25 +9045,34 @@ class App(QMainWindow):
                 return
 
             file_name = os.path.basename(full_path)
-            sheet_name = ""  # unknown; use default first sheet
+            if sheet_name is None and not is_text_table(full_path):
+                self._probe_import_sheet(full_path)   # comes back here with the sheet
+                return
+            sheet_name = sheet_name or ""  # "": default first sheet
+            if wants_direct_db_import(full_path):
+                self._import_table_to_db(full_path, file_name, sheet_name)
+                return
 
-            # Busy overlay during background read
-            self._show_busy(f"Reading {file_name}…")
-            self._import_worker = ExcelFastImportWorker(full_path, None)
+            # Busy overlay (progress + Cancel) during background read
+            self._import_worker = worker = ExcelFastImportWorker(full_path, sheet_name or None, stream=EXCEL_STREAM_IMPORT)
+            self._show_busy(f"Reading {file_name}…", on_cancel=self._cancel_import)
 
             def _ok(rows, mapping):
                 try:
+                    self._last_read_stats = getattr(self._import_worker, "stats", None) or {}
                     # app/wb/ws are None in this path
                     self._finalize_import(
                         rows, mapping, file_name, full_path, sheet_name,
-                        None, None, None, used_fast=True
+                        None, None, None, used_fast=True,
+                        streamed=getattr(self, "_excel_streaming", False)
                     )
-                    # Remember for Quick Import (sheet left blank)
+                    # Remember for Quick Import
                     try:
                         remember_excel_source(file_name, full_path, sheet_name)
                     except Exception:
                         pass
                 finally:
+                    self._excel_streaming = False
                     self._hide_busy()
                     self._import_worker = None
 
@@ -6102,9 +9080,14 @@ class App(QMainWindow):
                 try:
                     QMessageBox.critical(self, "Import", f"Could not read file:\n{err}")
                 finally:
+                    self._excel_streaming = False
                     self._hide_busy()
                     self._import_worker = None
 
+            self._import_worker.rows_chunk.connect(
+                lambda chunk, mapping: self._on_stream_chunk(worker, chunk, mapping, file_name, sheet_name))
+            self._import_worker.fraction.connect(lambda f: self._on_import_progress(worker, f))
+            self._import_worker.cancelled.connect(lambda: self._on_import_cancelled(worker, file_name))
             self._import_worker.finished_ok.connect(_ok)
             self._import_worker.failed.connect(_fail)
             self._import_worker.start()
@@ -6163,6 +9146,7 @@ class App(QMainWindow):
     def _import_saved_excel(self, src: dict):
         """Quick Import: prefer reading from the remembered file (shows even incomplete rows).
         DB is used as a fallback, and only complete rows are saved to the DB.
+        The file is read on a worker (busy overlay with progress + Cancel).
         """
         name  = (src.get("name")  or "").strip()     # workbook base name
         sheet = (src.get("sheet") or "").strip()
@@ -6175,50 +9159,79 @@ class App(QMainWindow):
 
         # --- Prefer the file on disk (shows rows even if BRAND is missing) ---
         if path and os.path.exists(path):
-            try:
-                fresh_rows, mapping = _read_excel_fast(path, sheet or None)
-            except Exception as e:
+            if getattr(self, "_import_worker", None) is not None:
+                return
+            self._import_worker = worker = ExcelFastImportWorker(path, sheet or None)
+            self._show_busy(f"Reading {name}…", on_cancel=self._cancel_import)
+
+            def _done():
+                self._hide_busy()
+                self._import_worker = None
+
+            def _ok(rows, mapping):
+                self._last_read_stats = worker.stats
+                _done()
+                if rows:
+                    self._quick_import_file_rows(name, sheet, path, rows, mapping)
+                else:
+                    self._quick_import_from_db(name, sheet, path)
+
+            def _fail(err: Exception):
                 # If file read fails, fall back to DB
-                fresh_rows, mapping = [], {h: h for h in all_headers()}
-                QMessageBox.warning(self, "Import", f"Could not read file directly:\n{e}\n\nFalling back to DB…")
-
-            if fresh_rows:
-                # Enrich + persist (DB gate will skip incomplete rows by design)
-                enriched = []
-                for r in fresh_rows:
-                    nr = {k: "" for k in all_headers()}
-                    nr.update(r)
-                    nr["SOURCE_FILE"]  = name
-                    nr["SOURCE_SHEET"] = sheet
-                    enriched.append(nr)
-                try:
-                    upsert_db_rows(enriched)
-                except Exception as e:
-                    QMessageBox.critical(self, "DB Save", f"Could not save rows from Quick Import:\n{e}")
-
-                # UI should reflect what we actually parsed (even if not saved)
-                saved_count = sum(1 for r in enriched if _is_complete_db_row(r))
-                self.status.setText(
-                    f"Loaded {len(fresh_rows)} rows from file: {name}"
-                    + (f" [{sheet}]" if sheet else "")
-                    + f"  •  saved {saved_count} complete rows to DB"
-                )
-                self.connected = (None, None, None)
-                self.preview_rows = fresh_rows
-                self.preview_qty  = [1] * len(fresh_rows)
-                self.last_mapping = mapping
-                self._hide_excel_popup()
-                self._build_generate_from_excel()
+                _done()
+                QMessageBox.warning(self, "Import", f"Could not read file directly:\n{err}\n\nFalling back to DB…")
+                self._quick_import_from_db(name, sheet, path)
+
+            worker.fraction.connect(lambda f: self._on_import_progress(worker, f))
+            worker.cancelled.connect(lambda: self._on_import_cancelled(worker, name))
+            worker.finished_ok.connect(_ok)
+            worker.failed.connect(_fail)
+            worker.start()
+            return
 
-                # Remember recency & prune
-                try:
-                    remember_excel_source(name, path, sheet)
-                    _prune_db_to_recent_sources(limit=15)
-                except Exception:
-                    pass
-                return
+        self._quick_import_from_db(name, sheet, path)
+
+    def _quick_import_file_rows(self, name: str, sheet: str, path: str, fresh_rows: list, mapping: dict):
+        """Quick Import, rows read from the file: enrich, persist complete ones, show all."""
+        # Enrich + persist (DB gate will skip incomplete rows by design)
+        for r in fresh_rows:
+            r["SOURCE_FILE"]  = name
+            r["SOURCE_SHEET"] = sheet
+        staged = normalize_db_rows(fresh_rows)
+        try:
+            delta = classify_import_delta(staged, normalized=True)
+        except Exception:
+            delta = []
+        try:
+            upsert_db_rows(staged, normalized=True)
+        except Exception as e:
+            QMessageBox.critical(self, "DB Save", f"Could not save rows from Quick Import:\n{e}")
+
+        # UI should reflect what we actually parsed (even if not saved)
+        saved_count = sum(1 for r in fresh_rows if _is_complete_db_row(r))
+        self.status.setText(
+            f"Loaded {len(fresh_rows)} rows from file: {name}"
+            + (f" [{sheet}]" if sheet else "")
+            + f"  •  saved {saved_count} complete rows to DB"
+            + (f"  •  {delta_summary(delta)}" if delta else "")
+        )
+        self.connected = (None, None, None)
+        self.preview_rows = fresh_rows
+        self.preview_qty  = [1] * len(fresh_rows)
+        self.preview_delta = delta
+        self.last_mapping = mapping
+        self._hide_excel_popup()
+        self._build_generate_from_excel()
+
+        # Remember recency & prune
+        try:
+            remember_excel_source(name, path, sheet)
+            _prune_db_to_recent_sources(limit=15)
+        except Exception:
+            pass
 
-        # --- Fallback: use whatever is in the DB for this (file, sheet) ---
+    def _quick_import_from_db(self, name: str, sheet: str, path: str):
+        """Quick Import fallback: use whatever is in the DB for this (file, sheet)."""
         allrows = load_db_rows()
         rows = [dict(r) for r in allrows
                 if (r.get("SOURCE_FILE", "") == name) and (not sheet or r.get("SOURCE_SHEET", "") == sheet)]
@@ -6239,6 +9252,7 @@ class App(QMainWindow):
         self.connected = (None, None, None)
         self.preview_rows = rows
         self.preview_qty  = [1] * len(rows)
+        self.preview_delta = []
         self.last_mapping = mapping
         self._hide_excel_popup()
         self._build_generate_from_excel()
@@ -6357,13 +9371,21 @@ class App(QMainWindow):
 
 
         # Saved workbook → run fast pandas read in background
+        if full and os.path.exists(full) and wants_direct_db_import(full):
+            self.connected = (app, wb, ws)
+            self._import_table_to_db(full, file_name, sheet_name)
+            return
         if full and os.path.exists(full):
-            self._import_worker = ExcelFastImportWorker(full, sheet_name or None)
+            self._import_worker = worker = ExcelFastImportWorker(full, sheet_name or None, stream=EXCEL_STREAM_IMPORT)
+            self._show_busy(f"Reading {file_name}…", on_cancel=self._cancel_import)
 
             def _fast_ok(rows, mapping):
                 try:
-                    self._finalize_import(rows, mapping, file_name, full, sheet_name, app, wb, ws, used_fast=True)
+                    self._last_read_stats = getattr(self._import_worker, "stats", None) or {}
+                    self._finalize_import(rows, mapping, file_name, full, sheet_name, app, wb, ws, used_fast=True,
+                                          streamed=getattr(self, "_excel_streaming", False))
                 finally:
+                    self._excel_streaming = False
                     self._hide_busy()
                     self._import_worker = None
 
@@ -6378,9 +9400,14 @@ class App(QMainWindow):
                         f"Fast read failed:\n{err}\n\nFallback read failed:\n{e}"
                     )
                 finally:
+                    self._excel_streaming = False
                     self._hide_busy()
                     self._import_worker = None
 
+            self._import_worker.rows_chunk.connect(
+                lambda chunk, mapping: self._on_stream_chunk(worker, chunk, mapping, file_name, sheet_name))
+            self._import_worker.fraction.connect(lambda f: self._on_import_progress(worker, f))
+            self._import_worker.cancelled.connect(lambda: self._on_import_cancelled(worker, file_name))
             self._import_worker.finished_ok.connect(_fast_ok)
             self._import_worker.failed.connect(_fast_fail)
             self._import_worker.start()
@@ -6396,14 +9423,19 @@ class App(QMainWindow):
             self._hide_busy()
 
 
-    def _show_busy(self, message: str = "Working…"):
-        """Lightweight translucent overlay that blocks clicks while work runs."""
+    def _show_busy(self, message: str = "Working…", on_cancel: Optional[Callable] = None):
+        """
+        Lightweight translucent overlay that blocks clicks while work runs.
+        With on_cancel it offers a Cancel button; _busy_progress() fills in its progress bar.
+        """
         try:
             if getattr(self, "_busy", None):
                 # Update message if already showing
                 lbl = self._busy.findChild(QLabel, "busy_msg")
                 if lbl:
                     lbl.setText(message)
+                if on_cancel is not None:
+                    self._busy_set_cancel(on_cancel)
                 return
             dlg = QDialog(self, Qt.FramelessWindowHint | Qt.Dialog)
             dlg.setModal(True)  # ApplicationModal by default for QDialog children
@@ -6425,8 +9457,20 @@ class App(QMainWindow):
             msg.setAlignment(Qt.AlignCenter)
             sub = QLabel("Please wait…")
             sub.setAlignment(Qt.AlignCenter)
+            bar = QProgressBar()
+            bar.setObjectName("busy_bar")
+            bar.setRange(0, 1000)
+            bar.setFormat("%p%")
+            bar.setMinimumWidth(260)
+            bar.hide()   # until the job reports a fraction
+            cancel = QPushButton("Cancel")
+            cancel.setObjectName("busy_cancel")
+            cancel.clicked.connect(self._busy_cancel_clicked)
+            cancel.hide()
             card_layout.addWidget(msg)
             card_layout.addWidget(sub)
+            card_layout.addWidget(bar)
+            card_layout.addWidget(cancel, 0, Qt.AlignCenter)
 
             root.addStretch(1)
             row = QHBoxLayout()
@@ -6450,9 +9494,39 @@ class App(QMainWindow):
             dlg.setGeometry(g)
             dlg.show()
             self._busy = dlg
+            if on_cancel is not None:
+                self._busy_set_cancel(on_cancel)
         except Exception:
             self._busy = None  # never block if something goes wrong
 
+    def _busy_set_cancel(self, on_cancel: Callable):
+        self._busy_on_cancel = on_cancel
+        btn = self._busy.findChild(QPushButton, "busy_cancel")
+        if btn is not None:
+            btn.setEnabled(True)
+            btn.setText("Cancel")
+            btn.show()
+
+    def _busy_cancel_clicked(self):
+        busy = getattr(self, "_busy", None)
+        btn = busy.findChild(QPushButton, "busy_cancel") if alive(busy) else None
+        if btn is not None:
+            btn.setEnabled(False)
+            btn.setText("Cancelling…")
+        cb = getattr(self, "_busy_on_cancel", None)
+        if cb is not None:
+            cb()
+
+    def _busy_progress(self, fraction: float):
+        """Show `fraction` (0..1) on the busy overlay's progress bar, if the overlay is up."""
+        busy = getattr(self, "_busy", None)
+        if not alive(busy):
+            return
+        bar = busy.findChild(QProgressBar, "busy_bar")
+        if bar is not None:
+            bar.show()
+            bar.setValue(int(round(min(1.0, max(0.0, fraction)) * 1000)))
+
 
     def _hide_busy(self):
         """Close the busy overlay if shown."""
@@ -6461,29 +9535,119 @@ class App(QMainWindow):
                 self._busy.close()
         finally:
             self._busy = None
+            self._busy_on_cancel = None
+
+    def _on_bulk_import(self):
+        """Pick several workbooks or a folder, then import them all in parallel."""
+        if getattr(self, "_bulk_worker", None):
+            return
+        menu = QMenu(self)
+        act_files = menu.addAction("Select workbooks…")
+        act_dir = menu.addAction("Select folder…")
+        chosen = menu.exec(QCursor.pos())
+        start = os.path.join(os.path.expanduser("~"), "Downloads")
+        if chosen is act_files:
+            paths, _ = QFileDialog.getOpenFileNames(
+                self, "Bulk import workbooks", start, "Excel / CSV files (*.xlsx *.xlsm *.xls *.xlsb *.csv *.tsv)")
+        elif chosen is act_dir:
+            folder = QFileDialog.getExistingDirectory(self, "Bulk import folder", start)
+            paths = bulk_excel_paths(folder) if folder else []
+            if folder and not paths:
+                QMessageBox.information(self, "Bulk Import", f"No Excel workbooks found in:\n{folder}")
+        else:
+            return
+        if paths:
+            self._start_bulk_import(paths)
 
+    def _start_bulk_import(self, paths: List[str]):
+        total = len(paths)
+        done = [0]
+        self._bulk_worker = worker = BulkImportWorker(paths, FRESH_SECTION_ACTIVE)
+        self._show_busy(f"Importing {total} workbook(s)…", on_cancel=worker.cancel)
 
+        def _one(rep: dict):
+            done[0] += 1
+            self._show_busy(f"Read {done[0]}/{total}: {rep.get('name', '')}")
 
-    def _finalize_import(self, rows, mapping, file_name, full, sheet_name, app, wb, ws, used_fast: bool):
-        """Common post-read path: normalize, upsert, remember, and navigate."""
-        # Normalize
-        for r in rows:
-            r["BARCODE"] = clean_barcode(r.get("BARCODE", ""))
-            for p in ("REG", "PROMO", "COOP", "REGULAR_PRICE", "PROMO_PRICE"):
-                r[p] = price_text(r.get(p, ""))
-            for d in ("START_DATE", "END_DATE"):
-                r[d] = date_only(r.get(d, ""))
+        def _ok(reports: list):
+            self._hide_busy()
+            self._bulk_worker = None
+            self._show_bulk_report(reports)
+
+        def _fail(err: Exception):
+            self._hide_busy()
+            self._bulk_worker = None
+            QMessageBox.critical(self, "Bulk Import", f"Bulk import failed:\n{err}")
+
+        def _cancelled():
+            self._hide_busy()
+            self._bulk_worker = None
+            self._import_status(f"Bulk import cancelled after {done[0]}/{total} file(s); nothing saved.")
+
+        self._bulk_worker.fraction.connect(self._busy_progress)
+        self._bulk_worker.cancelled.connect(_cancelled)
+        self._bulk_worker.file_done.connect(_one)
+        self._bulk_worker.finished_ok.connect(_ok)
+        self._bulk_worker.failed.connect(_fail)
+        self._bulk_worker.start()
+
+    def _show_bulk_report(self, reports: List[dict]):
+        """Per-file summary: rows read, rows saved, mapping and timing."""
+        dlg = QDialog(self)
+        dlg.setWindowTitle("Bulk Import")
+        dlg.resize(900, 420)
+        lay = QVBoxLayout(dlg)
+        rows_total = sum(r.get("rows", 0) for r in reports)
+        saved_total = sum(r.get("saved", 0) for r in reports)
+        failed = sum(1 for r in reports if r.get("error"))
+        lay.addWidget(QLabel(
+            f"{len(reports)} file(s) • {rows_total} rows read • {saved_total} complete rows saved to DB"
+            + (f" • {failed} failed" if failed else "")))
+
+        cols = ["File", "Sheet", "Rows", "Saved", "Seconds", "Reader", "Mapping / Error"]
+        tbl = QTableWidget(len(reports), len(cols))
+        tbl.setHorizontalHeaderLabels(cols)
+        tbl.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        for i, r in enumerate(reports):
+            mapping = ", ".join(f"{k}←{v}" for k, v in (r.get("mapping") or {}).items())
+            vals = [r.get("name", ""), r.get("sheet", ""), str(r.get("rows", 0)), str(r.get("saved", 0)),
+                    f"{r.get('seconds', 0):.2f}", r.get("reader", ""), r.get("error") or mapping]
+            for j, v in enumerate(vals):
+                it = QTableWidgetItem(v)
+                it.setToolTip(v)
+                tbl.setItem(i, j, it)
+        hdr = tbl.horizontalHeader()
+        for j in range(len(cols) - 1):
+            hdr.setSectionResizeMode(j, QHeaderView.ResizeToContents)
+        hdr.setSectionResizeMode(len(cols) - 1, QHeaderView.Stretch)
+        lay.addWidget(tbl)
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(dlg.accept)
+        lay.addWidget(close_btn, alignment=Qt.AlignRight)
+        dlg.exec()
+
+
+
+    def _prepare_import_rows(self, rows, file_name, sheet_name):
+        prepare_import_rows(rows, file_name, sheet_name)
 
-        # Persist to DB
+    def _finalize_import(self, rows, mapping, file_name, full, sheet_name, app, wb, ws, used_fast: bool,
+                         streamed: bool = False):
+        """Common post-read path: normalize, upsert, remember, and navigate.
+        streamed=True: rows were prepared and shown chunk by chunk (see _on_stream_chunk)."""
+        if not streamed:
+            self._prepare_import_rows(rows, file_name, sheet_name)
+
+        # Persist to DB (upsert fills missing headers itself)
+        delta: List[str] = []
         try:
-            enriched = []
-            for r in rows:
-                nr = dict({k: "" for k in all_headers()})
-                nr.update(r)
-                nr["SOURCE_FILE"]  = file_name
-                nr["SOURCE_SHEET"] = sheet_name
-                enriched.append(nr)
-            upsert_db_rows(enriched)
+            staged = normalize_db_rows(rows)   # once, for the delta and the upsert
+            try:
+                delta = classify_import_delta(staged, normalized=True)  # before the upsert overwrites the old prices
+            except Exception:
+                delta = []
+            upsert_db_rows(staged, normalized=True)
         except Exception as e:
             QMessageBox.critical(self, "DB Save", f"Could not save rows: {e}")
 
@@ -6503,16 +9667,168 @@ class App(QMainWindow):
 
         # ✅ UI should reflect what was actually read, even if some rows weren’t saved
         #    (DB gate blocks rows missing BARCODE/BRAND/ITEM, but we still want to show them here)
-        self.preview_rows = rows
-        self.preview_qty  = [1] * len(self.preview_rows)
+        if not streamed or len(getattr(self, "preview_rows", ())) != len(rows):
+            self.preview_rows = rows
+            self.preview_qty  = [1] * len(self.preview_rows)
+        self.preview_delta = delta
         self.last_mapping = mapping
 
         how = "fast reader" if used_fast else "Excel"
-        self.status.setText(
+        reader = _reader_label(getattr(self, "_last_read_stats", None) or {}) if used_fast else ""
+        if reader:
+            how += f": {reader}"
+        self._import_status(
             f"Connected: {file_name} → {sheet_name} (imported {len(rows)} rows via {how}; "
             f"saved {sum(1 for r in rows if _is_complete_db_row(r))} complete rows to DB)"
+            + (f"  •  {delta_summary(delta)}" if delta else "")
         )
-        self._build_mapping()
+        if streamed:
+            self._excel_stream_finished()
+        else:
+            self._build_mapping()
+
+    def _on_stream_chunk(self, worker, chunk, mapping, file_name, sheet_name):
+        """Streamed import: the first chunk opens the Excel grid, later ones are appended to it."""
+        if getattr(self, "_import_worker", None) is not worker:
+            return
+        self._prepare_import_rows(chunk, file_name, sheet_name)
+        if not getattr(self, "_excel_streaming", False):
+            self._excel_streaming = True
+            self._hide_busy()
+            self.preview_rows, self.preview_qty, self.preview_delta = [], [], []
+            self.last_mapping = mapping
+            self._excel_stream_append(chunk)
+            self._build_generate(source="excel")
+        else:
+            self._excel_stream_append(chunk)
+        self._import_status(f"Reading {file_name}… {len(self.preview_rows)} rows so far")
+
+    def _import_status(self, text: str):
+        """Home status line, or the Excel grid caption once a streamed import has opened the grid."""
+        st = _safe_widget(self, "status")
+        if st is not None:
+            st.setText(text)
+        cap = _safe_widget(self, "_excel_caption")
+        if cap is not None and getattr(self, "_current_gen_source", None) == "excel":
+            cap.setText(cap.text().split("  •  ")[0] + "  •  " + text)
+
+    def _on_import_progress(self, worker, fraction: float):
+        """Reader progress: busy overlay bar, or the grid's Stop button once rows are streaming."""
+        if getattr(self, "_import_worker", None) is not worker:
+            return
+        self._busy_progress(fraction)
+        stop = _safe_widget(self, "_excel_stop_btn")
+        if stop is not None and stop.isEnabled():
+            stop.setText(f"Stop reading ({int(fraction * 100)}%)")
+
+    def _cancel_import(self):
+        worker = getattr(self, "_import_worker", None)
+        if worker is not None:
+            worker.cancel()
+        stop = _safe_widget(self, "_excel_stop_btn")
+        if stop is not None:
+            stop.setEnabled(False)
+            stop.setText("Stopping…")
+
+    def _on_import_cancelled(self, worker, file_name: str):
+        """Import stopped by the user: nothing is saved; streamed rows stay on the grid."""
+        if getattr(self, "_import_worker", None) is not worker:
+            return
+        try:
+            if getattr(self, "_excel_streaming", False):
+                self._excel_stream_finished()
+                self._import_status(f"Stopped reading {file_name}: {len(self.preview_rows)} rows shown, nothing saved")
+            else:
+                self._import_status(f"Import of {file_name} cancelled.")
+        finally:
+            self._excel_streaming = False
+            self._hide_busy()
+            self._import_worker = None
+
+    def _import_clipboard_table(self, text: str):
+        """Range copied from a sheet (TSV with a header): import it into the Excel grid like a file."""
+        if getattr(self, "_import_worker", None) is not None:
+            return
+        file_name = CLIPBOARD_SOURCE_NAME
+        self._import_worker = worker = ClipboardImportWorker(text)
+        self._show_busy("Reading pasted rows…", on_cancel=self._cancel_import)
+
+        def _ok(rows, mapping):
+            try:
+                self._last_read_stats = worker.stats
+                self._finalize_import(rows, mapping, file_name, "", "", None, None, None, used_fast=True)
+            finally:
+                self._hide_busy()
+                self._import_worker = None
+
+        def _fail(err: Exception):
+            try:
+                QMessageBox.critical(self, "Paste", f"Could not read the pasted rows:\n{err}")
+            finally:
+                self._hide_busy()
+                self._import_worker = None
+
+        worker.fraction.connect(lambda f: self._on_import_progress(worker, f))
+        worker.cancelled.connect(lambda: self._on_import_cancelled(worker, "pasted rows"))
+        worker.finished_ok.connect(_ok)
+        worker.failed.connect(_fail)
+        worker.start()
+
+    def _import_table_to_db(self, full_path: str, file_name: str, sheet_name: str = ""):
+        """Large CSV/TSV: stream it straight into the DB (no grid), then report what was saved."""
+        self._import_worker = worker = TableToDbWorker(full_path, sheet_name, file_name)
+        self._show_busy(f"Importing {file_name} into the DB…", on_cancel=self._cancel_import)
+
+        def _done(summary: dict, stopped: bool = False):
+            if getattr(self, "_import_worker", None) is not worker:
+                return
+            try:
+                if summary.get("rows"):
+                    try:
+                        remember_excel_source(file_name, full_path, sheet_name)
+                    except Exception:
+                        pass
+                    try:
+                        _prune_db_to_recent_sources(limit=15)
+                    except Exception:
+                        pass
+                reader = _reader_label(worker.stats)
+                self._import_status(
+                    ("Stopped: " if stopped else "Imported: ")
+                    + f"{file_name} ({summary.get('rows', 0)} rows streamed into the DB"
+                    + (f" via {reader}" if reader else "")
+                    + f"; saved {summary.get('saved', 0)} complete rows)"
+                    + (f"  •  {delta_summary(summary['delta'])}" if summary.get("delta") else "")
+                )
+            finally:
+                self._hide_busy()
+                self._import_worker = None
+
+        def _fail(err: Exception):
+            try:
+                QMessageBox.critical(self, "Import", f"Could not import file:\n{err}")
+            finally:
+                self._hide_busy()
+                self._import_worker = None
+
+        worker.fraction.connect(lambda f: self._on_import_progress(worker, f))
+        worker.cancelled.connect(lambda: _done(worker.summary, stopped=True))
+        worker.finished_ok.connect(_done)
+        worker.failed.connect(_fail)
+        worker.start()
+
+    def _excel_stream_finished(self):
+        """Stream over: enable delta-based checking and decorate the grid once."""
+        self._excel_streaming = False
+        stop = _safe_widget(self, "_excel_stop_btn")
+        if stop is not None:
+            stop.hide()
+        if getattr(self, "_current_gen_source", None) != "excel" or not _is_alive(getattr(self, "tree", None)):
+            return
+        self._excel_sync_changed_btn()
+        timer = getattr(self, "_excel_batch_timer", None)
+        if timer is None or not timer.isActive():
+            self._excel_fill_batch()  # all rows already in: runs the final header/qty pass
 
 
 
@@ -6644,6 +9960,12 @@ class App(QMainWindow):
             self._excel_coop_btn.setToolTip("Show only rows with COOP price > 0.00")
             sb.addWidget(self._excel_coop_btn)
 
+            self._excel_changed_btn = QPushButton("Check changed")
+            self._excel_changed_btn.setFixedHeight(28); self._excel_changed_btn.setMinimumWidth(120)
+            self._excel_sync_changed_btn()
+            self._excel_changed_btn.clicked.connect(self._excel_check_changed_only)
+            sb.addWidget(self._excel_changed_btn)
+
             # --- Debounced search wiring (Excel screen) ---
             if not hasattr(self, "_debounce_excel_search") or self._debounce_excel_search is None:
                 self._debounce_excel_search = Debouncer(150, lambda: self._excel_refresh_table(), self)
@@ -6656,7 +9978,15 @@ class App(QMainWindow):
                 self._excel_refresh_table()  # filtering change should apply immediately
             self._excel_coop_btn.clicked.connect(_flip_coop_only)
 
-            wrap_layout.addWidget(QLabel("Imported Data (☑ = selected; double-click Q to edit)", objectName="Small"))
+            self._excel_caption = QLabel("Imported Data (☑ = selected; double-click Q to edit)", objectName="Small")
+            cap_row = QHBoxLayout()
+            cap_row.addWidget(self._excel_caption, 1)
+            # streamed import still reading: let the user stop it here (busy overlay is gone by now)
+            self._excel_stop_btn = QPushButton("Stop reading")
+            self._excel_stop_btn.clicked.connect(self._cancel_import)
+            self._excel_stop_btn.setVisible(bool(getattr(self, "_excel_streaming", False)))
+            cap_row.addWidget(self._excel_stop_btn)
+            wrap_layout.addLayout(cap_row)
 
             # >>> CHANGE: Always use LEGACY columns for the Excel grid (even if Fresh is ON)
             excel_cols = ("CHK","Q","SECTION","BARCODE","BRAND","ITEM","REG","PROMO","START","END","COOP")
@@ -7006,7 +10336,7 @@ class App(QMainWindow):
 
         # Last resort: stable hash of the entire record
         import hashlib, json
-        return hashlib.sha256(json.dumps(rec, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        return hashlib.sha256(json.dumps(dict(rec), sort_keys=True).encode("utf-8")).hexdigest()[:16]
 
 
 
@@ -7163,7 +10493,7 @@ class App(QMainWindow):
     
 
 
-    def _excel_visible_indices(self) -> List[int]:
+    def _excel_visible_indices(self, indices: Optional[Iterable[int]] = None) -> List[int]:
         q = self._excel_search_edit.text() if hasattr(self, "_excel_search_edit") else ""
         coop_only = getattr(self, "_excel_coop_only", False)
         table_filters = getattr(self.tree, "_filters", {}) if hasattr(self, "tree") else {}
@@ -7181,7 +10511,8 @@ class App(QMainWindow):
             return True
 
         vis: List[int] = []
-        for i, rec in enumerate(self.preview_rows):
+        for i in (range(len(self.preview_rows)) if indices is None else indices):
+            rec = self.preview_rows[i]
             if not self._excel_match(rec, q):           # Search All
                 continue
             if coop_only and not self._has_positive_coop(rec):
@@ -7253,6 +10584,27 @@ class App(QMainWindow):
         self._excel_update_header_checkbox()
     
 
+    def _excel_sync_changed_btn(self):
+        btn = getattr(self, "_excel_changed_btn", None)
+        if not _is_alive(btn):
+            return
+        delta = getattr(self, "preview_delta", None) or []
+        has_delta = len(delta) == len(self.preview_rows) and bool(delta)
+        btn.setEnabled(has_delta)
+        btn.setToolTip(
+            ("Check only rows that are new or whose price/dates changed since the previous import\n"
+             + delta_summary(delta)) if has_delta else "No previous-import comparison for this data")
+
+    def _excel_check_changed_only(self):
+        """Pre-check exactly the new / price-changed / date-changed rows of this import."""
+        delta = getattr(self, "preview_delta", None) or []
+        if len(delta) != len(self.preview_rows):
+            return
+        self._excel_checked_keys = {
+            self._excel_row_keys[i] for i, st in enumerate(delta) if st != DELTA_SAME
+        }
+        self._excel_refresh_table()
+
     def _excel_toggle_all_visible(self):
         vis = self._excel_visible_indices()
         if not vis:
@@ -7278,8 +10630,13 @@ class App(QMainWindow):
         self.tree.setRowCount(0)
         self._excel_iid_to_index = {}
 
+        # Start batched fill
+        self._excel_begin_table_build(self._excel_vals_for(self._excel_visible_indices()))
+        self._tune_excel_column_widths()
+
+    def _excel_vals_for(self, visible: List[int]) -> list:
+        """(index, cell values) for the given visible rows, minus visually empty ones."""
         cols = tuple(getattr(self.tree, "_columns", ()))
-        visible = self._excel_visible_indices()
 
         # Precompute values for each visible row
         vals_rows = []
@@ -7310,11 +10667,24 @@ class App(QMainWindow):
             data_cells = [cleaned[i] for i, name in enumerate(cols) if name not in ("CHK", "Q")]
             return (not data_cells) or all(x == "" for x in data_cells)
 
-        vals_rows = [(i, v) for (i, v) in vals_rows if not _is_visibly_empty(v)]
+        return [(i, v) for (i, v) in vals_rows if not _is_visibly_empty(v)]
 
-        # Start batched fill
-        self._excel_begin_table_build(vals_rows)
-        self._tune_excel_column_widths()
+    def _excel_stream_append(self, chunk: list) -> None:
+        """Add streamed rows to preview_rows and, when the Excel grid is up, to its batched fill."""
+        base = len(self.preview_rows)
+        self.preview_rows.extend(chunk)
+        self.preview_qty.extend([1] * len(chunk))
+        if (getattr(self, "_current_gen_source", None) != "excel" or not _is_alive(getattr(self, "tree", None))
+                or len(getattr(self, "_excel_row_keys", ())) != base):
+            return
+        self._excel_row_keys.extend(self._excel_row_key(r) for r in chunk)
+        new_vals = self._excel_vals_for(self._excel_visible_indices(range(base, len(self.preview_rows))))
+        if not new_vals:
+            return
+        self._excel_vals_rows.extend(new_vals)
+        timer = getattr(self, "_excel_batch_timer", None)
+        if timer is not None and not timer.isActive():
+            timer.start()
 
 
     def _map_excel_row_to_legacy(self, row_dict, fresh_on=True):
@@ -7468,6 +10838,8 @@ class App(QMainWindow):
         if pos >= total:
             if hasattr(self, "_excel_batch_timer"):
                 self._excel_batch_timer.stop()
+            if getattr(self, "_excel_streaming", False):
+                return  # more rows coming; decorate once the stream ends
             # Update header checkbox state and then decorate Q cells with +/-.
             self._excel_update_header_checkbox()
             try:
@@ -7719,8 +11091,7 @@ class App(QMainWindow):
                         base["BRAND"] = base["ARABIC_DESCRIPTION"]
     
 
-                for _ in range(q):
-                    out.append(dict(base))
+                out.extend([base] * q)  # renderer only reads rows: share one dict per item
             return out
 
         out: List[Dict[str,str]] = []
@@ -7741,8 +11112,7 @@ class App(QMainWindow):
                 "COOP": price_text(self.stage.item(row, 8).text()),
                 "SECTION": ""
             }
-            for _ in range(q):
-                out.append(dict(r))
+            out.extend([r] * q)
         if not out and self.staged_rows:
             for i, rec in enumerate(self.staged_rows):
                 q = self.staged_qty[i] if i < len(self.staged_qty) else 1
@@ -7759,8 +11129,7 @@ class App(QMainWindow):
                     "COOP": price_text(rec.get("COOP", "")),
                     "SECTION": rec.get("SECTION", ""),
                 }
-                for _ in range(q):
-                    out.append(dict(r))
+                out.extend([r] * q)
         return out
 
     def _on_generate(self, source):
@@ -7777,12 +11146,30 @@ class App(QMainWindow):
         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
         out = os.path.join(tmp, f"labels_{self.selected_template_name or 'template'}_{ts}.pdf")
         if has_positions:
-            try:
-                render_page_JSON(out, tpl, rows)
-            except Exception as e:
+            if getattr(self, "_render_worker", None) is not None:
+                return   # one render at a time
+            self._render_worker = worker = RenderWorker(out, tpl, rows)
+
+            def _ok(path: str):
+                self._hide_busy()
+                self._render_worker = None
+                open_file(path)
+
+            def _fail(e: Exception):
+                self._hide_busy()
+                self._render_worker = None
                 QMessageBox.critical(self, "Render Error", f"Could not render template:\n{e}")
-                return
-            open_file(out)
+
+            def _cancelled():
+                self._hide_busy()
+                self._render_worker = None
+
+            worker.fraction.connect(self._busy_progress)
+            worker.finished_ok.connect(_ok)
+            worker.failed.connect(_fail)
+            worker.cancelled.connect(_cancelled)
+            self._show_busy(f"Rendering {len(rows)} label(s)…", on_cancel=worker.cancel)
+            worker.start()
             return
         QMessageBox.warning(
             self,
@@ -7973,47 +11360,18 @@ class App(QMainWindow):
 
     def _refresh_db_cache(self):
         """
-        Build a fast in-memory search index from the CSV once.
-        Auto-refreshes when the CSV file mtime changes.
+        Build a fast in-memory search index from the DB once.
+        Loads labels_db.snapshot when it matches the current DB; otherwise rebuilds
+        from the rows and refreshes the snapshot in the background.
+        Auto-refreshes when the DB file changes (see _db_stamp).
         """
-        try:
-            mtime = os.path.getmtime(_db_path())
-        except Exception:
-            mtime = None
-
-        rows = load_db_rows()  # full CSV → list[dict]
-        cache = []
+        mtime = _db_stamp()
+        searchable = self._searchable_fields()
 
-        searchable = set(self._searchable_fields())
-
-        # Prefer latest rows first (keep behavior of reversed(load_db_rows()))
-        for r in reversed(rows):
-            bc = (r.get("BARCODE", "") or "").strip().lower()
-            br = (r.get("BRAND", "") or "").strip().lower()
-            it = (r.get("ITEM", "") or "").strip().lower()
-
-            fields_lower = {}
-            for h in searchable:
-                v = r.get(h, "")
-                if v is None:
-                    continue
-                s = str(v).strip().lower()
-                if s:
-                    fields_lower[h] = s
-
-            # token sets for BRAND/ITEM matching bucket
-            tokens_brand = set(re.findall(r"[A-Za-z0-9]+", br))
-            tokens_item  = set(re.findall(r"[A-Za-z0-9]+", it))
-
-            cache.append({
-                "row": r,
-                "bc": bc,
-                "br": br,
-                "it": it,
-                "fields": fields_lower,
-                "tok_brand": tokens_brand,
-                "tok_item": tokens_item,
-            })
+        cache = load_db_snapshot(mtime, searchable) if DB_SNAPSHOT else None
+        if cache is None:
+            cache = _build_search_index(load_db_rows(), searchable)
+            _schedule_db_snapshot()
 
         self._db_cache = cache
         self._db_cache_mtime = mtime
@@ -8032,10 +11390,7 @@ class App(QMainWindow):
         is_digit = q.isdigit()
 
         # Refresh cache if file changed or not built
-        try:
-            cur_mtime = os.path.getmtime(_db_path())
-        except Exception:
-            cur_mtime = None
+        cur_mtime = _db_stamp()
         if not hasattr(self, "_db_cache") or getattr(self, "_db_cache_mtime", None) != cur_mtime:
             self._refresh_db_cache()
 
@@ -8279,13 +11634,7 @@ class App(QMainWindow):
         Read Header Manager and return fields marked as searchable.
         Falls back to CORE + defaults if config missing.
         """
-        try:
-            cfg = load_headers_cfg()
-            return [k for k, v in (cfg or {}).items() if isinstance(v, dict) and v.get("searchable", True)]
-        except Exception:
-            # Safe default
-            return ["BARCODE", "BRAND", "ITEM", "SECTION", "REG", "PROMO", "START_DATE", "END_DATE", "COOP",
-                    "PLU", "ARABIC_DESCRIPTION", "ENGLISH_DESCRIPTION", "REGULAR_PRICE", "PROMO_PRICE"]
+        return _searchable_db_fields()
 
     def _manual_add(self, vals: Dict[str, str], clear_form: bool = False, clear_search: bool = False):
         # read current toggle (default True if missing)
@@ -8421,6 +11770,9 @@ class App(QMainWindow):
     def _multi_paste_clipboard(self):
         app = QApplication.instance()
         clip = app.clipboard().text()
+        if looks_like_sheet_paste(clip):
+            self._import_clipboard_table(clip)
+            return
         self._multi_mode_active = False
         self._multi_found_queue = []
         self._multi_found_qty = []
@@ -8756,6 +12108,11 @@ class App(QMainWindow):
     def _panel_paste_from_clipboard(self):
         app = QApplication.instance()
         clip = app.clipboard().text()
+        if looks_like_sheet_paste(clip):
+            if self._paste_panel:
+                self._paste_panel.accept()
+            self._import_clipboard_table(clip)
+            return
         pairs = self._parse_multi_lines(clip)
         self._paste_items = [tok for tok, _ in pairs]
         self._panel_refresh_preview()
@@ -8800,7 +12157,7 @@ def _apply_ascii_upper_core_fields(rec: dict) -> dict:
     Mutates and returns rec: uppercases only ASCII a–z in ITEM/BRAND/UOM.
     Requires _upper_english from Chunk 1.
     """
-    if not isinstance(rec, dict):
+    if not isinstance(rec, MutableMapping):
         return rec
     try:
         rec["ITEM"]  = _upper_english(rec.get("ITEM", ""))
@@ -8817,11 +12174,11 @@ def _wrap_norm_func(func):
     def _wrapped(*args, **kwargs):
         out = func(*args, **kwargs)
         # Common patterns: either returns a dict (single row) or a list of dicts (batch)
-        if isinstance(out, dict):
+        if isinstance(out, MutableMapping):
             return _apply_ascii_upper_core_fields(out)
         if isinstance(out, (list, tuple)):
             for i, r in enumerate(out):
-                if isinstance(r, dict):
+                if isinstance(r, MutableMapping):
                     out[i] = _apply_ascii_upper_core_fields(r)
             return out
         return out
@@ -8882,6 +12239,9 @@ class Splash(QtWidgets.QSplashScreen):
 
 
 if __name__ == "__main__":
+    import multiprocessing
+    multiprocessing.freeze_support()  # bulk import process pool in the frozen (PyInstaller) build
+
     from PySide6.QtCore import qVersion, Qt
     from PySide6.QtGui import QGuiApplication, QIcon
     from PySide6.QtWidgets import QApplication
@@ -8916,4 +12276,12 @@ if __name__ == "__main__":
 
     threading.Thread(target=_warmup, daemon=True).start()
 
+    # Keep the Recent Downloads menu and the date search index fresh in the background
+    try:
+        start_folder_watcher()
+        app.aboutToQuit.connect(stop_folder_watcher)
+    except Exception:
+        pass
+    app.aboutToQuit.connect(flush_mapping_memo)
+
     sys.exit(app.exec())
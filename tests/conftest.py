@@ -0,0 +1,21 @@
+import importlib.util
+import os
+from pathlib import Path
+
+import pytest
+
+APP_PATH = Path(__file__).resolve().parent.parent / "allappfinal27.py"
+
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    """The application module, loaded with HOME (and so its data folder) in a temp dir."""
+    home = tmp_path_factory.mktemp("home")
+    os.environ["HOME"] = os.environ["USERPROFILE"] = str(home)
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    spec = importlib.util.spec_from_file_location("allappfinal27", APP_PATH)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    mod.PARSE_CACHE = False
+    mod.MAPPING_MEMO = False
+    return mod
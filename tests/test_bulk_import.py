@@ -0,0 +1,92 @@
+import json
+import os
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def workbooks(tmp_path):
+    """Two small workbooks with different header layouts."""
+    paths = []
+    for i, item in enumerate(["Item", "Description"]):
+        path = tmp_path / f"offer{i}.xlsx"
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(["Barcode", item, "Promo Price", "Start Date", "End Date"])
+        for j in range(20):
+            ws.append([6281000000000 + j, f"Item {j}", 1.5 + j, "01/10/2026", "10/10/2026"])
+        wb.save(path)
+        paths.append(str(path))
+    return paths
+
+
+@pytest.fixture
+def child(app, monkeypatch, tmp_path):
+    """Memo + parse cache on, in a fresh data folder; the deferral flags a child sets are undone after."""
+    monkeypatch.setattr(app, "MAPPING_MEMO", True)
+    monkeypatch.setattr(app, "PARSE_CACHE", True)
+    monkeypatch.setattr(app, "FRESH_SECTION_ACTIVE", False)
+    monkeypatch.setattr(app, "_db_dir", lambda: tmp_path)
+    monkeypatch.setattr(app, "_mapping_memo_path", lambda: str(tmp_path / "mapping_memo.json"))
+    monkeypatch.setitem(app._MAPPING_MEMO, "data", None)
+    monkeypatch.setitem(app._MAPPING_MEMO, "defer", False)
+    monkeypatch.setitem(app._PARSE_CACHE_DEFER, "on", False)
+    return app
+
+
+def test_bulk_children_hand_writes_to_parent(child, workbooks, tmp_path):
+    app = child
+    results = [app._bulk_read_one(p, False) for p in workbooks]
+    assert all(not r["error"] and len(r["rows"]) == 20 for r in results)
+    # nothing persisted by the children themselves
+    assert not (tmp_path / "mapping_memo.json").exists()
+    assert not [n for n in os.listdir(app._parse_cache_dir()) if n.endswith(".bin")]
+    assert all(len(r["memo"]) == 1 and r["cache"] for r in results)
+
+    # what BulkImportWorker does with them
+    app._MAPPING_MEMO["defer"] = False
+    memo = {}
+    for r in results:
+        memo.update(r["memo"])
+        app.store_parsed_workbook(r["cache"][0], r["rows"], r["cache"][1])
+    app.merge_mapping_memo(memo)
+
+    saved = json.loads((tmp_path / "mapping_memo.json").read_text(encoding="utf-8"))
+    assert set(saved) == set(memo) and len(saved) == 2
+    for p, r in zip(workbooks, results):
+        key = app._parse_cache_key(p, r["sheet"] or None)
+        rows, _mapping = app.load_parsed_workbook(key)
+        assert [dict(x) for x in rows] == r["rows"]
+
+
+def test_memo_hit_is_saved_at_flush_not_per_hit(child, monkeypatch, tmp_path):
+    app = child
+    monkeypatch.setitem(app._MAPPING_MEMO, "stale", False)
+    headers = ["Barcode", "Item", "Promo Price"]
+    rows = [[6281000000000 + j, f"Item {j}", 1.5 + j] for j in range(10)]
+    app.remember_mapping(headers, {"BARCODE": "Barcode", "ITEM": "Item", "PRICE": "Promo Price"}, rows)
+    saves = []
+    real_save = app._save_mapping_memo
+    monkeypatch.setattr(app, "_save_mapping_memo", lambda: (saves.append(1), real_save()))
+
+    for _ in range(3):
+        assert app.recall_mapping(headers, rows)["ITEM"] == "Item"
+    assert not saves
+    app.flush_mapping_memo()
+    app.flush_mapping_memo()
+    assert len(saves) == 1
+    saved = json.loads((tmp_path / "mapping_memo.json").read_text(encoding="utf-8"))
+    assert next(iter(saved.values()))["used"] == next(iter(app._mapping_memo().values()))["used"]
+
+
+def test_memo_recalls_the_duplicate_header_the_reader_uses(child):
+    app = child
+    headers = ["Barcode", "Price", "Item", "Price"]
+    rows = [[6281000000000 + j, "", f"Item {j}", 2.5 + j] for j in range(10)]
+    mapping = {"BARCODE": "Barcode", "ITEM": "Item", "PRICE": "Price"}
+    app.remember_mapping(headers, mapping, rows)
+    ent = next(iter(app._mapping_memo().values()))
+    assert ent["cols"]["PRICE"] == 3
+    assert app.recall_mapping(headers, rows) == mapping
@@ -0,0 +1,57 @@
+import pytest
+
+pytest.importorskip("python_calamine")
+openpyxl = pytest.importorskip("openpyxl")
+
+
+@pytest.fixture
+def long_sheet(tmp_path):
+    """600 rows (past one 512-row calamine block) with the mapped columns at 0,1,2,6,7."""
+    path = tmp_path / "long.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws.append(["Barcode", "Item", "Promo Price", "junk a", "junk b", "junk c", "Start Date", "End Date"])
+    for i in range(600):
+        ws.append([6281000000000 + i, f"Item {i}", 1.5 + i, f"x{i}", i * 7, "noise",
+                   f"{1 + i % 28:02d}/10/2026", f"{1 + i % 28:02d}/11/2026"])
+    wb.save(path)
+    return str(path)
+
+
+def _read(app, path, backend, monkeypatch):
+    monkeypatch.setattr(app, "EXCEL_READER_FORCE", backend)
+    stats = {}
+    rows, mapping = app._read_excel_fast(path, "Data", stats)
+    return [dict(r) for r in rows], mapping, stats
+
+
+def test_calamine_pruned_rows_match_pandas(app, long_sheet, monkeypatch):
+    if not any(b["name"] == "calamine" and b["available"]() for b in app._EXCEL_READERS):
+        pytest.skip("calamine backend unavailable")
+    got, got_map, stats = _read(app, long_sheet, "calamine", monkeypatch)
+    want, want_map, _ = _read(app, long_sheet, "pandas", monkeypatch)
+    assert stats.get("backend") == "calamine"
+    assert stats.get("read_cols", 0) < stats.get("cols", 0)   # pruning was on
+    assert got_map == want_map
+    assert len(got) == len(want) == 600
+    assert got == want
+    # the rows that straddled the head / first block boundary
+    assert got[500]["START_DATE"] == want[500]["START_DATE"] != ""
+    assert got[500]["PROMO"] == want[500]["PROMO"]
+
+
+def test_calamine_rows_keep_pandas_positions_for_offset_sheets(app, tmp_path):
+    """A table starting at C3: rows and columns line up with pd.read_excel(engine="calamine")."""
+    if not app._calamine_available():
+        pytest.skip("calamine backend unavailable")
+    path = tmp_path / "offset.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws["C3"], ws["D3"] = "Barcode", "Price"
+    ws["C4"], ws["D4"] = 6281000000001, 2.5
+    ws["C6"] = 7.0
+    wb.save(path)
+    want = app._read_frame_calamine(str(path), None).fillna("").values.tolist()
+    assert list(app._iter_calamine_raw_rows(str(path), None)) == want
+    assert list(app._iter_calamine_raw_rows(str(path), None, [2, 3])) == [r[2:4] for r in want]
@@ -0,0 +1,52 @@
+import os
+from datetime import date
+
+
+def test_top_k_stop_probes_same_mtime_files_in_rank_order(app, monkeypatch, tmp_path):
+    """With every file matching and the same mtime, top_k=1 must keep the one the ranking puts first."""
+    for name in ("c.xlsx", "B.xlsx", "a.xlsx", "d.xlsx"):
+        (tmp_path / name).write_bytes(b"")
+        os.utime(tmp_path / name, (1_700_000_000, 1_700_000_000))
+    monkeypatch.setattr(app, "_iter_roots_for_scan", lambda: [tmp_path])
+    monkeypatch.setattr(app, "catalog_entry", lambda path, cfg, key: {"path": path})
+    monkeypatch.setattr(app, "_entry_date_matches", lambda entry, target: [
+        {"name": os.path.basename(entry["path"]), "path": entry["path"], "sheet": ""}])
+
+    worker = app.DateScanWorker(date(2026, 10, 5), {}, top_k=1)
+    done = []
+    worker.finished_ok.connect(done.append)
+    worker.failed.connect(lambda e: done.append(e))
+    worker.work()
+    assert [m["name"] for m in done[0]] == ["a.xlsx"]
+    everything = app.rank_date_matches([{"path": str(p), "sheet": ""} for p in tmp_path.iterdir()])
+    assert os.path.basename(everything[0]["path"]) == "a.xlsx"
+
+
+def test_probes_use_their_own_small_pool(app, monkeypatch, tmp_path):
+    import threading
+    import time
+
+    for i in range(24):
+        (tmp_path / f"f{i:02d}.xlsx").write_bytes(b"")
+    monkeypatch.setattr(app, "_iter_roots_for_scan", lambda: [tmp_path])
+    monkeypatch.setattr(app, "DATE_SCAN_PROBE_WORKERS", 3)
+    monkeypatch.setattr(app, "DATE_SCAN_MAX_WORKERS", 16)
+    lock = threading.Lock()
+    now = [0, 0]   # running, most at once
+
+    def probe(path, cfg, key):
+        with lock:
+            now[0] += 1
+            now[1] = max(now)
+        time.sleep(0.01)
+        with lock:
+            now[0] -= 1
+        return None
+
+    monkeypatch.setattr(app, "catalog_entry", probe)
+    done = []
+    worker = app.DateScanWorker(date(2026, 10, 5), {}, top_k=0)
+    worker.finished_ok.connect(done.append)
+    worker.work()
+    assert done == [[]]
+    assert 1 < now[1] <= 3
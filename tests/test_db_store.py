@@ -0,0 +1,46 @@
+import pytest
+
+
+@pytest.fixture
+def data_dir(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "_db_dir", lambda: tmp_path)
+    monkeypatch.setattr(app, "_SQLITE_READY", False)   # schema goes into this folder's DB
+    return tmp_path
+
+
+ROW = {"BARCODE": "6281000000001", "BRAND": "ALMARAI", "ITEM": "MILK", "PROMO": "1.50", "START_DATE": "01.10.2026",
+       "END_DATE": "10.10.2026", "SOURCE_FILE": "offer.xlsx", "SOURCE_SHEET": "Data"}
+
+
+def test_sqlite_store_leaves_no_shards_folder(app, data_dir, monkeypatch):
+    monkeypatch.setattr(app, "DB_BACKEND", "sqlite")
+    app.upsert_db_rows([dict(ROW)])
+    assert [r["BARCODE"] for r in app.load_db_rows()] == [ROW["BARCODE"]]
+    assert not (data_dir / "labels_db_shards").exists()
+
+
+def test_csv_store_creates_shards_folder_on_write(app, data_dir, monkeypatch):
+    monkeypatch.setattr(app, "DB_BACKEND", "csv")
+    assert not (data_dir / "labels_db_shards").exists()
+    app.upsert_db_rows([dict(ROW)])
+    assert (data_dir / "labels_db_shards" / "manifest.json").exists()
+    assert [r["BARCODE"] for r in app.load_db_rows()] == [ROW["BARCODE"]]
+
+
+@pytest.mark.parametrize("backend", ["sqlite", "csv"])
+def test_delta_and_upsert_reuse_normalized_rows(app, data_dir, monkeypatch, backend):
+    monkeypatch.setattr(app, "DB_BACKEND", backend)
+    app.upsert_db_rows([dict(ROW)])
+    incoming = [dict(ROW, PROMO="1.25"), dict(ROW, BARCODE="6281000000002"), dict(ROW, BRAND="")]
+    want = app.classify_import_delta(incoming)
+
+    calls = []
+    norm = app._normalize_row_for_db
+    monkeypatch.setattr(app, "_normalize_row_for_db", lambda r, cols: calls.append(1) or norm(r, cols))
+    staged = app.normalize_db_rows(incoming)
+    assert app.classify_import_delta(staged, normalized=True) == want == [
+        app.DELTA_PRICE, app.DELTA_NEW, app.DELTA_NEW]
+    app.upsert_db_rows(staged, normalized=True)
+    assert len(calls) == len(incoming)
+    assert sorted((r["BARCODE"], r["PROMO"]) for r in app.load_db_rows()) == [
+        ("6281000000001", "1.25"), ("6281000000002", "1.50")]
@@ -0,0 +1,17 @@
+import os
+
+
+def test_walk_cache_expires_when_folder_mtime_does_not_move(app, monkeypatch, tmp_path):
+    """FAT/exFAT/SMB may leave a folder's mtime alone when a file lands: the TTL still re-lists."""
+    monkeypatch.setattr(app, "_WALK_CACHE", {})
+    old = 1_700_000_000
+    (tmp_path / "a.xlsx").write_bytes(b"")
+    os.utime(tmp_path, (old, old))
+    assert app._discovery_listing(str(tmp_path))[1] == [str(tmp_path / "a.xlsx")]
+
+    (tmp_path / "b.xlsx").write_bytes(b"")
+    os.utime(tmp_path, (old, old))   # the volume "forgot" to bump it
+    assert len(app._discovery_listing(str(tmp_path))[1]) == 1   # within the TTL: cached
+
+    monkeypatch.setattr(app, "DISCOVERY_CACHE_TTL", 0.0)
+    assert sorted(app._discovery_listing(str(tmp_path))[1]) == [str(tmp_path / n) for n in ("a.xlsx", "b.xlsx")]
@@ -0,0 +1,26 @@
+from types import SimpleNamespace
+
+
+def test_watcher_is_opt_in(app, monkeypatch):
+    monkeypatch.setattr(app, "_FOLDER_WATCHER", None)
+    monkeypatch.setattr(app, "load_settings", lambda: dict(app.DEFAULT_SETTINGS))
+    assert app.FOLDER_WATCHER is False
+    assert app.start_folder_watcher() is None
+
+
+def test_cloud_only_files_are_listed_but_not_probed(app, monkeypatch, tmp_path):
+    assert app._is_cloud_only(SimpleNamespace(st_file_attributes=0x400000))   # RECALL_ON_DATA_ACCESS
+    assert app._is_cloud_only(SimpleNamespace(st_file_attributes=0x1000))     # OFFLINE
+    assert not app._is_cloud_only(SimpleNamespace(st_file_attributes=0x20))   # ARCHIVE
+    assert not app._is_cloud_only(SimpleNamespace())                          # not Windows
+
+    local, remote = tmp_path / "local.xlsx", tmp_path / "remote.xlsx"
+    local.write_bytes(b"x")
+    remote.write_bytes(b"")
+    monkeypatch.setattr(app, "_is_cloud_only", lambda st: st.st_size == 0)
+    probed = []
+    monkeypatch.setattr(app, "catalog_entry", lambda path, cfg, key: probed.append(path))
+    watcher = app.FolderWatcher([tmp_path])
+    watcher._index([str(local), str(remote)])
+    assert probed == [str(local)]
+    assert {p.name for p in watcher.recent()} == {"local.xlsx", "remote.xlsx"}
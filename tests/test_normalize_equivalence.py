@@ -0,0 +1,226 @@
+"""
+The column-wise import normalization (_normalize_column / _excel_frame_records / _upper_english_fields)
+must give exactly the strings of the original per-row loop. The reference below is that loop and its
+scalar helpers as they were before the column engine.
+"""
+import random
+import re
+from datetime import date, datetime
+
+import pandas as pd
+import pytest
+
+
+# ---------- reference: the original per-row path ----------
+def ref_clean_barcode(v) -> str:
+    if v is None:
+        return ""
+    s = str(v).strip()
+    if re.fullmatch(r"\d+\.0", s):
+        return s[:-2]
+    try:
+        from decimal import Decimal, getcontext
+        getcontext().prec = 64
+        if isinstance(v, (int, float)):
+            return str(Decimal(str(v)).to_integral_value())
+        if re.fullmatch(r"[+-]?\d+(?:\.\d+)?[eE][+-]?\d+", s):
+            return str(Decimal(s).to_integral_value())
+    except Exception:
+        pass
+    return s
+
+
+def ref_price_text(v) -> str:
+    if v is None: return ""
+    if isinstance(v, (int, float)):
+        try:
+            return f"{float(v):.2f}"
+        except Exception:
+            return str(v)
+    s = str(v).strip()
+    if not s: return ""
+    s = s.replace(",", "")
+    s = re.sub(r"(?i)^\s*aed\s*", "", s)
+    if s.startswith("."): s = "0" + s
+    if s.endswith("."): s = s + "0"
+    if re.fullmatch(r"0+(\.0+)?", s): return "0.00"
+    if re.fullmatch(r"\d+(?:\.\d+)?", s):
+        try:
+            return f"{float(s):.2f}"
+        except Exception:
+            return s
+    return s
+
+
+def ref_upper_english(text) -> str:
+    if text is None:
+        return ""
+    s = str(text)
+    return "".join((ch.upper() if "a" <= ch <= "z" else ch) for ch in s)
+
+
+def ref_date_only(v) -> str:
+    if v in ("", None): return ""
+    if isinstance(v, (datetime, date)):
+        d = v if isinstance(v, date) else v.date()
+        return d.strftime("%d.%m.%Y")
+    s = str(v).strip()
+    for pat in ("%d/%m/%Y", "%Y-%m-%d", "%m/%d/%Y", "%d-%m-%Y", "%d.%m.%Y"):
+        try: return datetime.strptime(s, pat).strftime("%d.%m.%Y")
+        except: pass
+    return s
+
+
+def ref_norm_uom(val) -> str:
+    s = ("" if val is None else str(val)).strip()
+    if not s:
+        return ""
+    s_low = s.lower()
+    if s_low in {"nan", "none", "null", "n/a", "na", "-", "--"}:
+        return ""
+    table = {
+        "kg": "KG", "kgs": "KG", "kgm": "KG",
+        "packet": "PACKET", "pac": "PACKET", "pckt": "PACKET", "pack": "PACKET",
+        "ctn": "CTN", "carton": "CTN", "cartons": "CTN",
+    }
+    s_low = s_low.replace(".", "").replace(",", " ").strip()
+    if s_low in table:
+        return table[s_low]
+    for t in ("kgm", "kg", "packet", "pac", "pckt", "ctn"):
+        if t in s_low:
+            return table.get(t, t.upper())
+    return s.upper()
+
+
+def ref_rows(data_df, headers_raw, mapping, fresh):
+    """
+    The original iterrows loop of _read_excel_fast plus its _upper_english wrapper. Rows come from
+    to_numpy(dtype=object): pandas 3's iterrows() re-infers each row's dtype and turns None into NaN
+    in all-text rows, which the pandas 2 loop never saw.
+    """
+    pos = {h: i for i, h in enumerate(headers_raw)}
+    rows = []
+    for row in data_df.to_numpy(dtype=object):
+        rec = {}
+        any_val = False
+        for need, col in mapping.items():
+            i = pos.get(col, -1)
+            v = row[i] if (0 <= i < len(row)) else ""
+            if need == "BARCODE":
+                vv = ref_clean_barcode(v)
+            elif need in ("REG", "PROMO", "COOP", "REGULAR_PRICE", "PROMO_PRICE"):
+                vv = ref_price_text(v)
+            elif need in ("START_DATE", "END_DATE"):
+                vv = ref_date_only(v)
+            elif need == "UOM":
+                vv = ref_norm_uom(v)
+            else:
+                vv = "" if (v is None or (isinstance(v, float) and pd.isna(v))) else str(v).strip()
+            rec[need] = vv
+            any_val = any_val or bool(vv)
+        if not rec.get("UOM"):
+            guess_src = " ".join([rec.get("ENGLISH_DESCRIPTION", ""), rec.get("ARABIC_DESCRIPTION", "")]).strip()
+            rec["UOM"] = ref_norm_uom(guess_src)
+        if fresh:
+            u = (rec.get("UOM", "") or "").strip()
+            if u:
+                u = f"/ {u.lstrip('/ ').strip()}"
+                rec["UOM"] = u
+                rec["COOP"] = u
+            if rec.get("PLU"):
+                rec["BARCODE"] = rec.get("PLU", "")
+            if rec.get("ARABIC_DESCRIPTION"):
+                rec["BRAND"] = rec.get("ARABIC_DESCRIPTION", "")
+            if rec.get("UOM"):
+                rec["COOP"] = rec.get("UOM", "")
+        if any_val:
+            rows.append(rec)
+    for rec in rows:
+        rec["ITEM"] = ref_upper_english(rec.get("ITEM", ""))
+        rec["BRAND"] = ref_upper_english(rec.get("BRAND", ""))
+        rec["UOM"] = ref_upper_english(rec.get("UOM", ""))
+    return rows
+
+
+# ---------- inputs ----------
+NAN = float("nan")
+BARCODES = [6281000000001, 6281000000001.0, 6.281e12, 1.23e+15, "6281000000002", "6281000000003.0",
+            "1.23E+12", " 0042 ", "abc-1", 0, -0.0, 7.5, None, NAN, "", True]
+PRICES = [12, 12.5, 0, 0.0, -0.0, "12.5", "AED 1,234.5", "aed.5", ".5", "7.", "000", "0.00", "N/A",
+          "", " ", None, NAN, 1e20, "1,2,3", True]
+DATES = [datetime(2026, 10, 5, 13, 30), pd.Timestamp("2026-10-06"), date(2026, 10, 7), 46000, 46000.0,
+         46000.5, "05/10/2026", "2026-10-05", "13/10/2026", "10/13/2026", "5-10-2026", "05.10.2026",
+         " 05/10/2026 ", "2026/10/05", "bad", "", None, NAN]
+TEXTS = ["Almarai Milk", "almarai milk 1l", "ALMARAI", "حليب المراعي", "حليب almarai كامل", "Café crème",
+         "  padded  ", "mixed ÄÖ abc", 123, 12.0, NAN, None, ""]
+UOMS = ["kg", "Kgs.", "KGM", "PACK", "pac", "pckt", "Packet", "ctn", "Carton", "cartons", "1 kgm",
+        "n/a", "NaN", "none", "-", "--", "Box", "each", "/ kg", "", None, NAN, 5]
+ARABIC = ["حليب 1 كجم", "لبن", "kg حليب", "", None, NAN, "علبة pack"]
+
+
+@pytest.fixture(params=[False, True], ids=["standard", "fresh"])
+def fresh(app, request, monkeypatch):
+    monkeypatch.setattr(app, "FRESH_SECTION_ACTIVE", request.param)
+    return request.param
+
+
+def _frame(n, seed):
+    rnd = random.Random(seed)
+    pick = lambda pool: [rnd.choice(pool) for _ in range(n)]
+    cols = {
+        "Barcode": pick(BARCODES), "Item": pick(TEXTS), "Brand": pick(TEXTS), "Reg Price": pick(PRICES),
+        "Promo Price": pick(PRICES), "Start Date": pick(DATES), "End Date": pick(DATES),
+        "UOM": pick(UOMS), "PLU": pick(BARCODES), "Arabic": pick(ARABIC), "English": pick(TEXTS),
+        "Section": pick(TEXTS), "Coop": pick(PRICES),
+    }
+    headers = list(cols)
+    return pd.DataFrame({i: cols[h] for i, h in enumerate(headers)}, dtype=object), headers
+
+
+MAPPINGS = {
+    "standard": {"BARCODE": "Barcode", "ITEM": "Item", "BRAND": "Brand", "REG": "Reg Price",
+                 "PROMO": "Promo Price", "START_DATE": "Start Date", "END_DATE": "End Date",
+                 "SECTION": "Section", "COOP": "Coop", "UOM": "UOM"},
+    "no_uom": {"BARCODE": "Barcode", "ITEM": "Item", "PROMO": "Promo Price", "START_DATE": "Start Date",
+               "ENGLISH_DESCRIPTION": "English", "ARABIC_DESCRIPTION": "Arabic", "BRAND": None},
+    "fresh": {"PLU": "PLU", "ARABIC_DESCRIPTION": "Arabic", "ENGLISH_DESCRIPTION": "English",
+              "REGULAR_PRICE": "Reg Price", "PROMO_PRICE": "Promo Price", "UOM": "UOM",
+              "START_DATE": "Start Date", "END_DATE": "Missing Header"},
+}
+
+
+# ---------- scalar helpers ----------
+@pytest.mark.parametrize("name, ref, values", [
+    ("clean_barcode", ref_clean_barcode, BARCODES),
+    ("price_text", ref_price_text, PRICES),
+    ("date_only", ref_date_only, DATES),
+    ("_upper_english", ref_upper_english, TEXTS + ARABIC + UOMS),
+    ("_norm_uom_text", ref_norm_uom, UOMS + ARABIC + TEXTS),
+])
+def test_scalar_helpers_match(app, name, ref, values):
+    fn = getattr(app, name)
+    for v in values * 2:   # twice: the date_only memo answers the second round
+        assert fn(v) == ref(v), v
+
+
+@pytest.mark.parametrize("need, ref, values", [
+    ("BARCODE", ref_clean_barcode, BARCODES),
+    ("PROMO", ref_price_text, PRICES),
+    ("START_DATE", ref_date_only, DATES),
+    ("UOM", ref_norm_uom, UOMS),
+    ("ITEM", lambda v: "" if (v is None or (isinstance(v, float) and pd.isna(v))) else str(v).strip(), TEXTS),
+])
+def test_normalize_column_matches_per_cell(app, need, ref, values):
+    column = [random.Random(7).choice(values) for _ in range(500)] + list(values)
+    assert app._normalize_column(column, app._excel_converter(need)) == [ref(v) for v in column]
+
+
+# ---------- whole records ----------
+@pytest.mark.parametrize("layout", sorted(MAPPINGS))
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_frame_records_match_row_loop(app, fresh, layout, seed):
+    df, headers = _frame(400, seed)
+    mapping = MAPPINGS[layout]
+    got = app._upper_english_fields(app._excel_frame_records(df, headers, mapping))
+    want = ref_rows(df, headers, mapping, fresh)
+    assert [dict(r) for r in got] == want
@@ -0,0 +1,70 @@
+import csv
+import time
+
+import pytest
+
+
+@pytest.fixture
+def data_dir(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(app, "_db_dir", lambda: tmp_path)
+    monkeypatch.setattr(app, "_SQLITE_READY", False)
+    monkeypatch.setattr(app, "DB_BACKEND", "sqlite")
+    return tmp_path
+
+
+def _write_csv(path, rows, sep=","):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        w = csv.writer(f, delimiter=sep)
+        w.writerow(["Barcode", "Brand", "Item", "Reg Price", "Promo Price", "Start Date", "End Date"])
+        w.writerows(rows)
+    return str(path)
+
+
+def test_chunked_import_rebuilds_snapshot_once(app, data_dir, monkeypatch):
+    path = _write_csv(data_dir / "offers.csv", [
+        [f"62810{i:08d}", "ALMARAI", f"ITEM {i}", "2.50", "1.75", "01/10/2026", "10/10/2026"] for i in range(1000)])
+    builds = []
+    monkeypatch.setattr(app, "DB_SNAPSHOT", True)
+    monkeypatch.setattr(app, "_write_db_snapshot_now", lambda: builds.append(len(app.load_db_rows())))
+    summary = app.import_table_to_db(path, "", "offers.csv", chunk_rows=100)
+    deadline = time.monotonic() + 10
+    while app._SNAPSHOT_STATE["busy"] and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert summary["saved"] == 1000
+    assert builds == [1000]
+
+
+@pytest.mark.parametrize("sep", [",", ";", "\t", "|"])
+def test_sniff_delimiter(app, tmp_path, sep):
+    path = _write_csv(tmp_path / "t.csv", [["6281000000001", "ALMARAI", "MILK", "2,50", "1,75", "01/10/2026", ""]], sep)
+    assert app.sniff_text_table(path) == ("utf-8", sep)
+    assert app.text_table_decimal_comma(path) == (sep == ";")
+
+
+@pytest.mark.parametrize("cell, want", [
+    ("12,5", "12.50"), ("1.234,50", "1234.50"), ("AED 3,75", "3.75"), (",5", "0.50"), (" 7,25 ", "7.25"),
+    ("-1,5", "-1.5"), ("1.100", "1100.00"), ("12", "12.00"), ("12.5", "12.50"), (12.5, "12.50"), ("", ""), (None, ""), ("n/a", "n/a"),
+])
+def test_price_text_decimal_comma(app, cell, want):
+    assert app.price_text_decimal_comma(cell) == want
+
+
+SEMI_ROWS = [["6281000000001", "ALMARAI", "MILK", "12,5", "9,99", "01/10/2026", "10/10/2026"],
+             ["6281000000002", "ALMARAI", "LABAN", "1.234,50", "1.100", "01/10/2026", "10/10/2026"],
+             ["6281000000003", "ALMARAI", "CHEESE", "7", "5", "01/10/2026", "10/10/2026"]]
+
+
+@pytest.mark.parametrize("prune", [True, False])
+def test_semicolon_csv_reads_decimal_comma_prices(app, tmp_path, monkeypatch, prune):
+    monkeypatch.setattr(app, "EXCEL_PRUNE_COLUMNS", prune)
+    rows, mapping = app._read_excel_fast(_write_csv(tmp_path / "semi.csv", SEMI_ROWS, ";"), None)
+    assert mapping["REG"] == "Reg Price" and mapping["PROMO"] == "Promo Price"
+    assert [(r["REG"], r["PROMO"]) for r in rows] == [("12.50", "9.99"), ("1234.50", "1100.00"), ("7.00", "5.00")]
+    streamed = [r for chunk, _ in app.iter_excel_fast(str(tmp_path / "semi.csv"), None, chunk_rows=1) for r in chunk]
+    assert [(r["REG"], r["PROMO"]) for r in streamed] == [(r["REG"], r["PROMO"]) for r in rows]
+
+
+def test_comma_csv_prices_unchanged(app, tmp_path):
+    rows, _ = app._read_excel_fast(_write_csv(tmp_path / "comma.csv", [
+        ["6281000000001", "ALMARAI", "MILK", "1,234.5", "12", "01/10/2026", "10/10/2026"]]), None)
+    assert (rows[0]["REG"], rows[0]["PROMO"]) == ("1234.50", "12.00")